@@ -0,0 +1,157 @@
+"""
+Benchmarks for the operations supported by the data interfaces,
+covering tabular, gridded and multi-geometry datatypes.
+"""
+import numpy as np
+import holoviews as hv
+
+from holoviews.core.data import Interface
+
+
+def tabular_data(datatype, size):
+    """
+    Generates a random tabular Dataset of the requested size with two
+    continuous and one categorical column.
+    """
+    rng = np.random.RandomState(0)
+    data = {'x': rng.rand(size), 'y': rng.randn(size),
+            'z': rng.randint(0, 10, size)}
+    if datatype == 'array':
+        data = np.column_stack([data['x'], data['y'], data['z']])
+    elif datatype in ('dataframe', 'dask', 'cuDF'):
+        import pandas as pd
+        data = pd.DataFrame(data)
+        if datatype == 'dask':
+            import dask.dataframe as dd
+            data = dd.from_pandas(data, npartitions=8)
+        elif datatype == 'cuDF':
+            import cudf
+            data = cudf.from_pandas(data)
+    return hv.Dataset(data, ['x', 'z'], 'y', datatype=[datatype])
+
+
+def gridded_data(datatype, size):
+    """
+    Generates a random gridded Dataset with size x size samples.
+    """
+    xs = np.linspace(0, 1, size)
+    ys = np.linspace(0, 1, size)
+    zs = np.random.RandomState(0).rand(size, size)
+    if datatype == 'image':
+        return hv.Image(zs, bounds=(0, 0, 1, 1), datatype=['image'])
+    elif datatype == 'xarray':
+        import xarray as xr
+        data = xr.Dataset({'z': (('y', 'x'), zs)}, coords={'x': xs, 'y': ys})
+    else:
+        data = (xs, ys, zs)
+    return hv.Image(data, datatype=[datatype])
+
+
+def multi_data(datatype, size):
+    """
+    Generates a Path of size geometries with 10 vertices each.
+    """
+    rng = np.random.RandomState(0)
+    paths = [{'x': rng.rand(10), 'y': rng.rand(10), 'z': i}
+             for i in range(size)]
+    if datatype == 'spatialpandas':
+        from spatialpandas import GeoDataFrame
+        from spatialpandas.geometry import LineArray
+        lines = LineArray([np.column_stack([p['x'], p['y']]).flatten()
+                           for p in paths])
+        data = GeoDataFrame({'geometry': lines, 'z': np.arange(size)})
+        return hv.Path(data, vdims=['z'], datatype=['spatialpandas'])
+    return hv.Path(paths, vdims=['z'], datatype=[datatype])
+
+
+class _InterfaceBenchmark(object):
+
+    datatypes = []
+
+    generator = None
+
+    def setup(self, datatype, size):
+        if datatype not in Interface.interfaces:
+            raise NotImplementedError('%s interface not available' % datatype)
+        try:
+            self.dataset = type(self).generator(datatype, size)
+        except ImportError:
+            raise NotImplementedError('%s dependencies not available' % datatype)
+        if self.dataset.interface.datatype != datatype:
+            raise NotImplementedError('%s interface not available' % datatype)
+
+
+class TabularInterface(_InterfaceBenchmark):
+
+    params = [['array', 'dictionary', 'dataframe', 'dask', 'cuDF'],
+              [10**3, 10**5, 10**7]]
+
+    param_names = ['datatype', 'size']
+
+    generator = staticmethod(tabular_data)
+
+    def time_select(self, datatype, size):
+        self.dataset.select(x=(0.25, 0.75))
+
+    def time_groupby(self, datatype, size):
+        self.dataset.groupby('z')
+
+    def time_aggregate(self, datatype, size):
+        self.dataset.aggregate('z', np.mean)
+
+    def time_range(self, datatype, size):
+        self.dataset.range('y')
+
+    def time_dimension_values(self, datatype, size):
+        self.dataset.dimension_values('y')
+
+
+class GriddedInterface(_InterfaceBenchmark):
+
+    params = [['grid', 'image', 'xarray'], [100, 1000, 4000]]
+
+    param_names = ['datatype', 'size']
+
+    generator = staticmethod(gridded_data)
+
+    def time_select(self, datatype, size):
+        self.dataset.select(x=(0.25, 0.75), y=(0.25, 0.75))
+
+    def time_groupby(self, datatype, size):
+        self.dataset.groupby('x', group_type=hv.Dataset)
+
+    def time_aggregate(self, datatype, size):
+        self.dataset.aggregate('x', np.mean)
+
+    def time_range(self, datatype, size):
+        self.dataset.range('z')
+
+    def time_dimension_values(self, datatype, size):
+        self.dataset.dimension_values('z', flat=False)
+
+
+class MultiGeometryInterface(_InterfaceBenchmark):
+    """
+    Aggregation is not implemented for multi-geometry datatypes.
+    """
+
+    params = [['multitabular', 'spatialpandas'], [100, 10**4, 10**5]]
+
+    param_names = ['datatype', 'size']
+
+    generator = staticmethod(multi_data)
+
+    def time_select(self, datatype, size):
+        self.dataset.select(z=(0, size//2))
+
+    def time_groupby(self, datatype, size):
+        self.dataset.groupby('z')
+
+    def time_split(self, datatype, size):
+        self.dataset.split()
+
+    def time_range(self, datatype, size):
+        self.dataset.range('x')
+
+    def time_dimension_values(self, datatype, size):
+        self.dataset.dimension_values('x')
@@ -0,0 +1,78 @@
+"""
+Benchmarks for the datashader aggregate, regrid and shade operations.
+"""
+import numpy as np
+import holoviews as hv
+
+try:
+    from holoviews.operation.datashader import aggregate, regrid, shade
+except ImportError:
+    aggregate = regrid = shade = None
+
+
+class _DatashaderBenchmark(object):
+
+    def setup(self, *args):
+        if aggregate is None:
+            raise NotImplementedError('datashader not available')
+
+
+class Aggregate(_DatashaderBenchmark):
+
+    params = [[10**4, 10**6, 10**8]]
+
+    param_names = ['size']
+
+    timeout = 300
+
+    def setup(self, size):
+        super(Aggregate, self).setup(size)
+        rng = np.random.RandomState(0)
+        self.points = hv.Points((rng.randn(size), rng.randn(size)))
+        self.curve = hv.Curve((np.arange(size), rng.randn(size).cumsum()))
+
+    def time_aggregate_points(self, size):
+        aggregate(self.points, dynamic=False)
+
+    def time_aggregate_curve(self, size):
+        aggregate(self.curve, dynamic=False)
+
+    def time_aggregate_points_x_range(self, size):
+        aggregate(self.points, x_range=(-1, 1), y_range=(-1, 1), dynamic=False)
+
+
+class Regrid(_DatashaderBenchmark):
+
+    params = [[100, 1000, 10000]]
+
+    param_names = ['side']
+
+    timeout = 300
+
+    def setup(self, side):
+        super(Regrid, self).setup(side)
+        self.image = hv.Image(np.random.RandomState(0).rand(side, side))
+
+    def time_regrid(self, side):
+        regrid(self.image, width=400, height=400, dynamic=False)
+
+    def time_regrid_upsample(self, side):
+        regrid(self.image, width=400, height=400, upsample=True, dynamic=False)
+
+
+class Shade(_DatashaderBenchmark):
+
+    params = [[10**4, 10**6, 10**8]]
+
+    param_names = ['size']
+
+    timeout = 300
+
+    def setup(self, size):
+        super(Shade, self).setup(size)
+        rng = np.random.RandomState(0)
+        points = hv.Points((rng.randn(size), rng.randn(size)))
+        self.agg = aggregate(points, width=400, height=400, dynamic=False)
+
+    def time_shade(self, size):
+        shade(self.agg, dynamic=False)
@@ -0,0 +1,77 @@
+"""
+Benchmarks for triggering stream events on DynamicMaps, with and
+without a plot attached to the DynamicMap.
+"""
+import numpy as np
+import holoviews as hv
+
+from holoviews.core.options import Store
+from holoviews.streams import Buffer, Pipe, RangeXY, Stream
+
+
+class DynamicMapStreams(object):
+
+    params = [[1, 10, 50]]
+
+    param_names = ['nstreams']
+
+    def setup(self, nstreams):
+        streams = [Stream.define('S%d' % i, **{'p%d' % i: 0})()
+                   for i in range(nstreams)]
+        self.streams = streams
+        self.dmap = hv.DynamicMap(lambda **kwargs: hv.Curve([]), streams=streams)
+        self.dmap[()]
+
+    def time_trigger(self, nstreams):
+        for i in range(10):
+            self.streams[0].event(**{'p0': i})
+
+    def time_trigger_all(self, nstreams):
+        Stream.trigger(self.streams)
+
+
+class DynamicMapPlotStreams(object):
+
+    params = [['bokeh', 'matplotlib'], [10**3, 10**5]]
+
+    param_names = ['backend', 'size']
+
+    def setup(self, backend, size):
+        try:
+            hv.extension(backend)
+        except Exception:
+            raise NotImplementedError('%s backend not available' % backend)
+        xs = np.linspace(0, 10, size)
+        self.pipe = Pipe(data=(xs, np.sin(xs)))
+        self.range_stream = RangeXY()
+        dmap = hv.DynamicMap(hv.Curve, streams=[self.pipe])
+        ranged = hv.DynamicMap(lambda x_range, y_range: hv.Curve((xs, np.cos(xs))),
+                               streams=[self.range_stream])
+        self.plot = Store.renderers[backend].get_plot(dmap * ranged)
+        self.xs = xs
+
+    def time_pipe_send(self, backend, size):
+        for i in range(10):
+            self.pipe.send((self.xs, np.sin(self.xs+i)))
+
+    def time_range_event(self, backend, size):
+        for i in range(10):
+            self.range_stream.event(x_range=(0, i+1), y_range=(-1, 1))
+
+
+class BufferStreaming(object):
+
+    params = [[False, True], [10**4, 10**6]]
+
+    param_names = ['ring', 'length']
+
+    def setup(self, ring, length):
+        self.buffer = Buffer({'x': np.zeros(0), 'y': np.zeros(0)},
+                             length=length, ring=ring)
+        self.dmap = hv.DynamicMap(hv.Curve, streams=[self.buffer])
+        self.dmap[()]
+        self.chunk = {'x': np.arange(100.), 'y': np.random.rand(100)}
+
+    def time_send(self, ring, length):
+        for i in range(20):
+            self.buffer.send(self.chunk)
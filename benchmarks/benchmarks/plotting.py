@@ -0,0 +1,73 @@
+"""
+Benchmarks for creating and updating plots of common elements using
+the bokeh, matplotlib and plotly renderers.
+"""
+import numpy as np
+import holoviews as hv
+
+from holoviews.core.options import Store
+
+
+def curve(size, i=0):
+    xs = np.linspace(0, 10, size)
+    return hv.Curve((xs, np.sin(xs+i)))
+
+def scatter(size, i=0):
+    rng = np.random.RandomState(i)
+    return hv.Scatter((rng.rand(size), rng.rand(size)))
+
+def image(size, i=0):
+    side = int(np.sqrt(size))
+    return hv.Image(np.random.RandomState(i).rand(side, side))
+
+def bars(size, i=0):
+    nbars = min(size, 1000)
+    return hv.Bars((np.arange(nbars), np.random.RandomState(i).rand(nbars)))
+
+def overlay(size, i=0):
+    return curve(size, i) * scatter(size, i)
+
+ELEMENTS = {'Curve': curve, 'Scatter': scatter, 'Image': image,
+            'Bars': bars, 'Overlay': overlay}
+
+
+class _RendererBenchmark(object):
+
+    backend = None
+
+    params = [sorted(ELEMENTS), [10**3, 10**5]]
+
+    param_names = ['element', 'size']
+
+    def setup(self, element, size):
+        try:
+            hv.extension(self.backend)
+        except Exception:
+            raise NotImplementedError('%s backend not available' % self.backend)
+        self.renderer = Store.renderers[self.backend]
+        fn = ELEMENTS[element]
+        self.element = fn(size)
+        self.holomap = hv.HoloMap({i: fn(size, i) for i in range(5)})
+        self.plot = self.renderer.get_plot(self.holomap)
+
+    def time_get_plot(self, element, size):
+        self.renderer.get_plot(self.element)
+
+    def time_update(self, element, size):
+        for i in range(5):
+            self.plot.update((i,))
+
+
+class BokehRenderer(_RendererBenchmark):
+
+    backend = 'bokeh'
+
+
+class MatplotlibRenderer(_RendererBenchmark):
+
+    backend = 'matplotlib'
+
+
+class PlotlyRenderer(_RendererBenchmark):
+
+    backend = 'plotly'
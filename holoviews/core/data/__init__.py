@@ -24,6 +24,7 @@ from .array import ArrayInterface
 from .dictionary import DictInterface
 from .grid import GridInterface
 from .multipath import MultiInterface         # noqa (API import)
+from .packed import PackedInterface, PackedGeometries # noqa (API import)
 from .image import ImageInterface             # noqa (API import)
 from .spatialpandas import SpatialPandasInterface # noqa (API import)
 
@@ -61,10 +62,18 @@ try:
 except ImportError:
     pass
 
+try:
+    from .arrow import ArrowInterface   # noqa (Conditional API import)
+    datatypes.append('arrow')
+except ImportError:
+    pass
+
 if 'array' not in datatypes:
     datatypes.append('array')
 if 'multitabular' not in datatypes:
     datatypes.append('multitabular')
+if 'packed' not in datatypes:
+    datatypes.append('packed')
 
 
 def concat(datasets, datatype=None):
@@ -223,7 +232,7 @@ class PipelineMeta(ParameterizedMetaclass):
                         )
 
                     elif isinstance(result, MultiDimensionalMapping):
-                        for key, element in result.items():
+                        def set_pipeline(key, element):
                             if isinstance(element, Dataset):
                                 getitem_op = method_op.instance(
                                     input_type=type(result),
@@ -236,6 +245,17 @@ class PipelineMeta(ParameterizedMetaclass):
                                     ],
                                     output_type=type(result),
                                 )
+                            return element
+
+                        if isinstance(result.data, util.LazyOrderedDict):
+                            # Attach the pipeline as each group is built
+                            factory = result.data.factory
+                            unwrap = result.ndims == 1
+                            result.data.factory = lambda key, arg: set_pipeline(
+                                key[0] if unwrap else key, factory(key, arg))
+                        else:
+                            for key, element in result.items():
+                                set_pipeline(key, element)
             finally:
                 if not in_method:
                     inst._in_method = False
@@ -554,7 +574,12 @@ argument to specify a selection specification""")
         # Handle selection dim expression
         if selection_expr is not None:
             mask = selection_expr.apply(self, compute=False, keep_index=True)
-            dataset = self[mask]
+            if self.interface.native_dim_ops:
+                # Apply lazy masks directly, avoiding the length check
+                # in __getitem__, which would evaluate them
+                dataset = self.clone(self.interface.select(self, selection_mask=mask))
+            else:
+                dataset = self[mask]
         else:
             dataset = self
 
@@ -730,7 +755,7 @@ argument to specify a selection specification""")
         # may be replaced with more general handling
         # see https://github.com/ioam/holoviews/issues/1173
         from ...element import Table, Curve
-        datatype = ['dataframe', 'dictionary', 'dask']
+        datatype = ['dataframe', 'dictionary', 'dask', 'arrow']
         if len(samples) == 1:
             sel = {kd.name: s for kd, s in zip(self.kdims, samples[0])}
             dims = [kd for kd, v in sel.items() if not np.isscalar(v)]
@@ -882,7 +907,7 @@ argument to specify a selection specification""")
 
 
     def groupby(self, dimensions=[], container_type=HoloMap, group_type=None,
-                dynamic=False, **kwargs):
+                dynamic=False, lazy=False, **kwargs):
         """Groups object by one or more dimensions
 
         Applies groupby operation over the specified dimensions
@@ -894,6 +919,8 @@ argument to specify a selection specification""")
             container_type: Type to cast group container to
             group_type: Type to cast each group to
             dynamic: Whether to return a DynamicMap
+            lazy: Whether to construct each group only when it is
+                first accessed (if supported by the data interface)
             **kwargs: Keyword arguments to pass to each group
 
         Returns:
@@ -927,6 +954,8 @@ argument to specify a selection specification""")
                             for d in dimensions]
             return DynamicMap(load_subset, kdims=dynamic_dims)
 
+        if lazy and self.interface.lazy_groupby:
+            kwargs['lazy'] = True
         return self.interface.groupby(self, dim_names, container_type,
                                       group_type, **kwargs)
 
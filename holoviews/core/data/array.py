@@ -104,6 +104,11 @@ class ArrayInterface(Interface):
         return dataset.data.dtype
 
 
+    @classmethod
+    def nbytes(cls, dataset):
+        return dataset.data.nbytes
+
+
     @classmethod
     def add_dimension(cls, dataset, dimension, dim_pos, values, vdim):
         data = dataset.data.copy()
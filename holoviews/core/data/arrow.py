@@ -0,0 +1,498 @@
+from __future__ import absolute_import
+
+import sys
+
+try:
+    import itertools.izip as zip
+except ImportError:
+    pass
+
+import numpy as np
+
+from .. import util
+from ..dimension import dimension_name
+from ..element import Element
+from ..ndmapping import NdMapping, item_check, sorted_context
+from .interface import DataError, Interface
+from .pandas import PandasInterface
+
+
+class ArrowInterface(Interface):
+    """
+    The ArrowInterface allows a Dataset objects to wrap a pyarrow
+    Table or a lazily loaded pyarrow.dataset.Dataset, e.g. a
+    (partitioned) Parquet store, without first converting it to a
+    pandas DataFrame.
+
+    Selections and groupby keys are translated into Arrow filter
+    expressions, which allows Arrow to skip Parquet row groups using
+    their column statistics and to read only the matching rows.
+    Accessing the values of a dimension only reads the corresponding
+    column and the range of a column in a Parquet dataset is computed
+    from the row group statistics where they are available.
+
+    Operations Arrow does not support natively, such as aggregations,
+    are performed by loading the required columns into a pandas
+    DataFrame and the result is converted back to an Arrow Table.
+    """
+
+    datatype = 'arrow'
+
+    types = ()
+
+    @classmethod
+    def loaded(cls):
+        return 'pyarrow' in sys.modules
+
+    @classmethod
+    def applies(cls, obj):
+        if not cls.loaded():
+            return False
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        return isinstance(obj, (pa.Table, ds.Dataset))
+
+    @classmethod
+    def dimension_type(cls, dataset, dim):
+        return cls.dtype(dataset, dim).type
+
+    @classmethod
+    def dtype(cls, dataset, dimension):
+        name = dataset.get_dimension(dimension, strict=True).name
+        try:
+            return np.dtype(dataset.data.schema.field(name).type.to_pandas_dtype())
+        except (NotImplementedError, TypeError):
+            return np.dtype('O')
+
+    @classmethod
+    def init(cls, eltype, data, kdims, vdims):
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        if not isinstance(data, (pa.Table, ds.Dataset)):
+            data, dims, extra = PandasInterface.init(eltype, data, kdims, vdims)
+            return pa.Table.from_pandas(data, preserve_index=False), dims, extra
+
+        # Resolve the dimensions against an empty frame with the same
+        # columns to avoid loading the data
+        empty = cls._to_pandas(data.schema.empty_table())
+        frame, dims, extra = PandasInterface.init(eltype, empty, kdims, vdims)
+        if list(frame.columns) != data.schema.names:
+            # Auto-indexed elements require the index as a column
+            frame, dims, extra = PandasInterface.init(
+                eltype, cls._to_pandas(cls._scan(data)), kdims, vdims)
+            data = pa.Table.from_pandas(frame, preserve_index=False)
+        return data, dims, extra
+
+    @classmethod
+    def validate(cls, dataset, vdims=True):
+        dims = 'all' if vdims else 'key'
+        not_found = [d for d in dataset.dimensions(dims, label='name')
+                     if d not in dataset.data.schema.names]
+        if not_found:
+            raise DataError("Supplied data does not contain specified "
+                            "dimensions, the following dimensions were "
+                            "not found: %s" % repr(not_found), cls)
+
+    @classmethod
+    def _scan(cls, data, columns=None, filter=None):
+        """
+        Reads the requested columns of the rows matching the filter
+        expression into a pyarrow Table. If the data is a Parquet
+        dataset the filter is used to skip row groups whose statistics
+        do not match.
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        if isinstance(data, pa.Table):
+            if filter is None:
+                return data if columns is None else data.select(columns)
+            data = ds.dataset(data)
+        return data.to_table(columns=columns, filter=filter)
+
+    @classmethod
+    def _to_pandas(cls, table):
+        """
+        Converts a pyarrow Table to a DataFrame ignoring any pandas
+        index stored in the schema metadata.
+        """
+        return table.replace_schema_metadata().to_pandas()
+
+    @classmethod
+    def _columns(cls, dataset):
+        """
+        Returns the columns to read when materializing a lazy dataset,
+        only the columns referenced by dimensions are loaded.
+        """
+        import pyarrow as pa
+        if isinstance(dataset.data, pa.Table):
+            return None
+        names = dataset.dimensions(label='name')
+        return [c for c in dataset.data.schema.names if c in names]
+
+    @classmethod
+    def _column(cls, dataset, name):
+        return cls._scan(dataset.data, [name]).column(name)
+
+    @classmethod
+    def _scalar(cls, value, field_type):
+        import pyarrow as pa
+        if not pa.types.is_temporal(field_type):
+            return value
+        elif pa.types.is_timestamp(field_type) and isinstance(value, (np.datetime64, util.basestring)):
+            value = util.pd.Timestamp(value)
+        return pa.scalar(value, type=field_type)
+
+    @classmethod
+    def _filter_expression(cls, dataset, selection):
+        """
+        Translates a selection into an Arrow filter expression.
+        Returns None if the selection cannot be expressed as a filter,
+        e.g. if it contains a callable.
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        schema = dataset.data.schema
+        expression = None
+        for dim, sel in selection.items():
+            if isinstance(sel, tuple):
+                sel = slice(*sel)
+            name = dataset.get_dimension(dim, strict=True).name
+            field, field_type = ds.field(name), schema.field(name).type
+            if pa.types.is_temporal(field_type):
+                try:
+                    sel = util.parse_datetime_selection(sel)
+                except:
+                    pass
+            try:
+                if isinstance(sel, slice):
+                    conditions = []
+                    if sel.start is not None:
+                        conditions.append(field >= cls._scalar(sel.start, field_type))
+                    if sel.stop is not None:
+                        conditions.append(field < cls._scalar(sel.stop, field_type))
+                elif isinstance(sel, (set, list)):
+                    values = [cls._scalar(v, field_type) for v in sel]
+                    conditions = [field.isin(pa.array(values, type=field_type))]
+                elif callable(sel):
+                    return None
+                else:
+                    conditions = [field == cls._scalar(sel, field_type)]
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError,
+                    pa.ArrowTypeError, TypeError, ValueError):
+                return None
+            for condition in conditions:
+                expression = condition if expression is None else expression & condition
+        return expression
+
+    @classmethod
+    def _select_table(cls, dataset, selection_mask=None, **selection):
+        """
+        Applies the selection to the data returning a pyarrow Table.
+        Selections that can be expressed as filters are pushed down to
+        Arrow, otherwise a boolean mask is computed on the columns.
+        """
+        import pyarrow as pa
+        columns = cls._columns(dataset)
+        if selection_mask is None:
+            expression = cls._filter_expression(dataset, selection)
+            if expression is None and not selection:
+                return cls._scan(dataset.data, columns)
+            elif expression is not None:
+                try:
+                    table = cls._scan(dataset.data, columns, expression)
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                    table = None
+                # Scalar selections on a 1D dataset snap to the nearest
+                # value, which requires computing the mask.
+                if (table is not None and not (table.num_rows == 0 and dataset.ndims == 1
+                                               and cls.indexed(dataset, selection))):
+                    return table
+            selection_mask = cls.select_mask(dataset, selection)
+        mask = pa.array(np.asarray(selection_mask, dtype=bool))
+        return cls._scan(dataset.data, columns).filter(mask)
+
+    @classmethod
+    def select(cls, dataset, selection_mask=None, **selection):
+        table = cls._select_table(dataset, selection_mask, **selection)
+        indexed = cls.indexed(dataset, selection)
+        if indexed and table.num_rows == 1 and len(dataset.vdims) == 1:
+            return table.column(dataset.vdims[0].name).to_pandas().iloc[0]
+        return table
+
+    @classmethod
+    def shape(cls, dataset):
+        return (cls.length(dataset), len(dataset.data.schema.names))
+
+    @classmethod
+    def length(cls, dataset):
+        import pyarrow as pa
+        if isinstance(dataset.data, pa.Table):
+            return dataset.data.num_rows
+        return dataset.data.count_rows()
+
+    @classmethod
+    def nbytes(cls, dataset):
+        import pyarrow as pa
+        if isinstance(dataset.data, pa.Table):
+            return dataset.data.nbytes
+        # Datasets are only loaded into memory when they are scanned
+        return 0
+
+    @classmethod
+    def _statistics_range(cls, data, name):
+        """
+        Computes the range of a column in a Parquet dataset from the
+        row group statistics, returns None if the statistics are not
+        available for all row groups.
+        """
+        import pyarrow.dataset as ds
+        lower = upper = None
+        for fragment in data.get_fragments():
+            if not isinstance(fragment, ds.ParquetFileFragment):
+                return None
+            fragment.ensure_complete_metadata()
+            for row_group in fragment.row_groups:
+                stats = (row_group.statistics or {}).get(name)
+                if not stats or stats.get('min') is None:
+                    if row_group.num_rows:
+                        return None
+                    continue
+                lower = stats['min'] if lower is None else min(lower, stats['min'])
+                upper = stats['max'] if upper is None else max(upper, stats['max'])
+        return None if lower is None else (lower, upper)
+
+    @classmethod
+    def range(cls, dataset, dimension):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        name = dataset.get_dimension(dimension, strict=True).name
+        field_type = dataset.data.schema.field(name).type
+        minmax = None
+        if not isinstance(dataset.data, pa.Table):
+            minmax = cls._statistics_range(dataset.data, name)
+        if minmax is None:
+            try:
+                result = pc.min_max(cls._column(dataset, name))
+            except (pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                return super(ArrowInterface, cls).range(dataset, dimension)
+            minmax = result['min'].as_py(), result['max'].as_py()
+        if minmax[0] is None:
+            return np.NaN, np.NaN
+        lower, upper = np.asarray(pa.array(list(minmax), type=field_type).to_pandas())
+        return lower, upper
+
+    @classmethod
+    def values(cls, dataset, dim, expanded=True, flat=True, compute=True, keep_index=False):
+        import pyarrow.compute as pc
+        dim = dataset.get_dimension(dim, strict=True)
+        column = cls._column(dataset, dim.name)
+        if not expanded:
+            column = pc.unique(column)
+        values = column.to_pandas()
+        return values if keep_index else np.asarray(values)
+
+    @classmethod
+    def isscalar(cls, dataset, dim):
+        import pyarrow.compute as pc
+        name = dataset.get_dimension(dim, strict=True).name
+        return len(pc.unique(cls._column(dataset, name))) == 1
+
+    @classmethod
+    def unpack_scalar(cls, dataset, data):
+        """
+        Given a dataset object and data in the appropriate format for
+        the interface, return a simple scalar.
+        """
+        if data.num_columns > 1 or data.num_rows != 1:
+            return data
+        return data.column(0).to_pandas().iloc[0]
+
+    @classmethod
+    def _table_groups(cls, table, group_by):
+        """
+        Splits an in-memory Table into groups in a single pass by
+        stably sorting the rows by their group and taking each
+        contiguous slice of the sorted order. Returns a list of the
+        key and Table of each group in order of first appearance,
+        omitting rows with missing keys.
+        """
+        import pyarrow as pa
+        keys = cls._to_pandas(table.select(group_by))
+        codes = np.zeros(len(keys), dtype='int64')
+        missing = np.zeros(len(keys), dtype=bool)
+        for name in group_by:
+            column_codes, uniques = util.pd.factorize(keys[name])
+            missing |= column_codes < 0
+            codes, _ = util.pd.factorize(codes*(len(uniques)+1) + column_codes)
+        rows = np.flatnonzero(~missing)
+        codes, _ = util.pd.factorize(codes[rows])
+        order = rows[np.argsort(codes, kind='mergesort')]
+        offsets = np.concatenate([[0], np.cumsum(np.bincount(codes))])
+        groups = []
+        for start, end in zip(offsets[:-1], offsets[1:]):
+            indices = order[start:end]
+            key = tuple(keys.iloc[indices[0]])
+            groups.append((key, table.take(pa.array(indices))))
+        return groups
+
+    @classmethod
+    def _dataset_groups(cls, dataset, group_by):
+        """
+        Finds the groups of a lazy dataset by only reading the key
+        columns and then reads the rows of each group by pushing its
+        key down as a filter. Returns a list of the key and Table of
+        each group in order of first appearance.
+        """
+        keys = cls._to_pandas(cls._scan(dataset.data, group_by))
+        keys = keys.drop_duplicates()
+        groups = []
+        for key in keys.itertuples(index=False):
+            if any(isinstance(k, float) and np.isnan(k) for k in key):
+                continue
+            table = cls._select_table(dataset, **dict(zip(group_by, key)))
+            groups.append((tuple(key), table))
+        return groups
+
+    @classmethod
+    def groupby(cls, dataset, dimensions, container_type, group_type, **kwargs):
+        import pyarrow as pa
+        index_dims = [dataset.get_dimension(d, strict=True) for d in dimensions]
+        element_dims = [kdim for kdim in dataset.kdims
+                        if kdim not in index_dims]
+
+        group_kwargs = {}
+        if group_type != 'raw' and issubclass(group_type, Element):
+            group_kwargs = dict(util.get_param_values(dataset),
+                                kdims=element_dims)
+        group_kwargs.update(kwargs)
+
+        # Propagate dataset
+        group_kwargs['dataset'] = dataset.dataset
+
+        group_by = [d.name for d in index_dims]
+        if isinstance(dataset.data, pa.Table):
+            groups = cls._table_groups(dataset.data, group_by)
+        else:
+            groups = cls._dataset_groups(dataset, group_by)
+        data = []
+        for key, table in groups:
+            group = table if group_type == 'raw' else group_type(table, **group_kwargs)
+            data.append((key[0] if len(key) == 1 else tuple(key), group))
+        if issubclass(container_type, NdMapping):
+            with item_check(False), sorted_context(False):
+                return container_type(data, kdims=index_dims)
+        else:
+            return container_type(data)
+
+    @classmethod
+    def _as_pandas(cls, dataset):
+        """
+        Returns a clone of the Dataset wrapping the columns referenced
+        by its dimensions in a pandas DataFrame.
+        """
+        return dataset.clone(cls.dframe(dataset, dataset.dimensions(label='name')),
+                             datatype=['dataframe'])
+
+    @classmethod
+    def _from_pandas(cls, df):
+        import pyarrow as pa
+        return pa.Table.from_pandas(df, preserve_index=False)
+
+    @classmethod
+    def aggregate(cls, dataset, dimensions, function, **kwargs):
+        data, dropped = PandasInterface.aggregate(
+            cls._as_pandas(dataset), dimensions, function, **kwargs)
+        return cls._from_pandas(data), dropped
+
+    @classmethod
+    def sample(cls, dataset, samples=[]):
+        return cls._from_pandas(PandasInterface.sample(cls._as_pandas(dataset), samples))
+
+    @classmethod
+    def sort(cls, dataset, by=[], reverse=False):
+        order = 'descending' if reverse else 'ascending'
+        by = [(dataset.get_dimension(d, strict=True).name, order) for d in by]
+        return cls._scan(dataset.data, cls._columns(dataset)).sort_by(by)
+
+    @classmethod
+    def reindex(cls, dataset, kdims=None, vdims=None):
+        import pyarrow as pa
+        if not isinstance(dataset.data, pa.Table):
+            return dataset.data
+        names = [dataset.get_dimension(d, strict=True).name for d in kdims+vdims]
+        return dataset.data.select([c for c in dataset.data.schema.names if c in names])
+
+    @classmethod
+    def redim(cls, dataset, dimensions):
+        table = cls._scan(dataset.data, cls._columns(dataset))
+        return table.rename_columns([dimensions[c].name if c in dimensions else c
+                                     for c in table.schema.names])
+
+    @classmethod
+    def add_dimension(cls, dataset, dimension, dim_pos, values, vdim):
+        import pyarrow as pa
+        table = cls._scan(dataset.data, cls._columns(dataset))
+        name = dimension_name(dimension)
+        if name in table.schema.names:
+            return table
+        if np.isscalar(values):
+            values = np.full(table.num_rows, values)
+        return table.add_column(dim_pos, name, pa.array(values))
+
+    @classmethod
+    def assign(cls, dataset, new_data):
+        import pyarrow as pa
+        table = cls._scan(dataset.data, cls._columns(dataset))
+        for name, values in new_data.items():
+            column = pa.array(np.asarray(values))
+            if name in table.schema.names:
+                table = table.set_column(table.schema.get_field_index(name), name, column)
+            else:
+                table = table.append_column(name, column)
+        return table
+
+    @classmethod
+    def concat(cls, datasets, dimensions, vdims):
+        import pyarrow as pa
+        tables = []
+        for key, ds in datasets:
+            table = cls._scan(ds.data, cls._columns(ds))
+            for i, (d, k) in enumerate(zip(dimensions, key)):
+                table = table.add_column(i, d.name, pa.array(np.full(table.num_rows, k)))
+            tables.append(table)
+        return pa.concat_tables(tables)
+
+    @classmethod
+    def iloc(cls, dataset, index):
+        rows, cols = index
+        scalar = False
+        if isinstance(cols, slice):
+            cols = [d.name for d in dataset.dimensions()][cols]
+        elif np.isscalar(cols):
+            scalar = np.isscalar(rows)
+            cols = [dataset.get_dimension(cols).name]
+        else:
+            cols = [dataset.get_dimension(d).name for d in index[1]]
+        table = cls._scan(dataset.data, cols)
+        if np.isscalar(rows):
+            rows = [rows]
+        elif isinstance(rows, slice):
+            rows = np.arange(table.num_rows)[rows]
+        rows = np.asarray(rows)
+        if rows.dtype.kind == 'b':
+            table = table.filter(rows)
+        else:
+            table = table.take(np.where(rows < 0, rows+table.num_rows, rows))
+        if scalar:
+            return table.column(0).to_pandas().iloc[0]
+        return table
+
+    @classmethod
+    def dframe(cls, dataset, dimensions):
+        if dimensions:
+            return cls._to_pandas(cls._scan(dataset.data, dimensions))
+        return cls._to_pandas(cls._scan(dataset.data, cls._columns(dataset)))
+
+
+Interface.register(ArrowInterface)
@@ -40,6 +40,10 @@ class cuDFInterface(PandasInterface):
 
     types = ()
 
+    native_dim_ops = True
+
+    lazy_groupby = False
+
     @classmethod
     def loaded(cls):
         return 'cudf' in sys.modules
@@ -144,6 +148,13 @@ class cuDFInterface(PandasInterface):
         return data
 
 
+    @classmethod
+    def materialize(cls, values, keep_index=False):
+        if keep_index or not hasattr(values, 'to_array'):
+            return values
+        return values.to_array()
+
+
     @classmethod
     def groupby(cls, dataset, dimensions, container_type, group_type, **kwargs):
         # Get dimensions information
@@ -42,6 +42,10 @@ class DaskInterface(PandasInterface):
 
     default_partitions = 100
 
+    native_dim_ops = True
+
+    lazy_groupby = False
+
     @classmethod
     def loaded(cls):
         return 'dask.dataframe' in sys.modules and 'pandas' in sys.modules
@@ -74,6 +78,16 @@ class DaskInterface(PandasInterface):
     def shape(cls, dataset):
         return (len(dataset.data), len(dataset.data.columns))
 
+    @classmethod
+    def nbytes(cls, dataset):
+        # Partitions are only loaded into memory on compute, so only
+        # count the data held in the task graph, e.g. the pandas
+        # partitions of a DataFrame wrapped with from_pandas
+        from dask.core import istask
+        from dask.sizeof import sizeof
+        graph = dataset.data.__dask_graph__()
+        return int(sum(sizeof(v) for v in graph.values() if not istask(v)))
+
     @classmethod
     def range(cls, dataset, dimension):
         import dask.dataframe as dd
@@ -84,6 +98,27 @@ class DaskInterface(PandasInterface):
         else:
             return dd.compute(column.min(), column.max())
 
+    @classmethod
+    def ranges(cls, dataset, dimensions):
+        import dask.dataframe as dd
+        dimensions = [dataset.get_dimension(d) for d in dimensions]
+        tasks = []
+        for d in dimensions:
+            column = dataset.data[d.name]
+            if column.dtype.kind == 'O':
+                tasks.append(column[column.notnull()])
+            else:
+                tasks += [column.min(), column.max()]
+        results = list(dd.compute(*tasks))[::-1]
+        ranges = OrderedDict()
+        for d in dimensions:
+            if dataset.data[d.name].dtype.kind == 'O':
+                column = np.sort(results.pop())
+                ranges[d.name] = (column[0], column[-1]) if len(column) else (None, None)
+            else:
+                ranges[d.name] = (results.pop(), results.pop())
+        return ranges
+
     @classmethod
     def sort(cls, dataset, by=[], reverse=False):
         dataset.param.warning('Dask dataframes do not support sorting')
@@ -100,6 +135,11 @@ class DaskInterface(PandasInterface):
         else:
             return data.compute().values if compute else data.values
 
+    @classmethod
+    def materialize(cls, values, keep_index=False):
+        from dask.base import is_dask_collection
+        return values.compute() if is_dask_collection(values) else values
+
     @classmethod
     def select_mask(cls, dataset, selection):
         """
@@ -180,6 +180,10 @@ class DictInterface(Interface):
                    if d in dataset.dimensions() and not isscalar(vals)]
         return max(lengths) if lengths else 1
 
+    @classmethod
+    def nbytes(cls, dataset):
+        return sum(getattr(vals, 'nbytes', 0) for vals in dataset.data.values())
+
     @classmethod
     def array(cls, dataset, dimensions):
         if not dimensions:
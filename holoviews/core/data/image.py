@@ -92,6 +92,10 @@ class ImageInterface(GridInterface):
     def length(cls, dataset):
         return np.product(dataset.data.shape[:2], dtype=np.intp)
 
+    @classmethod
+    def nbytes(cls, dataset):
+        return dataset.data.nbytes
+
 
     @classmethod
     def validate(cls, dataset, vdims=True):
@@ -161,6 +161,14 @@ class Interface(param.Parameterized):
     # Whether the interface stores the names of the underlying dimensions
     named = True
 
+    # Whether dim expressions should be evaluated on the native column
+    # objects of the data, only materializing the final result
+    native_dim_ops = False
+
+    # Whether groupby supports the lazy option, deferring construction
+    # of each group until it is accessed
+    lazy_groupby = False
+
     @classmethod
     def loaded(cls):
         """
@@ -179,6 +187,16 @@ class Interface(param.Parameterized):
         """
         return type(obj) in cls.types
 
+    @classmethod
+    def materialize(cls, values, keep_index=False):
+        """
+        Given the result of a dim expression evaluated on the native
+        column objects of the data (see native_dim_ops), return the
+        computed values as NumPy arrays (or pandas Series if
+        keep_index is enabled).
+        """
+        return values
+
     @classmethod
     def register(cls, interface):
         cls.interfaces[interface.datatype] = interface
@@ -393,6 +411,17 @@ class Interface(param.Parameterized):
         return all_scalar and all_kdims
 
 
+    @classmethod
+    def ranges(cls, dataset, dimensions):
+        """
+        Computes the data ranges of multiple dimensions, returning a
+        dictionary of (lower, upper) tuples indexed by dimension name.
+        Interfaces may override this method to compute the ranges in a
+        single pass over the data.
+        """
+        dimensions = [dataset.get_dimension(d, strict=True) for d in dimensions]
+        return util.OrderedDict([(d.name, cls.range(dataset, d)) for d in dimensions])
+
     @classmethod
     def range(cls, dataset, dimension):
         column = dataset.dimension_values(dimension)
@@ -479,6 +508,21 @@ class Interface(param.Parameterized):
     def nonzero(cls, dataset):
         return bool(cls.length(dataset))
 
+    @classmethod
+    def nbytes(cls, dataset):
+        """
+        Returns the number of bytes held in memory by the data of the
+        Dataset, e.g. to bound the size of a cache.
+        """
+        data = dataset.data
+        if hasattr(data, 'nbytes'):
+            return int(data.nbytes)
+        elif hasattr(data, 'memory_usage'):
+            return int(data.memory_usage(index=True).sum())
+        elif isinstance(data, dict):
+            return int(sum(getattr(v, 'nbytes', 0) for v in data.values()))
+        return 0
+
     @classmethod
     def redim(cls, dataset, dimensions):
         return dataset.data
@@ -279,7 +279,7 @@ class MultiInterface(Interface):
         grouped_data = []
         for unique_key in util.unique_iterator(keys):
             mask = ds.interface.select_mask(ds, dict(zip(dimensions, unique_key)))
-            selection = [data for data, m in zip(dataset.data, mask) if m]
+            selection = cls.select(dataset, selection_mask=mask)
             group_data = group_type(selection, **group_kwargs)
             grouped_data.append((unique_key, group_data))
 
@@ -330,6 +330,17 @@ class MultiInterface(Interface):
             length += ds.interface.length(ds)
         return length
 
+    @classmethod
+    def nbytes(cls, dataset):
+        if not dataset.data:
+            return 0
+        nbytes = 0
+        ds = cls._inner_dataset_template(dataset)
+        for d in dataset.data:
+            ds.data = d
+            nbytes += ds.interface.nbytes(ds)
+        return nbytes
+
     @classmethod
     def dtype(cls, dataset, dimension):
         if not dataset.data:
@@ -0,0 +1,619 @@
+import warnings
+
+import numpy as np
+
+from .. import util
+from ..dimension import OrderedDict, dimension_name
+from .interface import Interface, DataError
+from .multipath import MultiInterface
+
+
+class PackedGeometries(object):
+    """
+    PackedGeometries stores a collection of geometries using a ragged
+    list layout like Arrow list arrays. The per-vertex values of all
+    geometries are concatenated into flat columns and the offsets
+    array marks where each geometry starts and ends, i.e. geometry i
+    spans the rows offsets[i] to offsets[i+1] of each column. Values
+    which are constant across a geometry are stored once per geometry
+    in the scalars.
+
+    Multi-geometries are separated by NaN coordinates within a
+    geometry as in the other geometry formats. Polygon holes may be
+    supplied as a list containing the holes of each geometry (or None
+    if a geometry does not have holes).
+    """
+
+    def __init__(self, columns, offsets, scalars=None, geom_type=None, holes=None):
+        offsets = np.asarray(offsets, dtype='int64')
+        if (offsets.ndim != 1 or not len(offsets) or offsets[0] != 0 or
+            (np.diff(offsets) < 0).any()):
+            raise ValueError('PackedGeometries offsets must be a monotonically '
+                             'increasing 1D array starting at zero.')
+        ngeoms, nverts = len(offsets)-1, offsets[-1]
+        self.offsets = offsets
+        self.columns = OrderedDict()
+        for name, values in columns.items():
+            values = np.asarray(values)
+            if len(values) != nverts:
+                raise ValueError('PackedGeometries column %r has length %d, '
+                                 'expected one value per vertex (%d).'
+                                 % (name, len(values), nverts))
+            self.columns[name] = values
+        self.scalars = OrderedDict()
+        for name, values in (scalars or {}).items():
+            values = np.full(ngeoms, values) if np.isscalar(values) else np.asarray(values)
+            if len(values) != ngeoms:
+                raise ValueError('PackedGeometries scalar %r has length %d, '
+                                 'expected one value per geometry (%d).'
+                                 % (name, len(values), ngeoms))
+            self.scalars[name] = values
+        if holes is not None and len(holes) != ngeoms:
+            raise ValueError('PackedGeometries holes must declare the holes '
+                             'of each geometry.')
+        self.geom_type = geom_type
+        self.holes = holes
+
+    def __len__(self):
+        return len(self.offsets)-1
+
+    def __contains__(self, name):
+        return name in self.columns or name in self.scalars
+
+    def __repr__(self):
+        return '%s(ngeoms=%d, nvertices=%d, columns=%s, scalars=%s)' % (
+            type(self).__name__, len(self), self.offsets[-1],
+            list(self.columns), list(self.scalars))
+
+    @property
+    def lengths(self):
+        "The number of vertices of each geometry."
+        return np.diff(self.offsets)
+
+    @property
+    def geom_index(self):
+        "The index of the geometry each vertex belongs to."
+        return np.repeat(np.arange(len(self)), self.lengths)
+
+    @property
+    def nbytes(self):
+        arrays = list(self.columns.values()) + list(self.scalars.values())
+        return self.offsets.nbytes + sum(arr.nbytes for arr in arrays)
+
+    def expand(self, name):
+        "Returns the per-vertex values of the named column."
+        if name in self.columns:
+            return self.columns[name]
+        return np.repeat(self.scalars[name], self.lengths)
+
+    def split_column(self, name):
+        "Returns views of the per-vertex values of each geometry."
+        if not len(self):
+            return []
+        return np.split(self.expand(name), self.offsets[1:-1])
+
+    def _clone(self, columns, offsets, scalars, holes):
+        return type(self)(columns, offsets, scalars, self.geom_type, holes)
+
+    def take(self, index):
+        """
+        Returns the geometries selected by the supplied index, which
+        may be an integer, a slice, an integer array or a boolean mask.
+        """
+        index = np.atleast_1d(np.arange(len(self))[index])
+        lengths = self.lengths[index]
+        offsets = np.zeros(len(index)+1, dtype='int64')
+        np.cumsum(lengths, out=offsets[1:])
+        starts = self.offsets[:-1][index]
+        rows = np.arange(offsets[-1]) - np.repeat(offsets[:-1]-starts, lengths)
+        columns = OrderedDict((n, c[rows]) for n, c in self.columns.items())
+        scalars = OrderedDict((n, s[index]) for n, s in self.scalars.items())
+        holes = None if self.holes is None else [self.holes[i] for i in index]
+        return self._clone(columns, offsets, scalars, holes)
+
+    def take_vertices(self, rows):
+        """
+        Returns the vertices selected by the supplied row indices,
+        which must be grouped by geometry, dropping any geometries
+        without selected vertices.
+        """
+        counts = np.bincount(self.geom_index[rows], minlength=len(self))
+        keep = counts > 0
+        offsets = np.zeros(keep.sum()+1, dtype='int64')
+        np.cumsum(counts[keep], out=offsets[1:])
+        columns = OrderedDict((n, c[rows]) for n, c in self.columns.items())
+        scalars = OrderedDict((n, s[keep]) for n, s in self.scalars.items())
+        holes = None if self.holes is None else [h for h, k in zip(self.holes, keep) if k]
+        return self._clone(columns, offsets, scalars, holes)
+
+    def select_columns(self, names):
+        "Returns the geometries with only the named columns."
+        columns = OrderedDict((n, c) for n, c in self.columns.items() if n in names)
+        scalars = OrderedDict((n, s) for n, s in self.scalars.items() if n in names)
+        return self._clone(columns, self.offsets, scalars, self.holes)
+
+    def rename(self, mapping):
+        "Returns the geometries with columns renamed by the mapping."
+        columns = OrderedDict((mapping.get(n, n), c) for n, c in self.columns.items())
+        scalars = OrderedDict((mapping.get(n, n), s) for n, s in self.scalars.items())
+        return self._clone(columns, self.offsets, scalars, self.holes)
+
+    def add_scalar(self, name, values):
+        "Returns the geometries with an additional per-geometry column."
+        scalars = OrderedDict(self.scalars, **{name: values})
+        return self._clone(self.columns, self.offsets, scalars, self.holes)
+
+
+class PackedInterface(MultiInterface):
+    """
+    PackedInterface represents paths, polygons and multi-point
+    geometries using PackedGeometries, storing the vertices of all
+    geometries in flat columns indexed by an offsets array. Unlike the
+    MultiInterface, which loops over a list of tabular datasets, all
+    operations are vectorized over every geometry at once.
+
+    Lists of tabular geometries supported by the MultiInterface are
+    packed on construction.
+    """
+
+    types = (PackedGeometries,)
+
+    datatype = 'packed'
+
+    multi = True
+
+    @classmethod
+    def init(cls, eltype, data, kdims, vdims):
+        if not isinstance(data, PackedGeometries):
+            data, dims, _ = MultiInterface.init(eltype, data, kdims, vdims)
+            return cls._pack(data, dims), dims, {}
+
+        dims = {'kdims': eltype.kdims, 'vdims': eltype.vdims}
+        if kdims is not None:
+            dims['kdims'] = kdims
+        if vdims is not None:
+            dims['vdims'] = vdims
+        return data, dims, {}
+
+    @classmethod
+    def _pack(cls, data, dims):
+        """
+        Packs a list of tabular geometries into PackedGeometries.
+        """
+        from ...element import Polygons
+        from . import Dataset
+
+        dimensions = [d.name for d in dims['kdims']+dims['vdims']]
+        if not data:
+            columns = OrderedDict((d, np.array([])) for d in dimensions)
+            return PackedGeometries(columns, [0])
+
+        geom_types, holes, lengths = [], [], []
+        values = OrderedDict((d, []) for d in dimensions)
+        ds = Dataset(data[0], kdims=dims['kdims'], vdims=dims['vdims'],
+                     datatype=MultiInterface.subtypes, _validate_vdims=False)
+        for d in data:
+            ds.data = d
+            is_dict = isinstance(d, dict)
+            geom_types.append(d.get('geom_type') if is_dict else None)
+            holes.append(d.get(Polygons._hole_key) if is_dict else None)
+            lengths.append(ds.interface.length(ds))
+            for name, vals in values.items():
+                if is_dict and name not in d:
+                    continue
+                elif is_dict and util.isscalar(d[name]):
+                    vals.append(d[name])
+                else:
+                    vals.append(ds.interface.values(ds, name))
+
+        if len(set(geom_types)) > 1:
+            raise ValueError('PackedGeometries must all share the same geom_type.')
+        columns, scalars = OrderedDict(), OrderedDict()
+        for name, vals in values.items():
+            if not vals:
+                continue
+            elif len(vals) != len(data):
+                raise ValueError('PackedGeometries must all declare the %r dimension.' % name)
+            elif all(util.isscalar(v) for v in vals):
+                scalars[name] = np.asarray(vals)
+            else:
+                columns[name] = np.concatenate([
+                    np.full(l, v) if util.isscalar(v) else v
+                    for l, v in zip(lengths, vals)])
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+        holes = holes if any(h is not None for h in holes) else None
+        return PackedGeometries(columns, offsets, scalars, geom_types[0], holes)
+
+    @classmethod
+    def validate(cls, dataset, vdims=True):
+        vdims = vdims and getattr(dataset, 'level', None) is None
+        dims = 'all' if vdims else 'key'
+        not_found = [d for d in dataset.dimensions(dims, label='name')
+                     if d not in dataset.data]
+        if not_found:
+            raise DataError("Supplied data does not contain specified "
+                            "dimensions, the following dimensions were "
+                            "not found: %s" % repr(not_found), cls)
+
+        holes = dataset.data.holes
+        if holes is None:
+            return
+        for h, splits in zip(holes, cls._split_counts(dataset)):
+            if h is not None and len(h) != (splits+1):
+                raise DataError('Polygons with holes containing multi-geometries '
+                                'must declare a list of holes for each geometry.', cls)
+
+    @classmethod
+    def _split_counts(cls, dataset):
+        """
+        Returns the number of NaN separators splitting each geometry
+        into a multi-geometry.
+        """
+        data = dataset.data
+        xs = data.expand(dataset.kdims[0].name).astype('float')
+        return np.bincount(data.geom_index[np.isnan(xs)], minlength=len(data))
+
+    @classmethod
+    def geom_type(cls, dataset):
+        if not isinstance(dataset, type) and dataset.data.geom_type is not None:
+            return dataset.data.geom_type
+        return super(PackedInterface, cls).geom_type(dataset)
+
+    @classmethod
+    def dimension_type(cls, dataset, dim):
+        return cls.dtype(dataset, dim).type
+
+    @classmethod
+    def dtype(cls, dataset, dimension):
+        name = dataset.get_dimension(dimension, strict=True).name
+        data = dataset.data
+        column = data.columns[name] if name in data.columns else data.scalars[name]
+        return column.dtype
+
+    @classmethod
+    def range(cls, dataset, dim):
+        data = dataset.data
+        if not len(data):
+            return (None, None)
+
+        # Backward compatibility for Contours/Polygons level
+        level = getattr(dataset, 'level', None)
+        dim = dataset.get_dimension(dim)
+        if level is not None and dim is dataset.vdims[0]:
+            return (level, level)
+
+        column = data.columns.get(dim.name)
+        if column is None:
+            column = data.scalars[dim.name]
+        if column.dtype.kind == 'M':
+            return column.min(), column.max()
+        elif len(column) == 0:
+            return np.NaN, np.NaN
+        try:
+            assert column.dtype.kind not in 'SUO'
+            with warnings.catch_warnings():
+                warnings.filterwarnings('ignore', r'All-NaN (slice|axis) encountered')
+                return (np.nanmin(column), np.nanmax(column))
+        except (AssertionError, TypeError):
+            column = [v for v in util.python2sort(column) if v is not None]
+            if not len(column):
+                return np.NaN, np.NaN
+            return column[0], column[-1]
+
+    @classmethod
+    def has_holes(cls, dataset):
+        holes = dataset.data.holes
+        return holes is not None and any(h for h in holes)
+
+    @classmethod
+    def holes(cls, dataset):
+        data = dataset.data
+        if not len(data):
+            return []
+        splits = cls._split_counts(dataset)
+        holes = data.holes or [None]*len(data)
+        geom_holes = []
+        for hs, nsplits in zip(holes, splits):
+            if hs is None:
+                geom_holes.append([[]]*(nsplits+1))
+                continue
+            subholes = []
+            for sub in hs:
+                closed = []
+                for h in sub:
+                    hole = np.asarray(h)
+                    if (hole[0, :] != hole[-1, :]).all():
+                        hole = np.concatenate([hole, hole[:1]])
+                    closed.append(hole)
+                subholes.append(closed)
+            geom_holes.append(subholes)
+        return geom_holes
+
+    @classmethod
+    def _geom_constant(cls, data, values):
+        """
+        Returns a boolean array indicating for each non-empty geometry
+        whether the supplied per-vertex values are constant.
+        """
+        lengths = data.lengths
+        nonempty = lengths > 0
+        starts = data.offsets[:-1][nonempty]
+        if not len(starts):
+            return np.array([], dtype=bool)
+        first = np.repeat(values[starts], lengths[nonempty])
+        equal = values == first
+        if values.dtype.kind == 'f':
+            equal |= np.isnan(values) & np.isnan(first)
+        return np.logical_and.reduceat(equal, starts)
+
+    @classmethod
+    def isscalar(cls, dataset, dim, per_geom=False):
+        """
+        Tests if dimension is scalar in each geometry.
+        """
+        data = dataset.data
+        if not len(data):
+            return True
+        name = dataset.get_dimension(dim, strict=True).name
+        per_geom = per_geom and cls.geom_type(dataset) != 'Point'
+        if name in data.scalars:
+            values = data.scalars[name]
+        else:
+            values = data.columns[name]
+            if not cls._geom_constant(data, values).all():
+                return False
+            values = values[data.offsets[:-1][data.lengths > 0]]
+        return per_geom or len(util.unique_array(values)) <= 1
+
+    @classmethod
+    def select(cls, dataset, selection_mask=None, **selection):
+        """
+        Applies selection on all the geometries.
+        """
+        from . import Dataset
+        data = dataset.data
+        if not len(data):
+            return data
+        elif selection_mask is not None:
+            mask = np.asarray(selection_mask, dtype=bool)[:len(data)]
+            return data.take(np.flatnonzero(mask))
+
+        # Apply the selection to the flattened vertices
+        columns = cls.vertex_columns(dataset)
+        ds = Dataset(columns, kdims=list(columns), datatype=['dictionary'])
+        mask = ds.interface.select_mask(ds, selection)
+        if np.isscalar(mask) or mask.ndim == 0:
+            mask = np.full(data.offsets[-1], bool(mask))
+        return data.take_vertices(np.flatnonzero(mask))
+
+    @classmethod
+    def select_paths(cls, dataset, index):
+        """
+        Allows selecting paths with usual NumPy slicing index.
+        """
+        return dataset.data.take(index)
+
+    @classmethod
+    def sort(cls, dataset, by=[], reverse=False):
+        by = [dataset.get_dimension(d).name for d in by]
+        if len(by) == 1:
+            sorting = cls.values(dataset, by[0], False).argsort()
+        else:
+            arrays = [dataset.dimension_values(d, False) for d in by]
+            sorting = util.arglexsort(arrays)
+        return dataset.data.take(sorting)
+
+    @classmethod
+    def shape(cls, dataset):
+        return (cls.length(dataset), len(dataset.dimensions()))
+
+    @classmethod
+    def length(cls, dataset):
+        data = dataset.data
+        if cls.geom_type(dataset) == 'Point':
+            return int(data.offsets[-1])
+        return len(data)
+
+    @classmethod
+    def nbytes(cls, dataset):
+        return dataset.data.nbytes
+
+    @classmethod
+    def nonzero(cls, dataset):
+        return bool(len(dataset.data))
+
+    @classmethod
+    def reindex(cls, dataset, kdims=None, vdims=None):
+        dims = (dataset.kdims if kdims is None else kdims) + (dataset.vdims if vdims is None else vdims)
+        return dataset.data.select_columns([dataset.get_dimension(d).name for d in dims])
+
+    @classmethod
+    def redim(cls, dataset, dimensions):
+        return dataset.data.rename({k: v.name for k, v in dimensions.items()})
+
+    @classmethod
+    def add_dimension(cls, dataset, dimension, dim_pos, values, vdim):
+        data = dataset.data
+        if not len(data):
+            return data
+        elif values is None or util.isscalar(values):
+            values = np.full(len(data), values)
+        elif not len(values) == len(data):
+            raise ValueError('Added dimension values must be scalar or '
+                             'match the length of the data.')
+        return data.add_scalar(dimension_name(dimension), np.asarray(values))
+
+    @classmethod
+    def vertex_values(cls, dataset, dimension):
+        """
+        Returns the values of a dimension for each vertex of all the
+        geometries, without any separators.
+        """
+        name = dataset.get_dimension(dimension, strict=True).name
+        return dataset.data.expand(name)
+
+    @classmethod
+    def vertex_columns(cls, dataset):
+        """
+        Returns a dictionary of the per-vertex values of all
+        dimensions present on the data, without any separators.
+        """
+        data = dataset.data
+        return OrderedDict((d.name, data.expand(d.name)) for d in dataset.dimensions()
+                           if d.name in data)
+
+    @classmethod
+    def segment_starts(cls, dataset):
+        """
+        Returns the indices of all vertices which start a line segment,
+        i.e. every vertex except the last vertex of each geometry.
+        """
+        data = dataset.data
+        ends = data.offsets[1:][data.lengths > 0] - 1
+        mask = np.ones(data.offsets[-1], dtype=bool)
+        mask[ends] = False
+        return np.flatnonzero(mask)
+
+    @classmethod
+    def _close_rings(cls, dataset, data, values):
+        """
+        Closes the rings of all (multi-)polygons by inserting the
+        start value of each ring after its end if the start and end
+        coordinates do not match, returning the new values and
+        offsets.
+        """
+        xs, ys = (data.expand(kd.name).astype('float') for kd in dataset.kdims[:2])
+        breaks = np.flatnonzero(np.isnan(xs) | np.isnan(ys))
+        starts = np.sort(np.concatenate([data.offsets[:-1][data.lengths > 0], breaks+1]))
+        ends = np.sort(np.concatenate([data.offsets[1:][data.lengths > 0]-1, breaks-1]))
+        unclosed = (xs[starts] != xs[ends]) | (ys[starts] != ys[ends])
+        starts, ends = starts[unclosed], ends[unclosed]
+        inserted = np.bincount(data.geom_index[ends], minlength=len(data))
+        offsets = data.offsets + np.concatenate([[0], np.cumsum(inserted)])
+        return np.insert(values, ends+1, values[starts]), offsets
+
+    @classmethod
+    def values(cls, dataset, dimension, expanded=True, flat=True,
+               compute=True, keep_index=False):
+        """
+        Returns a single concatenated array of all geometries separated
+        by NaN values. If expanded keyword is False an array of arrays
+        is returned.
+        """
+        data = dataset.data
+        if not len(data):
+            return np.array([])
+        elif not data.lengths.all():
+            data = data.take(np.flatnonzero(data.lengths))
+            if not len(data):
+                return np.array([])
+
+        dim = dataset.get_dimension(dimension, strict=True)
+        geom_type = cls.geom_type(dataset)
+        is_points = geom_type == 'Point'
+        is_geom = dim in dataset.kdims[:2]
+        is_ring = geom_type in ('Polygon', 'Ring')
+        if not expanded and not is_geom:
+            if dim.name in data.scalars:
+                return data.scalars[dim.name]
+            scalar = cls._geom_constant(data, data.columns[dim.name])
+            if scalar.all():
+                return data.columns[dim.name][data.offsets[:-1]]
+        else:
+            scalar = np.zeros(len(data), dtype=bool)
+
+        values, offsets = data.expand(dim.name), data.offsets
+        if is_ring and not scalar.all():
+            values, offsets = cls._close_rings(dataset, data, values)
+
+        if not expanded:
+            array = np.empty(len(data), dtype=object)
+            array[:] = np.split(values, offsets[1:-1])
+            starts = offsets[:-1][scalar]
+            for i, start in zip(np.flatnonzero(scalar), starts):
+                array[i] = values[start]
+            return array
+        elif is_points:
+            return values
+
+        # Insert a NaN separator between each of the geometries
+        separator = np.array([np.NaN])
+        dtype = np.concatenate([values[:0], separator]).dtype
+        ngeoms = len(offsets)-1
+        expanded = np.empty(len(values)+ngeoms-1, dtype=dtype)
+        breaks = offsets[1:-1] + np.arange(ngeoms-1)
+        expanded[breaks] = separator[0]
+        inds = np.arange(len(values)) + np.repeat(np.arange(ngeoms), np.diff(offsets))
+        expanded[inds] = values
+        return expanded
+
+    @classmethod
+    def split(cls, dataset, start, end, datatype, **kwargs):
+        """
+        Splits a packed Dataset into regular Datasets using regular
+        tabular interfaces.
+        """
+        from ...element import Polygons
+        data = dataset.data.take(slice(start, end))
+        if datatype is None:
+            return [dataset.clone(data.take(i)) for i in range(len(data))]
+        elif not len(data):
+            return []
+
+        geom_type = cls.geom_type(dataset)
+        dims = [dataset.get_dimension(d) for d in kwargs.get('dimensions', [])] or dataset.dimensions()
+        splits = data.offsets[1:-1]
+        if datatype == 'array':
+            array = np.column_stack([data.expand(d.name) for d in dims])
+            return np.split(array, splits)
+        elif datatype == 'dataframe':
+            df = util.pd.DataFrame(OrderedDict((d.name, data.expand(d.name)) for d in dims))
+            return [df.iloc[s:e].reset_index(drop=True) for s, e in
+                    zip(data.offsets[:-1], data.offsets[1:])]
+        elif datatype not in ('columns', 'dictionary'):
+            raise ValueError("%s datatype not support" % datatype)
+
+        objs = [OrderedDict() for _ in range(len(data))]
+        for d in dataset.dimensions():
+            if d.name in data.scalars:
+                values = data.scalars[d.name]
+            elif d.name in data.columns:
+                values = np.split(data.columns[d.name], splits)
+            else:
+                continue
+            for obj, v in zip(objs, values):
+                obj[d.name] = v
+        if data.holes is not None:
+            for obj, holes in zip(objs, data.holes):
+                if holes is not None:
+                    obj[Polygons._hole_key] = holes
+        if geom_type is not None:
+            for obj in objs:
+                obj['geom_type'] = geom_type
+        return objs
+
+    @classmethod
+    def iloc(cls, dataset, index):
+        rows, cols = index
+        data = dataset.data
+        scalar = np.isscalar(cols) and np.isscalar(rows)
+        dims = dataset.dimensions()
+        if isinstance(cols, slice):
+            cols = dims[cols]
+        else:
+            cols = [dims[c] if isinstance(c, int) else dataset.get_dimension(c)
+                    for c in (cols if isinstance(cols, list) else [cols])]
+        names = [d.name for d in cols]
+
+        if cls.geom_type(dataset) != 'Point':
+            return data.take(rows).select_columns(names)
+
+        rows = np.atleast_1d(np.arange(data.offsets[-1])[rows])
+        if scalar:
+            return data.expand(names[0])[rows[0]]
+        # Group the selected vertices by geometry retaining their order
+        rows = rows[np.argsort(data.geom_index[rows], kind='mergesort')]
+        return data.take_vertices(rows).select_columns(names)
+
+
+Interface.register(PackedInterface)
@@ -22,6 +22,8 @@ class PandasInterface(Interface):
 
     datatype = 'dataframe'
 
+    lazy_groupby = True
+
     @classmethod
     def dimension_type(cls, dataset, dim):
         name = dataset.get_dimension(dim, strict=True).name
@@ -156,6 +158,11 @@ class PandasInterface(Interface):
                             "not found: %s" % repr(not_found), cls)
 
 
+    @classmethod
+    def nbytes(cls, dataset):
+        return int(dataset.data.memory_usage(index=True).sum())
+
+
     @classmethod
     def range(cls, dataset, dimension):
         column = dataset.data[dataset.get_dimension(dimension, strict=True).name]
@@ -173,6 +180,24 @@ class PandasInterface(Interface):
             return (column.min(), column.max())
 
 
+    @classmethod
+    def ranges(cls, dataset, dimensions):
+        if not isinstance(dataset.data, pd.DataFrame):
+            return super(PandasInterface, cls).ranges(dataset, dimensions)
+        dimensions = [dataset.get_dimension(d, strict=True) for d in dimensions]
+        df = dataset.data
+        numeric = [d.name for d in dimensions if df[d.name].dtype.kind != 'O']
+        if numeric:
+            agg = df[numeric].agg(['min', 'max'])
+        ranges = cyODict()
+        for d in dimensions:
+            if d.name in numeric:
+                ranges[d.name] = (agg[d.name].iloc[0], agg[d.name].iloc[1])
+            else:
+                ranges[d.name] = cls.range(dataset, d)
+        return ranges
+
+
     @classmethod
     def concat_fn(cls, dataframes, **kwargs):
         if util.pandas_version >= '0.23.0':
@@ -192,7 +217,8 @@ class PandasInterface(Interface):
 
 
     @classmethod
-    def groupby(cls, dataset, dimensions, container_type, group_type, **kwargs):
+    def groupby(cls, dataset, dimensions, container_type, group_type,
+                lazy=False, **kwargs):
         index_dims = [dataset.get_dimension(d, strict=True) for d in dimensions]
         element_dims = [kdim for kdim in dataset.kdims
                         if kdim not in index_dims]
@@ -207,6 +233,10 @@ class PandasInterface(Interface):
         group_kwargs['dataset'] = dataset.dataset
 
         group_by = [d.name for d in index_dims]
+        if lazy and issubclass(container_type, NdMapping):
+            return cls._lazy_groupby(dataset.data, group_by, index_dims, container_type,
+                                     group_type, group_kwargs)
+
         data = [(k, group_type(v, **group_kwargs)) for k, v in
                 dataset.data.groupby(group_by, sort=False)]
         if issubclass(container_type, NdMapping):
@@ -216,6 +246,36 @@ class PandasInterface(Interface):
             return container_type(data)
 
 
+    @classmethod
+    def _lazy_groupby(cls, df, group_by, index_dims, container_type,
+                      group_type, group_kwargs):
+        """
+        Groups the DataFrame by computing the row indices of each
+        group with a single stable argsort of the group codes and
+        returns a container which only constructs the group for a
+        key once it is accessed.
+        """
+        grouped = df.groupby(group_by, sort=False)
+        codes = grouped.ngroup().values
+        if codes.dtype.kind == 'f':
+            # Rows with missing keys are dropped by the groupby and
+            # depending on the pandas version are numbered NaN or -1
+            codes = np.where(np.isnan(codes), -1, codes)
+        codes = codes.astype('int64')
+        order = np.argsort(codes, kind='mergesort')
+
+        # Sizes are ordered by group number, rows with missing keys
+        # are numbered -1 and therefore sort to the front
+        sizes = grouped.size()
+        counts = sizes.values
+        offsets = np.concatenate([[0], np.cumsum(counts)]) + (len(codes) - counts.sum())
+        items = ((util.wrap_tuple(k), order[start:end]) for k, start, end, count
+                 in zip(sizes.index, offsets[:-1], offsets[1:], counts) if count)
+        data = util.LazyOrderedDict(items, lambda key, idx: group_type(df.iloc[idx], **group_kwargs))
+        with item_check(False), sorted_context(False):
+            return container_type(data, kdims=index_dims)
+
+
     @classmethod
     def aggregate(cls, dataset, dimensions, function, **kwargs):
         data = dataset.data
@@ -284,6 +284,10 @@ class SpatialPandasInterface(MultiInterface):
                 length += (len(geom.buffer_values)//2)
         return length
 
+    @classmethod
+    def nbytes(cls, dataset):
+        return PandasInterface.nbytes(dataset)
+
     @classmethod
     def nonzero(cls, dataset):
         return bool(cls.length(dataset))
@@ -573,6 +573,10 @@ class XArrayInterface(GridInterface):
     def length(cls, dataset):
         return np.product([len(dataset.data[d.name]) for d in dataset.kdims], dtype=np.intp)
 
+    @classmethod
+    def nbytes(cls, dataset):
+        return dataset.data.nbytes
+
     @classmethod
     def dframe(cls, dataset, dimensions):
         import xarray as xr
@@ -14,12 +14,13 @@ Archives: A collection of HoloViews objects that are first collected
 """
 from __future__ import absolute_import
 
-import re, os, time, string, zipfile, tarfile, shutil, itertools, pickle
+import re, os, time, string, zipfile, tarfile, shutil, itertools, pickle, struct
 from collections import defaultdict
 
 from io import BytesIO
 from hashlib import sha256
 
+import numpy as np
 import param
 from param.parameterized import bothmethod
 
@@ -27,7 +28,8 @@ from .dimension import LabelledData
 from .element import Collator, Element
 from .overlay import Overlay, Layout
 from .ndmapping import OrderedDict, NdMapping, UniformNdMapping
-from .options import Store
+from .options import Store, StoreOptions
+from .spaces import HoloMap
 from .util import unique_iterator, group_sanitizer, label_sanitizer
 
 
@@ -335,7 +337,7 @@ class Pickler(Exporter):
         base_info = {'file-ext': 'hvz', 'mime_type':self_or_cls.mime_type}
         key = self_or_cls._merge_metadata(obj, self_or_cls.key_fn, key)
         info = self_or_cls._merge_metadata(obj, self_or_cls.info_fn, info, base_info)
-        compression = zipfile.ZIP_STORED if self_or_cls.compress else zipfile.ZIP_DEFLATED
+        compression = zipfile.ZIP_DEFLATED if self_or_cls.compress else zipfile.ZIP_STORED
 
         filename = self_or_cls._filename(filename) if isinstance(filename, str) else filename
         with zipfile.ZipFile(filename, 'w', compression=compression) as f:
@@ -467,6 +469,243 @@ class Unpickler(Importer):
 
 
 
+class _BufferPickler(pickle.Pickler):
+    """
+    Pickler that hands large numeric arrays to the supplied callback
+    instead of serializing them inline, storing a persistent reference
+    to the buffer in their place.
+    """
+
+    def __init__(self, file, protocol, offload, threshold):
+        pickle.Pickler.__init__(self, file, protocol)
+        self._offload = offload
+        self._threshold = threshold
+        self._buffers = {}
+
+    def persistent_id(self, obj):
+        if type(obj) not in (np.ndarray, np.memmap):
+            return None
+        elif obj.dtype.hasobject or obj.nbytes < self._threshold:
+            return None
+        if id(obj) not in self._buffers:
+            self._buffers[id(obj)] = (self._offload(obj), obj)
+        return self._buffers[id(obj)][0]
+
+
+
+class _BufferUnpickler(pickle.Unpickler):
+    """
+    Inverse of _BufferPickler resolving persistent buffer references
+    using the supplied callback.
+    """
+
+    def __init__(self, file, load):
+        pickle.Unpickler.__init__(self, file)
+        self._load = load
+
+    def persistent_load(self, pid):
+        return self._load(pid)
+
+
+
+class FramePickler(Pickler):
+    """
+    Pickler writing a .hvf file, a zip archive which stores the
+    metadata of HoloViews objects separately from the raw array
+    buffers backing them.
+
+    Each array above the buffer_threshold is written uncompressed as
+    a separate .npy member, which allows the FrameUnpickler to memory
+    map the buffers directly from the archive. HoloMaps are split into
+    one entry per frame, so that individual keys may be loaded lazily
+    and new frames may be appended to an existing archive without
+    rewriting it.
+    """
+
+    buffer_threshold = param.Integer(default=1024, bounds=(0, None), doc="""
+        Arrays smaller than this number of bytes are pickled inline
+        with the element metadata rather than stored as separate
+        buffers.""")
+
+    file_ext = 'hvf'
+
+    def __call__(self, obj, key={}, info={}, **kwargs):
+        buff = BytesIO()
+        self.save(obj, buff, key=key, info=info, **kwargs)
+        buff.seek(0)
+        return buff.read(), {'file-ext': 'hvf', 'mime_type':self.mime_type}
+
+    @bothmethod
+    def save(self_or_cls, obj, filename, key={}, info={}, **kwargs):
+        base_info = {'file-ext': 'hvf', 'mime_type':self_or_cls.mime_type}
+        key = self_or_cls._merge_metadata(obj, self_or_cls.key_fn, key)
+        info = self_or_cls._merge_metadata(obj, self_or_cls.info_fn, info, base_info)
+        compression = zipfile.ZIP_DEFLATED if self_or_cls.compress else zipfile.ZIP_STORED
+
+        filename = self_or_cls._filename(filename) if isinstance(filename, str) else filename
+        with zipfile.ZipFile(filename, 'w', compression=compression) as f:
+            if isinstance(obj, HoloMap):
+                self_or_cls._dumps(f, 'map', obj.clone([]))
+                self_or_cls._write_frames(f, obj, 0)
+            else:
+                self_or_cls._dumps(f, 'object', obj)
+            f.writestr('metadata',
+                       pickle.dumps({'info':info, 'key':key}))
+
+    @bothmethod
+    def append(self_or_cls, obj, filename):
+        """
+        Appends the frames of the supplied HoloMap to an existing .hvf
+        file holding a HoloMap with the same key dimensions. Frames
+        with keys already present in the archive supersede the
+        existing frames when loaded.
+        """
+        if not isinstance(obj, HoloMap):
+            raise ValueError('Only HoloMap frames may be appended to '
+                             'a %s file.' % self_or_cls.file_ext)
+        compression = zipfile.ZIP_DEFLATED if self_or_cls.compress else zipfile.ZIP_STORED
+        with zipfile.ZipFile(filename, 'a', compression=compression) as f:
+            names = f.namelist()
+            if 'map' not in names:
+                raise ValueError('Frames can only be appended to a file '
+                                 'holding a HoloMap.')
+            skeleton = Store.loads(f.read('map'))
+            if skeleton.kdims != obj.kdims:
+                raise ValueError('Appended HoloMap key dimensions %s do not '
+                                 'match the stored key dimensions %s.'
+                                 % (obj.kdims, skeleton.kdims))
+            nframes = len([n for n in names if n.startswith('frames/')
+                           and n.endswith('/key')])
+            self_or_cls._write_frames(f, obj, nframes)
+
+    @bothmethod
+    def _write_frames(self_or_cls, zf, obj, start):
+        for i, (k, el) in enumerate(obj.data.items(), start):
+            zf.writestr('frames/%d/key' % i,
+                        pickle.dumps(k, protocol=self_or_cls.protocol))
+            self_or_cls._dumps(zf, 'frames/%d/element' % i, el)
+
+    @bothmethod
+    def _dumps(self_or_cls, zf, entry, obj):
+        """
+        Pickles the object into the supplied entry, writing each array
+        buffer to an uncompressed .npy member alongside it.
+        """
+        counter = itertools.count()
+        def offload(arr):
+            name = '%s.%d.npy' % (entry, next(counter))
+            buff = BytesIO()
+            np.lib.format.write_array(buff, arr, allow_pickle=False)
+            zf.writestr(zipfile.ZipInfo(name), buff.getvalue(),
+                        compress_type=zipfile.ZIP_STORED)
+            return name
+
+        buff = BytesIO()
+        pickler = _BufferPickler(buff, self_or_cls.protocol, offload,
+                                 self_or_cls.buffer_threshold)
+        Store.save_option_state = True
+        try:
+            pickler.dump(obj)
+        finally:
+            Store.save_option_state = False
+        zf.writestr(entry, buff.getvalue())
+
+
+
+class FrameUnpickler(Unpickler):
+    """
+    The inverse of FramePickler used to load the .hvf file format.
+
+    When loading from a path the array buffers are memory mapped from
+    the archive (copy-on-write) rather than read into memory, and the
+    keys argument allows loading only a subset of the frames of a
+    stored HoloMap.
+    """
+
+    def __call__(self, data, keys=None):
+        buff = BytesIO(data)
+        return self.load(buff, keys=keys)
+
+    @bothmethod
+    def load(self_or_cls, filename, keys=None, mmap=True):
+        with zipfile.ZipFile(filename, 'r') as f:
+            names = f.namelist()
+            path = filename if mmap and isinstance(filename, str) else None
+            if 'map' not in names:
+                if keys is not None:
+                    raise ValueError('Keys may only be selected when '
+                                     'loading a HoloMap.')
+                return self_or_cls._loads(f, 'object', path)
+            skeleton = self_or_cls._loads(f, 'map', path)
+            if keys is not None:
+                keys = [k if isinstance(k, tuple) else (k,) for k in keys]
+            frames = OrderedDict()
+            for i, key in self_or_cls._frame_keys(f):
+                if keys is None or key in keys:
+                    frames[key] = i
+            data = [(k, self_or_cls._loads(f, 'frames/%d/element' % i, path))
+                    for k, i in frames.items()]
+        return skeleton.clone(data)
+
+    @bothmethod
+    def frames(self_or_cls, filename):
+        """
+        Returns the list of HoloMap keys stored in the file.
+        """
+        with zipfile.ZipFile(filename, 'r') as f:
+            return list(unique_iterator(k for _, k in self_or_cls._frame_keys(f)))
+
+    @bothmethod
+    def entries(self_or_cls, filename):
+        with zipfile.ZipFile(filename, 'r') as f:
+            return [el for el in f.namelist() if el in ('map', 'object')]
+
+    @classmethod
+    def _frame_keys(cls, zf):
+        indexes = sorted(int(n.split('/')[1]) for n in zf.namelist()
+                         if n.startswith('frames/') and n.endswith('/key'))
+        return [(i, pickle.loads(zf.read('frames/%d/key' % i)))
+                for i in indexes]
+
+    @classmethod
+    def _loads(cls, zf, entry, path=None):
+        def load(name):
+            if path is None:
+                return np.lib.format.read_array(BytesIO(zf.read(name)))
+            return cls._memmap(zf, name, path)
+
+        unpickler = _BufferUnpickler(BytesIO(zf.read(entry)), load)
+        Store.load_counter_offset = StoreOptions.id_offset()
+        try:
+            return unpickler.load()
+        finally:
+            Store.load_counter_offset = None
+
+    @classmethod
+    def _memmap(cls, zf, name, path):
+        """
+        Memory maps an uncompressed .npy member of the archive by
+        locating the array data behind the zip and npy headers.
+        """
+        info = zf.getinfo(name)
+        with open(path, 'rb') as f:
+            f.seek(info.header_offset)
+            header = f.read(30)
+            name_len, extra_len = struct.unpack('<HH', header[26:30])
+            f.seek(info.header_offset+30+name_len+extra_len)
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+            offset = f.tell()
+        if not np.prod(shape):
+            return np.zeros(shape, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode='c', offset=offset,
+                         shape=shape, order='F' if fortran else 'C')
+
+
+
 class Archive(param.Parameterized):
     """
     An Archive is a means to collect and store a collection of
@@ -112,10 +112,16 @@ class MultiDimensionalMapping(Dimensioned):
         if isinstance(initial_items, tuple):
             self._add_item(initial_items[0], initial_items[1])
         elif not self._check_items:
+            if isinstance(initial_items, MultiDimensionalMapping):
+                initial_items = initial_items.data
+            if isinstance(initial_items, util.LazyOrderedDict):
+                # Keys are already validated, keep the values unbuilt
+                self.data = initial_items.copy()
+                if self.sort:
+                    self._resort()
+                return
             if isinstance(initial_items, dict):
                 initial_items = initial_items.items()
-            elif isinstance(initial_items, MultiDimensionalMapping):
-                initial_items = initial_items.data.items()
             self.data = OrderedDict((k if isinstance(k, tuple) else (k,), v)
                                     for k, v in initial_items)
             if self.sort:
@@ -245,6 +251,11 @@ class MultiDimensionalMapping(Dimensioned):
 
 
     def _resort(self):
+        if isinstance(self.data, util.LazyOrderedDict):
+            keys = OrderedDict.fromkeys(self.data)
+            items = dimension_sort(keys, self.kdims, [], range(self.ndims))
+            self.data = self.data.copy([k for k, _ in items])
+            return
         self.data = OrderedDict(dimension_sort(self.data, self.kdims, self.vdims,
                                                range(self.ndims)))
 
@@ -452,7 +463,7 @@ class MultiDimensionalMapping(Dimensioned):
     @property
     def last(self):
         "Returns the item highest data item along the map dimensions."
-        return list(self.data.values())[-1] if len(self) else None
+        return self.data[next(reversed(self.data))] if len(self) else None
 
 
     @property
@@ -661,15 +672,15 @@ class NdMapping(MultiDimensionalMapping):
             return self._dataslice(self.data[map_slice], data_slice)
         else:
             conditions = self._generate_conditions(map_slice)
-            items = self.data.items()
+            keys = list(self.data.keys())
             for cidx, (condition, dim) in enumerate(zip(conditions, self.kdims)):
                 values = dim.values
-                items = [(k, v) for k, v in items
-                         if condition(values.index(k[cidx])
-                                      if values else k[cidx])]
+                keys = [k for k in keys
+                        if condition(values.index(k[cidx])
+                                     if values else k[cidx])]
             sliced_items = []
-            for k, v in items:
-                val_slice = self._dataslice(v, data_slice)
+            for k in keys:
+                val_slice = self._dataslice(self.data[k], data_slice)
                 if val_slice or isinstance(val_slice, tuple):
                     sliced_items.append((k, val_slice))
             if len(sliced_items) == 0:
@@ -999,7 +1010,7 @@ class UniformNdMapping(NdMapping):
     def type(self):
         "The type of elements stored in the mapping."
         if self._type is None and len(self):
-            self._type = self.values()[0].__class__
+            self._type = self.data[next(iter(self.data))].__class__
         return self._type
 
 
@@ -38,6 +38,7 @@ import difflib
 import inspect
 from contextlib import contextmanager
 from collections import defaultdict
+from weakref import WeakKeyDictionary
 
 import numpy as np
 
@@ -71,6 +72,7 @@ def cleanup_custom_options(id, weakref=None):
             for bk in Store.loaded_backends():
                 if id in Store._custom_options[bk]:
                     Store._custom_options[bk].pop(id)
+            OptionTree.clear_cache()
         if not weakrefs:
             Store._weakrefs.pop(id, None)
     except Exception as e:
@@ -613,6 +615,12 @@ class OptionTree(AttrTree):
     approach method may only be used with the group lists format.
     """
 
+    # Caches of the Options resolved by closest for each tree, keyed by
+    # backend, object type, group and label and the option group.
+    # Cleared whenever an existing OptionTree is mutated, since trees
+    # may inherit options from other trees.
+    _option_cache = WeakKeyDictionary()
+
     def __init__(self, items=None, identifier=None, parent=None,
                  groups=None, options=None, **kwargs):
 
@@ -623,7 +631,6 @@ class OptionTree(AttrTree):
         self.__dict__['groups'] = _groups
         self.__dict__['_instantiated'] = False
         AttrTree.__init__(self, items, identifier, parent)
-        self.__dict__['_instantiated'] = True
 
         options = StoreOptions.merge_options(_groups.keys(), options, **kwargs)
         root_groups = options.pop('.', None)
@@ -634,6 +641,7 @@ class OptionTree(AttrTree):
                             "the root node '.' syntax not used in the options.")
         if options:
             StoreOptions.apply_customizations(options, self)
+        self.__dict__['_instantiated'] = True
 
 
     def _merge_options(self, identifier, group_name, options):
@@ -694,7 +702,16 @@ class OptionTree(AttrTree):
         return self[identifier]
 
 
+    @classmethod
+    def clear_cache(cls):
+        "Clears the cache of resolved options across all OptionTrees."
+        cls._option_cache.clear()
+
+
     def __setattr__(self, identifier, val):
+        # A tree under construction cannot affect any resolved options
+        if self._instantiated:
+            self.clear_cache()
         identifier = sanitize_identifier(identifier, escape=False)
         new_groups = {}
         if isinstance(val, dict):
@@ -730,6 +747,11 @@ class OptionTree(AttrTree):
                 self[identifier].__setattr__(subtree.identifier, subtree)
 
 
+    def __delitem__(self, identifier):
+        self.clear_cache()
+        super(OptionTree, self).__delitem__(identifier)
+
+
     def find(self, path, mode='node'):
         """
         Find the closest node or path to an the arbitrary path that is
@@ -761,12 +783,20 @@ class OptionTree(AttrTree):
         In addition, closest supports custom options by checking the
         object
         """
+        key = (Store.current_backend if backend is None else backend,
+               obj.__class__.__name__, obj.group, obj.label, group, defaults)
+        cache = self._option_cache.setdefault(self, {})
+        if key in cache:
+            return cache[key]
+
         components = (obj.__class__.__name__,
                       group_sanitizer(obj.group),
                       label_sanitizer(obj.label))
         target = '.'.join([c for c in components if c])
-        return self.find(components).options(group, target=target,
-                                             defaults=defaults, backend=backend)
+        options = self.find(components).options(group, target=target,
+                                                defaults=defaults, backend=backend)
+        cache[key] = options
+        return options
 
 
 
@@ -1159,6 +1189,7 @@ class Store(object):
         if val is None:
             return cls._options[backend]
         else:
+            OptionTree.clear_cache()
             cls._options[backend] = val
 
     @classmethod
@@ -1175,6 +1206,7 @@ class Store(object):
         if val is None:
             return cls._custom_options[backend]
         else:
+            OptionTree.clear_cache()
             cls._custom_options[backend] = val
 
     @classmethod
@@ -1328,6 +1360,7 @@ class Store(object):
         Register the supplied dictionary of associations between
         elements and plotting classes to the specified backend.
         """
+        OptionTree.clear_cache()
         if backend not in cls.registry:
             cls.registry[backend] = {}
         cls.registry[backend].update(associations)
@@ -1814,6 +1847,7 @@ class StoreOptions(object):
 
         # {'Image.Channel:{'plot':  Options(size=50),
         #                  'style': Options('style', cmap='Blues')]}
+        OptionTree.clear_cache()
         options = cls.merge_options(Store.options(backend=backend).groups.keys(), options, **kwargs)
         spec, compositor_applied = cls.expand_compositor_keys(options)
         custom_trees, id_mapping = cls.create_custom_trees(obj, spec)
@@ -1,6 +1,7 @@
 import itertools
 import types
 import inspect
+import threading
 
 from numbers import Number
 from itertools import groupby
@@ -8,6 +9,7 @@ from functools import partial
 from collections import defaultdict
 from contextlib import contextmanager
 from types import FunctionType
+from weakref import WeakKeyDictionary
 
 import numpy as np
 import param
@@ -764,6 +766,11 @@ def get_nested_streams(dmap):
     return list({s for dmap in get_nested_dmaps(dmap) for s in dmap.streams})
 
 
+# Reentrant locks serializing the evaluation of DynamicMaps by Callable
+_evaluation_locks = WeakKeyDictionary()
+_evaluation_locks_lock = threading.Lock()
+
+
 @contextmanager
 def dynamicmap_memoization(callable_obj, streams):
     """
@@ -871,6 +878,12 @@ class DynamicMap(HoloMap):
        cache where the least recently used item is overwritten once
        the cache is full.""")
 
+    cache_bytes = param.Integer(default=None, allow_None=True, bounds=(0, None), doc="""
+       Optional memory budget for the cache in bytes. If set, the
+       least recently used items are evicted until the combined size
+       of the cached data, as reported by the data interfaces, fits
+       within the budget.""")
+
     def __init__(self, callback, initial_items=None, streams=None, **params):
         streams = (streams or [])
 
@@ -913,6 +926,33 @@ class DynamicMap(HoloMap):
                 stream.source = self
         self.redim = Redim(self, mode='dynamic')
         self.periodic = periodic(self)
+        self._cache_order = OrderedDict()
+        self._cache_nbytes = 0
+        self._cache_stats = dict(hits=0, misses=0, evictions=0)
+
+    @property
+    def cache_info(self):
+        """
+        Returns a dictionary of the number of cache hits, misses and
+        evictions along with the current number of cached items and
+        the number of bytes they hold (if cache_bytes is set).
+        """
+        nbytes = sum(v for k, v in self._cache_order.items() if k in self.data)
+        return dict(self._cache_stats, size=len(self), nbytes=nbytes)
+
+    @property
+    def _lock(self):
+        """
+        Lock serializing the evaluation of the DynamicMap and the
+        updates to its cache, e.g. when a plot evaluates it on a worker
+        thread. DynamicMaps sharing a Callable share the lock since
+        they share its memoization state.
+        """
+        with _evaluation_locks_lock:
+            lock = _evaluation_locks.get(self.callback)
+            if lock is None:
+                lock = _evaluation_locks[self.callback] = threading.RLock()
+        return lock
 
     @property
     def unbounded(self):
@@ -1136,7 +1176,11 @@ class DynamicMap(HoloMap):
 
     def reset(self):
         "Clear the DynamicMap cache"
-        self.data = OrderedDict()
+        with self._lock:
+            self.data = OrderedDict()
+            self._cache_order = OrderedDict()
+            self._cache_nbytes = 0
+            self._cache_stats = dict(hits=0, misses=0, evictions=0)
         return self
 
 
@@ -1242,6 +1286,12 @@ class DynamicMap(HoloMap):
             otherwise returns cloned DynamicMap containing the cross-
             product of evaluated items.
         """
+        with self._lock:
+            return self._getitem(key)
+
+
+    def _getitem(self, key):
+        "Evaluates the DynamicMap with the specified key, see __getitem__."
         # Split key dimensions and data slices
         sample = False
         if key is Ellipsis:
@@ -1276,7 +1326,15 @@ class DynamicMap(HoloMap):
             return product
 
         # Not a cross product and nothing cached so compute element.
-        if cache is not None: return cache
+        if cache is not None:
+            self._cache_stats['hits'] += 1
+            typed_key = self._cache_key(tuple_key)
+            if typed_key in self._cache_order:
+                # Mark as most recently used (OrderedDict.move_to_end
+                # is not available on Python 2)
+                self._cache_order[typed_key] = self._cache_order.pop(typed_key)
+            return cache
+        self._cache_stats['misses'] += 1
         val = self._execute_callback(*tuple_key)
         if data_slice:
             val = self._dataslice(val, data_slice)
@@ -1346,13 +1404,45 @@ class DynamicMap(HoloMap):
     def _cache(self, key, val):
         """
         Request that a key/value pair be considered for caching.
+        Evicts the least recently used items until the cache_size and
+        cache_bytes limits are satisfied.
         """
         cache_size = (1 if util.dimensionless_contents(self.streams, self.kdims)
                       else self.cache_size)
-        if len(self) >= cache_size:
-            first_key = next(k for k in self.data)
-            self.data.pop(first_key)
+        if self.cache_bytes is None:
+            nbytes = 0
+        else:
+            nbytes = sum(val.traverse(lambda x: x.interface.nbytes(x),
+                                      [lambda x: hasattr(x, 'interface')]))
+
+        order = self._cache_order
+        if len(order) != len(self.data):
+            # Drop entries which were removed from the data by other
+            # means and track items not inserted via the cache, which
+            # are evicted first
+            tracked = [(k, v) for k, v in order.items() if k in self.data]
+            order = OrderedDict([(k, 0) for k in self.data if k not in order]+tracked)
+            self._cache_order = order
+            self._cache_nbytes = sum(order.values())
+        while order and (len(order) >= cache_size or (self.cache_bytes is not None
+                         and self._cache_nbytes + nbytes > self.cache_bytes)):
+            evict_key, evict_bytes = order.popitem(last=False)
+            self.data.pop(evict_key, None)
+            self._cache_nbytes -= evict_bytes
+            self._cache_stats['evictions'] += 1
         self[key] = val
+        typed_key = self._cache_key(key)
+        self._cache_nbytes += nbytes - order.pop(typed_key, 0)
+        order[typed_key] = nbytes
+
+
+    def _cache_key(self, key):
+        """
+        Applies the key dimension types to a key, matching the key
+        the item is stored under in the data.
+        """
+        dim_types = zip([kd.type for kd in self.kdims], util.wrap_tuple(key))
+        return tuple(v if None in [t, v] else t(v) for t, v in dim_types)
 
 
     def map(self, map_fn, specs=None, clone=True, link_inputs=True):
@@ -2,8 +2,10 @@ import sys, warnings, operator
 import json
 import time
 import types
+import hashlib
 import numbers
 import inspect
+import weakref
 import itertools
 import string
 import unicodedata
@@ -29,9 +31,9 @@ if sys.version_info.major >= 3:
     import builtins as builtins   # noqa (compatibility)
 
     if sys.version_info.minor > 3:
-        from collections.abc import Iterable # noqa (compatibility)
+        from collections.abc import Iterable, ItemsView, ValuesView # noqa (compatibility)
     else:
-        from collections import Iterable # noqa (compatibility)
+        from collections import Iterable, ItemsView, ValuesView # noqa (compatibility)
 
     basestring = str
     unicode = str
@@ -44,7 +46,7 @@ if sys.version_info.major >= 3:
     LooseVersion = _LooseVersion
 else:
     import __builtin__ as builtins # noqa (compatibility)
-    from collections import Iterable # noqa (compatibility)
+    from collections import Iterable, ItemsView, ValuesView # noqa (compatibility)
 
     basestring = basestring
     unicode = unicode
@@ -113,6 +115,11 @@ try:
     datetime_types += cftime_types
 except:
     cftime_types = ()
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 _STANDARD_CALENDARS = set(['standard', 'gregorian', 'proleptic_gregorian'])
 
 
@@ -183,6 +190,9 @@ class HashableJSON(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, set):
             return hash(frozenset(obj))
+        fp = fingerprint(obj)
+        if fp is not None:
+            return hash(fp)
         elif isinstance(obj, np.ndarray):
             return obj.tolist()
         if pd and isinstance(obj, (pd.Series, pd.DataFrame)):
@@ -342,12 +352,132 @@ class periodic(Thread):
 
 
 
+# Fingerprints of read-only arrays by id, which are assumed not to change
+_fingerprint_cache = {}
+
+def _buffer_hash(arr):
+    """
+    Computes a 64-bit hash of the raw buffer of an array, using the
+    fast non-cryptographic xxhash if available and otherwise blake2b
+    (or md5 on Python 2) from hashlib.
+    """
+    buf = np.ascontiguousarray(arr).reshape(-1).view(np.uint8)
+    if xxhash is not None:
+        return xxhash.xxh64(buf).intdigest()
+    elif hasattr(hashlib, 'blake2b'):
+        return int(hashlib.blake2b(buf, digest_size=8).hexdigest(), 16)
+    return int(hashlib.md5(buf).hexdigest(), 16)
+
+
+def _is_readonly(arr):
+    """
+    Whether the array and the arrays it is a view on are read-only and
+    the underlying memory is owned by an immutable object.
+    """
+    while isinstance(arr, np.ndarray):
+        if arr.flags.writeable:
+            return False
+        arr = arr.base
+    return arr is None or isinstance(arr, bytes)
+
+
+def _array_fingerprint(arr):
+    key = id(arr)
+    if key in _fingerprint_cache:
+        ref, fp = _fingerprint_cache[key]
+        if ref() is arr:
+            return fp
+    if arr.dtype.kind == 'O':
+        if pd is None:
+            return None
+        try:
+            hashed = pd.util.hash_array(arr.reshape(-1))
+        except TypeError:
+            return None
+    else:
+        hashed = arr
+    fp = ('ndarray', arr.dtype.str, arr.shape, _buffer_hash(hashed))
+    if _is_readonly(arr):
+        ref = weakref.ref(arr, lambda r, k=key: _fingerprint_cache.pop(k, None))
+        _fingerprint_cache[key] = (ref, fp)
+    return fp
+
+
+def _pandas_values_fingerprint(obj):
+    "Fingerprints the values of a pandas Series or Index."
+    values = obj.values
+    if isinstance(values, np.ndarray) and values.dtype.kind != 'O':
+        return (str(obj.dtype), _array_fingerprint(values))
+    try:
+        hashed = pd.util.hash_pandas_object(obj, index=False).values
+    except TypeError:
+        return None
+    return (str(obj.dtype), _buffer_hash(hashed))
+
+
+def _pandas_fingerprint(obj):
+    if isinstance(obj, pd.RangeIndex):
+        return (type(obj).__name__, obj.name, obj.start, obj.stop, obj.step)
+    elif isinstance(obj, pd.Index):
+        meta, fps = tuple(obj.names), [_pandas_values_fingerprint(obj)]
+    elif isinstance(obj, pd.Series):
+        meta = obj.name
+        fps = [_pandas_values_fingerprint(obj), _pandas_fingerprint(obj.index)]
+    else:
+        meta = tuple(obj.columns)
+        fps = [_pandas_fingerprint(obj.index)]
+        fps += [_pandas_values_fingerprint(col) for _, col in obj.items()]
+    if any(fp is None for fp in fps):
+        return None
+    return (type(obj).__name__, meta)+tuple(fps)
+
+
+def fingerprint(obj):
+    """
+    Computes a cheap content fingerprint for NumPy arrays, pandas,
+    xarray and dask objects by hashing their raw buffers with a fast
+    non-cryptographic hash, avoiding any conversion of the data. Lazy
+    dask objects are identified by their graph token and the
+    fingerprints of read-only arrays are cached. Returns None if the
+    object type is not supported.
+    """
+    if isinstance(obj, np.ndarray):
+        return _array_fingerprint(obj)
+    elif pd and isinstance(obj, (pd.DataFrame, pd.Series, pd.Index)):
+        return _pandas_fingerprint(obj)
+    elif is_dask_array(obj):
+        return (type(obj).__name__, obj.name)
+    elif is_dataframe(obj) or is_series(obj):
+        return (type(obj).__name__, obj._name)
+    elif 'xarray' in sys.modules:
+        import xarray as xr
+        if isinstance(obj, xr.DataArray):
+            variables = [(obj.name, obj.variable)]
+            variables += [(k, v.variable) for k, v in obj.coords.items()]
+        elif isinstance(obj, xr.Dataset):
+            variables = list(obj.variables.items())
+        else:
+            return None
+        fps = []
+        for name, var in variables:
+            fp = fingerprint(var.data)
+            if fp is None:
+                return None
+            fps.append((name, var.dims, fp))
+        return (type(obj).__name__, tuple(fps))
+    return None
+
+
 def deephash(obj):
     """
-    Given an object, return a hash using HashableJSON. This hash is not
-    architecture, Python version or platform independent.
+    Given an object, return a hash using HashableJSON. Arrays and
+    dataframes are hashed using their content fingerprint. This hash
+    is not architecture, Python version or platform independent.
     """
     try:
+        fp = fingerprint(obj)
+        if fp is not None:
+            return hash(fp)
         return hash(json.dumps(obj, cls=HashableJSON, sort_keys=True))
     except:
         return None
@@ -1228,6 +1358,87 @@ def merge_dimensions(dimensions_list):
     return [d.clone(values=dvalues.get(d.name, [])) for d in dimensions]
 
 
+class _LazyValue(object):
+    """
+    Placeholder for a LazyOrderedDict value which has not been built
+    yet. Copies of a LazyOrderedDict share the placeholders, so the
+    value is stored on the placeholder once built to avoid building it
+    again in each copy.
+    """
+
+    __slots__ = ['arg', 'value', 'built']
+
+    def __init__(self, arg):
+        self.arg = arg
+        self.value = None
+        self.built = False
+
+    def build(self, factory, key):
+        if not self.built:
+            self.value = factory(key, self.arg)
+            self.built = True
+            self.arg = None
+        return self.value
+
+
+class LazyOrderedDict(OrderedDict):
+    """
+    OrderedDict whose values are only constructed when they are first
+    looked up. Each key is declared along with an argument, which is
+    passed to the factory callable together with the key to build the
+    actual value, e.g. the row indices of a group which are only
+    turned into an Element once the group is requested. Built values
+    replace the placeholder so the factory is called at most once per
+    key.
+    """
+
+    def __init__(self, items=(), factory=None):
+        super(LazyOrderedDict, self).__init__()
+        self.factory = factory
+        for key, arg in items:
+            OrderedDict.__setitem__(self, key, _LazyValue(arg))
+
+    def __getitem__(self, key):
+        value = OrderedDict.__getitem__(self, key)
+        if isinstance(value, _LazyValue):
+            value = value.build(self.factory, key)
+            OrderedDict.__setitem__(self, key, value)
+        return value
+
+    def __reduce__(self):
+        return (OrderedDict, (list(self.items()),))
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def pop(self, key, *default):
+        value = OrderedDict.pop(self, key, *default)
+        if isinstance(value, _LazyValue):
+            value = value.build(self.factory, key)
+        return value
+
+    def items(self):
+        return ItemsView(self)
+
+    def values(self):
+        return ValuesView(self)
+
+    def built(self):
+        "Returns the keys of all values which have been constructed."
+        values = ((k, OrderedDict.__getitem__(self, k)) for k in self)
+        return [k for k, v in values if not isinstance(v, _LazyValue) or v.built]
+
+    def copy(self, keys=None):
+        """
+        Returns a copy in the order of the supplied keys (defaulting
+        to the current order) without building any values.
+        """
+        new = type(self)(factory=self.factory)
+        for key in (self if keys is None else keys):
+            OrderedDict.__setitem__(new, key, OrderedDict.__getitem__(self, key))
+        return new
+
+
 def dimension_sort(odict, kdims, vdims, key_index):
     """
     Sorts data by key using usual Python tuple sorting semantics
@@ -1575,7 +1786,15 @@ def get_ndmapping_label(ndmapping, attr):
     label attribute from an NdMapping.
     """
     label = None
-    els = itervalues(ndmapping.data)
+    data = ndmapping.data
+    if isinstance(data, LazyOrderedDict):
+        # Avoid building values if one has already been built
+        built = data.built()
+        built_keys = set(built)
+        keys = itertools.chain(built, (k for k in data if k not in built_keys))
+        els = (data[k] for k in keys)
+    else:
+        els = itervalues(data)
     while label is None:
         try:
             el = next(els)
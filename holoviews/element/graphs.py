@@ -6,12 +6,14 @@ import numpy as np
 
 from ..core import Dimension, Dataset, Element2D
 from ..core.accessors import Redim
+from ..core.data import PackedGeometries
 from ..core.util import max_range, search_indices
 from ..core.operation import Operation
 from .chart import Points
 from .path import Path
-from .util import (split_path, pd, circular_layout, connect_edges,
-                   connect_edges_pd, quadratic_bezier)
+from .util import (split_path, pd, circular_layout, connect_edges_arrays,
+                   quadratic_bezier)
+from .util import connect_edges, connect_edges_pd # noqa (API import)
 
 
 class RedimGraph(Redim):
@@ -393,11 +395,13 @@ argument to specify a selection specification""")
         """
         if self._edgepaths:
             return self._edgepaths
-        if pd is None:
-            paths = connect_edges(self)
-        else:
-            paths = connect_edges_pd(self)
-        return self.edge_type(paths, kdims=self.nodes.kdims[:2])
+        x0, y0, x1, y1 = connect_edges_arrays(self, drop_missing=True)
+        xdim, ydim = self.nodes.kdims[:2]
+        columns = {xdim.name: np.column_stack([x0, x1]).ravel(),
+                   ydim.name: np.column_stack([y0, y1]).ravel()}
+        offsets = np.arange(0, len(x0)*2+1, 2)
+        paths = PackedGeometries(columns, offsets, geom_type='Line')
+        return self.edge_type(paths, kdims=[xdim, ydim])
 
 
     @classmethod
@@ -267,49 +267,72 @@ def quadratic_bezier(start, end, c0=(0, 0), c1=(0, 0), steps=50):
     return np.column_stack([xs, ys])
 
 
-def connect_edges_pd(graph):
+def lookup_nodes(index, keys):
     """
-    Given a Graph element containing abstract edges compute edge
-    segments directly connecting the source and target nodes. This
-    operation depends on pandas and is a lot faster than the pure
-    NumPy equivalent.
+    Looks up the positions of the supplied node keys in the node
+    index by sorting the index once and binary searching it. Returns
+    an integer array of node positions, with -1 for keys which are
+    not found in the index.
     """
-    edges = graph.dframe()
-    edges.index.name = 'graph_edge_index'
-    edges = edges.reset_index()
-    nodes = graph.nodes.dframe()
-    src, tgt = graph.kdims
-    x, y, idx = graph.nodes.kdims[:3]
-
-    df = pd.merge(edges, nodes, left_on=[src.name], right_on=[idx.name])
-    df = df.rename(columns={x.name: 'src_x', y.name: 'src_y'})
+    index, keys = np.asarray(index), np.asarray(keys)
+    positions = np.full(len(keys), -1, dtype='int64')
+    if not len(index) or not len(keys):
+        return positions
+    try:
+        sorting = np.argsort(index, kind='mergesort')
+        sorted_index = index[sorting]
+        found = np.searchsorted(sorted_index, keys)
+    except TypeError:
+        # Unorderable (mixed type) node indexes fall back to hashing
+        lookup = {k: i for i, k in enumerate(index)}
+        return np.array([lookup.get(k, -1) for k in keys], dtype='int64')
+    found[found == len(sorted_index)] = 0
+    matched = sorted_index[found] == keys
+    positions[matched] = sorting[found[matched]]
+    return positions
+
+
+def connect_edges_arrays(graph, drop_missing=False):
+    """
+    Given a Graph element containing abstract edges compute the start
+    and end coordinates of segments directly connecting the source and
+    target nodes. The node positions are resolved for all edges at
+    once and returned as packed (x0, y0, x1, y1) arrays with one value
+    per edge. Edges referencing nodes which do not exist raise an
+    error unless drop_missing is enabled, in which case they are
+    omitted.
+    """
+    nodes = graph.nodes
+    xs, ys, index = (nodes.dimension_values(i) for i in range(3))
+    sources, targets = (graph.dimension_values(i) for i in range(2))
+    src_idx = lookup_nodes(index, sources)
+    tgt_idx = lookup_nodes(index, targets)
+    found = (src_idx >= 0) & (tgt_idx >= 0)
+    if not found.all():
+        if not drop_missing:
+            raise ValueError('Could not find node positions for all edges')
+        src_idx, tgt_idx = src_idx[found], tgt_idx[found]
+    return xs[src_idx], ys[src_idx], xs[tgt_idx], ys[tgt_idx]
 
-    df = pd.merge(df, nodes, left_on=[tgt.name], right_on=[idx.name])
-    df = df.rename(columns={x.name: 'dst_x', y.name: 'dst_y'})
-    df = df.sort_values('graph_edge_index').drop(['graph_edge_index'], axis=1)
 
-    edge_segments = []
-    for i, edge in df.iterrows():
-        start = edge['src_x'], edge['src_y']
-        end = edge['dst_x'], edge['dst_y']
-        edge_segments.append(np.array([start, end]))
-    return edge_segments
+def connect_edges_pd(graph):
+    """
+    Given a Graph element containing abstract edges compute edge
+    segments directly connecting the source and target nodes,
+    omitting edges whose nodes cannot be found. Returns a list of
+    (2, 2) arrays, see connect_edges_arrays for the packed
+    equivalent.
+    """
+    x0, y0, x1, y1 = connect_edges_arrays(graph, drop_missing=True)
+    return list(np.column_stack([x0, y0, x1, y1]).reshape(-1, 2, 2))
 
 
 def connect_edges(graph):
     """
     Given a Graph element containing abstract edges compute edge
-    segments directly connecting the source and target nodes.  This
-    operation just uses internal HoloViews operations and will be a
-    lot slower than the pandas equivalent.
+    segments directly connecting the source and target nodes. Returns
+    a list of (2, 2) arrays, see connect_edges_arrays for the packed
+    equivalent.
     """
-    paths = []
-    for start, end in graph.array(graph.kdims):
-        start_ds = graph.nodes[:, :, start]
-        end_ds = graph.nodes[:, :, end]
-        if not len(start_ds) or not len(end_ds):
-            raise ValueError('Could not find node positions for all edges')
-        start = start_ds.array(start_ds.kdims[:2])
-        end = end_ds.array(end_ds.kdims[:2])
-        paths.append(np.array([start[0], end[0]]))
-    return paths
+    x0, y0, x1, y1 = connect_edges_arrays(graph)
+    return list(np.column_stack([x0, y0, x1, y1]).reshape(-1, 2, 2))
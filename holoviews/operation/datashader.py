@@ -29,6 +29,7 @@ from ..core.util import (
 from ..element import (Image, Path, Curve, RGB, Graph, TriMesh,
                        QuadMesh, Contours, Spikes, Area, Spread,
                        Segments, Scatter, Points, Polygons)
+from ..element.util import lookup_nodes
 from ..streams import RangeXY, PlotSize
 
 ds_version = LooseVersion(ds.__version__)
@@ -109,6 +110,14 @@ class ResamplingOperation(LinkableOperation):
         used to represent this internal state is not freed between
         calls.""")
 
+    threaded = param.Boolean(default=False, doc="""
+        Whether to compute the resampling on a worker thread when the
+        output is displayed on a bokeh server, keeping the server
+        responsive during expensive aggregations. Range and plot size
+        events arriving while a computation is in flight are coalesced
+        into the most recent one and superseded results are
+        discarded.""")
+
     @bothmethod
     def instance(self_or_cls,**params):
         filtered = {k:v for k,v in params.items() if k in self_or_cls.param}
@@ -224,6 +233,31 @@ class AggregationOperation(ResamplingOperation):
         no column is defined the first value dimension of the element
         will be used. May also be defined as a string.""")
 
+    pyramid = param.Boolean(default=False, doc="""
+        Whether to precompute a multi-resolution pyramid of count or
+        sum aggregates of point data at power-of-two zoom levels. Each
+        request is then answered by resampling the nearest level
+        instead of rescanning the raw data, which is only aggregated
+        again once the requested resolution exceeds the finest level.
+        Requested bins which line up with the bins of a level are
+        summed exactly. Otherwise each pyramid bin is split across the
+        bins it overlaps in proportion to the overlapping area, so the
+        resulting sums are approximations which differ from those of a
+        datashader Canvas aggregate at the requested resolution and
+        the rounded counts may not add up to the total count. Like
+        precompute this assumes the data does not change between
+        calls.""")
+
+    pyramid_levels = param.Integer(default=4, bounds=(1, None), doc="""
+        The number of zoom levels in the aggregate pyramid. The
+        coarsest level spans the data with a single 256x256 tile, each
+        subsequent level doubles the resolution along both axes. The
+        finest level is first aggregated densely, requiring 8 bytes
+        per bin for each aggregate layer (one for counts, two for
+        sums), i.e. 32 MB per layer for the default of four levels
+        (2048x2048 bins) and four times as much for each additional
+        level.""")
+
     _agg_methods = {
         'any':   rd.any,
         'count': rd.count,
@@ -304,6 +338,221 @@ class AggregationOperation(ResamplingOperation):
 
 
 
+class AggregatePyramid(object):
+    """
+    AggregatePyramid holds count or sum aggregates of a dataset at
+    power-of-two zoom levels over a fixed extent. The finest level is
+    aggregated from the raw data once and each coarser level sums 2x2
+    blocks of the level below. Every level is stored as square tiles,
+    omitting tiles which do not contain any samples.
+
+    Values are stored as a stack of layers, e.g. the sums and counts
+    of a sum aggregate, so that empty bins can be masked after
+    resampling.
+
+    Queries whose bins line up with the bins of a level, e.g. when
+    requesting the full extent at a power-of-two fraction of a level's
+    resolution, sum the bins of that level exactly. Otherwise the
+    nearest level is resampled by splitting each of its bins across
+    the requested bins in proportion to the overlapping area, i.e. the
+    returned values are area-weighted approximations which differ
+    from the values a ds.Canvas would aggregate at the requested
+    resolution.
+    """
+
+    tile_size = 256
+
+    def __init__(self, x_range, y_range, finest):
+        self.x_range, self.y_range = x_range, y_range
+        if finest.ndim == 2:
+            finest = finest[np.newaxis]
+        self.dtype = finest.dtype
+        self.nlayers = len(finest)
+        # Only keep the tiles, dropping each dense level once the
+        # next coarser level has been computed from it
+        arr, finest = finest, None
+        levels, shapes = [], []
+        while True:
+            levels.append(self._tile(arr))
+            shapes.append(arr.shape[1:])
+            if arr.shape[-1] <= self.tile_size:
+                break
+            k, n, m = arr.shape
+            arr = arr.reshape(k, n//2, 2, m//2, 2).sum(axis=(2, 4))
+        self.levels = levels[::-1]
+        self.shapes = shapes[::-1]
+
+    @classmethod
+    def from_canvas(cls, df, x, y, aggregators, x_range, y_range, levels):
+        """
+        Aggregates the data with each of the aggregators at the
+        resolution of the finest level and builds the pyramid.
+        """
+        size = cls.tile_size * 2**(levels-1)
+        cvs = ds.Canvas(plot_width=size, plot_height=size,
+                        x_range=x_range, y_range=y_range)
+        layers = [np.nan_to_num(cvs.points(df, x, y, agg).data)
+                  for agg in aggregators]
+        return cls(x_range, y_range, np.stack(layers).astype('float64'))
+
+    def _tile(self, arr):
+        size = self.tile_size
+        _, n, m = arr.shape
+        tiles = {}
+        for ty in range(0, n, size):
+            for tx in range(0, m, size):
+                tile = arr[:, ty:ty+size, tx:tx+size]
+                if tile.any():
+                    # Copy so the tile does not keep the level alive
+                    tiles[(ty//size, tx//size)] = tile.copy()
+        return tiles
+
+    def _region(self, level, rows, cols):
+        """
+        Assembles the cells in the supplied row and column slice of a
+        level from its tiles.
+        """
+        size = self.tile_size
+        region = np.zeros((self.nlayers, rows.stop-rows.start, cols.stop-cols.start))
+        for (ty, tx), tile in self.levels[level].items():
+            r0, c0 = ty*size, tx*size
+            rs = slice(max(rows.start, r0), min(rows.stop, r0+size))
+            cs = slice(max(cols.start, c0), min(cols.stop, c0+size))
+            if rs.start >= rs.stop or cs.start >= cs.stop:
+                continue
+            region[:, rs.start-rows.start:rs.stop-rows.start,
+                   cs.start-cols.start:cs.stop-cols.start] = \
+                tile[:, rs.start-r0:rs.stop-r0, cs.start-c0:cs.stop-c0]
+        return region
+
+    @classmethod
+    def _overlaps(cls, edges, size, start, step):
+        """
+        Computes the output bins and overlap fractions of input bins
+        with the supplied left edges and size, which must not exceed
+        the output bin size (step), i.e. each input bin overlaps at
+        most two output bins.
+        """
+        left = np.floor((edges-start)/step)
+        right = np.floor((edges+size-start)/step)
+        frac = np.clip(((left+1)*step+start-edges)/size, 0, 1)
+        bins = [left.astype('int64'), right.astype('int64')]
+        weights = [np.where(left == right, 1, frac), np.where(left == right, 0, 1-frac)]
+        return [(b, w) for b, w in zip(bins, weights)]
+
+    @classmethod
+    def _alignment(cls, start, step, origin, size):
+        """
+        Returns the offset of the first output bin in input bins and
+        the number of input bins per output bin if the output bins
+        with the supplied start and step line up with the input bins,
+        otherwise None.
+        """
+        offset, ratio = (start-origin)/size, step/size
+        if (round(ratio) >= 1 and abs(ratio-round(ratio)) < 1e-6 and
+            abs(offset-round(offset)) < 1e-6):
+            return int(round(offset)), int(round(ratio))
+        return None
+
+    def query(self, x_range, y_range, width, height):
+        """
+        Returns the aggregate of the requested region as a (layers,
+        height, width) array or None if the request is finer than the
+        finest level. If the requested bins line up with the bins of
+        a level the values are summed exactly, otherwise the coarsest
+        level whose bins are no larger than the requested bins is
+        resampled, splitting each of its bins across the output bins
+        it overlaps in proportion to the overlapping area.
+        """
+        (x0, x1), (y0, y1) = x_range, y_range
+        (X0, X1), (Y0, Y1) = self.x_range, self.y_range
+        px, py = (x1-x0)/float(width), (y1-y0)/float(height)
+        levels = []
+        for level, (n, m) in enumerate(self.shapes):
+            cx, cy = (X1-X0)/float(m), (Y1-Y0)/float(n)
+            if cx <= px and cy <= py:
+                levels.append(level)
+        if not levels:
+            return None
+        for level in levels:
+            n, m = self.shapes[level]
+            xalign = self._alignment(x0, px, X0, (X1-X0)/float(m))
+            yalign = self._alignment(y0, py, Y0, (Y1-Y0)/float(n))
+            if xalign and yalign:
+                return self._sum_aligned(level, xalign, yalign, width, height)
+        return self._resample(levels[0], x_range, y_range, width, height)
+
+    def _sum_aligned(self, level, xalign, yalign, width, height):
+        """
+        Sums the bins of a level into the output bins, given the
+        offset and number of level bins per output bin along each axis.
+        """
+        (ox, kx), (oy, ky) = xalign, yalign
+        n, m = self.shapes[level]
+        c0, c1 = max(ox, 0), min(ox+width*kx, m)
+        r0, r1 = max(oy, 0), min(oy+height*ky, n)
+        out = np.zeros((self.nlayers, height, width))
+        if c0 >= c1 or r0 >= r1:
+            return out
+        region = self._region(level, slice(r0, r1), slice(c0, c1))
+        cols = (np.arange(c0, c1)-ox)//kx
+        rows = (np.arange(r0, r1)-oy)//ky
+        for i, layer in enumerate(region):
+            summed = np.zeros((r1-r0, width))
+            self._accumulate(summed, layer, cols, axis=1)
+            self._accumulate(out[i], summed, rows, axis=0)
+        return out
+
+    def _resample(self, level, x_range, y_range, width, height):
+        """
+        Resamples a level onto the output bins, splitting each bin of
+        the level across the output bins it overlaps in proportion to
+        the overlapping area.
+        """
+        (x0, x1), (y0, y1) = x_range, y_range
+        (X0, X1), (Y0, Y1) = self.x_range, self.y_range
+        px, py = (x1-x0)/float(width), (y1-y0)/float(height)
+        n, m = self.shapes[level]
+        cx, cy = (X1-X0)/float(m), (Y1-Y0)/float(n)
+        c0 = int(np.clip(np.floor((x0-X0)/cx), 0, m))
+        c1 = int(np.clip(np.ceil((x1-X0)/cx), 0, m))
+        r0 = int(np.clip(np.floor((y0-Y0)/cy), 0, n))
+        r1 = int(np.clip(np.ceil((y1-Y0)/cy), 0, n))
+        out = np.zeros((self.nlayers, height, width))
+        if c0 >= c1 or r0 >= r1:
+            return out
+        region = self._region(level, slice(r0, r1), slice(c0, c1))
+
+        # Resample the columns and then the rows of the region
+        xcols = self._overlaps(X0+np.arange(c0, c1)*cx, cx, x0, px)
+        yrows = self._overlaps(Y0+np.arange(r0, r1)*cy, cy, y0, py)
+        for i, layer in enumerate(region):
+            resampled = np.zeros((r1-r0, width))
+            for cols, weights in xcols:
+                self._accumulate(resampled, layer*weights, cols, axis=1)
+            for rows, weights in yrows:
+                self._accumulate(out[i], resampled*weights[:, None], rows, axis=0)
+        return out
+
+    @classmethod
+    def _accumulate(cls, out, values, index, axis):
+        """
+        Sums the values along the axis into the output bins given by
+        the sorted index, dropping values outside the output.
+        """
+        valid = (index >= 0) & (index < out.shape[axis])
+        if not valid.any():
+            return
+        index, values = index[valid], np.compress(valid, values, axis=axis)
+        starts = np.concatenate([[0], np.flatnonzero(np.diff(index))+1])
+        summed = np.add.reduceat(values, starts, axis=axis)
+        if axis:
+            out[:, index[starts]] += summed
+        else:
+            out[index[starts]] += summed
+
+
+
 class aggregate(AggregationOperation):
     """
     aggregate implements 2D binning for any valid HoloViews Element
@@ -344,8 +593,12 @@ class aggregate(AggregationOperation):
         dims = obj.dimensions()[:2]
         if isinstance(obj, Path):
             glyph = 'line'
-            for p in obj.split(datatype='dataframe'):
-                paths.append(p)
+            if obj.interface.datatype == 'packed':
+                # Flattened packed paths are already separated by NaNs
+                paths.append(obj.dframe())
+            else:
+                for p in obj.split(datatype='dataframe'):
+                    paths.append(p)
         elif isinstance(obj, CompositeOverlay):
             element = None
             for key, el in obj.data.items():
@@ -435,6 +688,19 @@ class aggregate(AggregationOperation):
                                   dims=[y.name, x.name], coords={x.name: xs, y.name: ys})
             return self.p.element_type(xarray, **params)
 
+        if (self.p.pyramid and glyph == 'points' and xtype == ytype == 'numeric' and
+            type(agg_fn) in (ds.count, ds.sum)):
+            pyramid = self._get_pyramid(element, x, y, data, agg_fn)
+            layers = None if pyramid is None else pyramid.query(x_range, y_range, width, height)
+            if layers is not None:
+                if isinstance(agg_fn, ds.count):
+                    values = np.round(layers[0]).astype('uint32')
+                else:
+                    values = np.where(layers[1] > 0, layers[0], np.NaN)
+                xarray = xr.DataArray(values, dims=[y.name, x.name],
+                                      coords={x.name: xs, y.name: ys})
+                return self.p.element_type(xarray, **params)
+
         cvs = ds.Canvas(plot_width=width, plot_height=height,
                         x_range=x_range, y_range=y_range)
 
@@ -459,6 +725,28 @@ class aggregate(AggregationOperation):
                 layers[c] = self.p.element_type(eldata, **params)
             return NdOverlay(layers, kdims=[data.get_dimension(agg_fn.column)])
 
+    def _get_pyramid(self, element, x, y, data, agg_fn):
+        """
+        Returns the AggregatePyramid of the element for the supplied
+        count or sum aggregator, building it over the data extent
+        the first time it is requested.
+        """
+        key = (element._plot_id, 'pyramid', type(agg_fn).__name__,
+               agg_fn.column, self.p.pyramid_levels)
+        if key in self._precomputed:
+            return self._precomputed[key]
+        x_range, y_range = data.range(x), data.range(y)
+        if not all(isfinite(v) for v in x_range+y_range):
+            return None
+        x_range, y_range = (tuple(r) if r[0] != r[1] else (r[0]-0.5, r[1]+0.5)
+                            for r in (x_range, y_range))
+        aggregators = [agg_fn] if isinstance(agg_fn, ds.count) else [agg_fn, ds.count()]
+        pyramid = AggregatePyramid.from_canvas(
+            PandasInterface.as_dframe(data), x.name, y.name, aggregators,
+            x_range, y_range, self.p.pyramid_levels)
+        self._precomputed[key] = pyramid
+        return pyramid
+
 
 
 class overlay_aggregate(aggregate):
@@ -1641,4 +1929,18 @@ class directly_connect_edges(_connect_edges, connect_edges):
     """
 
     def _bundle(self, position_df, edges_df):
-        return connect_edges.__call__(self, position_df, edges_df)
+        if self.p.include_edge_id:
+            return connect_edges.__call__(self, position_df, edges_df)
+        # Resolve all node positions at once with a sorted index lookup
+        # rather than building the segments edge by edge
+        index = position_df.index.values
+        src = lookup_nodes(index, edges_df['source'].values)
+        tgt = lookup_nodes(index, edges_df['target'].values)
+        found = (src >= 0) & (tgt >= 0)
+        src, tgt = src[found], tgt[found]
+        nans = np.full(len(src), np.nan)
+        columns = {}
+        for c in ('x', 'y'):
+            values = position_df[c].values
+            columns[c] = np.column_stack([values[src], values[tgt], nans]).ravel()
+        return pd.DataFrame(columns, columns=['x', 'y'])
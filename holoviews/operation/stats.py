@@ -20,6 +20,207 @@ def _kde_support(bin_range, bw, gridsize, cut, clip):
     return np.linspace(kmin, kmax, gridsize)
 
 
+def _fft_size(n):
+    """Returns the smallest power of two no smaller than n."""
+    return int(2**np.ceil(np.log2(max(n, 1))))
+
+
+def _direct_kde(sample, grid, bandwidth):
+    """
+    Evaluates the Gaussian KDE of a 1D sample on the grid points by
+    directly summing the kernels of the samples within eight
+    bandwidths of each point, beyond which the kernels are
+    negligible. The samples in the window around each point are
+    looked up in the sorted sample, so the cost scales with the
+    number of samples when the grid is coarse compared to the
+    bandwidth.
+    """
+    sample = np.sort(sample)
+    starts = np.searchsorted(sample, grid-8*bandwidth)
+    ends = np.searchsorted(sample, grid+8*bandwidth, side='right')
+    density = np.zeros(len(grid))
+    for i, (start, end) in enumerate(zip(starts, ends)):
+        offsets = (grid[i]-sample[start:end])/bandwidth
+        density[i] = np.exp(-0.5*offsets**2).sum()
+    return density/(np.sqrt(2*np.pi)*bandwidth*len(sample))
+
+
+def _binned_kde(samples, grids, bandwidths, max_bins=2**14):
+    """
+    Evaluates the Gaussian KDEs of multiple 1D samples on the
+    corresponding rows of evenly spaced grid points in a single
+    vectorized pass. The samples are linearly binned onto a fine grid
+    with at least four bins per bandwidth and the bin counts are then
+    convolved with the kernels using an FFT, which scales as
+    O(N + M log M) rather than O(N*M) for N samples and M bins.
+    Samples spanning too many bandwidths to be resolved by max_bins,
+    e.g. due to outliers, are evaluated directly instead.
+    """
+    bandwidths = np.asarray(bandwidths, dtype='float64')
+    ngroups, npoints = grids.shape
+
+    # Fine grid extended by the kernel support on both sides
+    lower = grids[:, 0] - 4*bandwidths
+    upper = grids[:, -1] + 4*bandwidths
+    required = np.ceil((upper-lower)/bandwidths*4)+1
+    direct = required > max_bins
+    if direct.any():
+        density = np.empty(grids.shape)
+        for i in np.flatnonzero(direct):
+            density[i] = _direct_kde(samples[i], grids[i], bandwidths[i])
+        binned = np.flatnonzero(~direct)
+        if len(binned):
+            density[binned] = _binned_kde([samples[i] for i in binned], grids[binned],
+                                          bandwidths[binned], max_bins)
+        return density
+
+    sizes = np.array([len(sample) for sample in samples])
+    nbins = int(max(required.max(), npoints))
+    step = (upper-lower)/(nbins-1)
+
+    # Linear binning of all samples at once
+    group = np.repeat(np.arange(ngroups), sizes)
+    pos = (np.concatenate(samples)-lower[group])/step[group]
+    valid = (pos >= 0) & (pos <= nbins-1)
+    pos, group = pos[valid], group[valid]
+    left = np.minimum(pos.astype('int64'), nbins-2)
+    frac = pos-left
+    index = group*nbins+left
+    counts = (np.bincount(index, 1-frac, minlength=ngroups*nbins) +
+              np.bincount(index+1, frac, minlength=ngroups*nbins))
+    counts = counts.reshape(ngroups, nbins)
+
+    # Convolve with the kernels of each group
+    width = int(min(np.ceil((4*bandwidths/step).max()), nbins-1))
+    offsets = np.arange(-width, width+1)*(step/bandwidths)[:, None]
+    norm = np.sqrt(2*np.pi)*bandwidths*sizes
+    kernels = np.exp(-0.5*offsets**2)/norm[:, None]
+    size = _fft_size(nbins+2*width)
+    density = np.fft.irfft(np.fft.rfft(counts, size)*np.fft.rfft(kernels, size), size)
+    density = density[:, width:width+nbins]
+
+    # Interpolate the density onto the requested grid points
+    pos = (grids-lower[:, None])/step[:, None]
+    left = np.clip(pos.astype('int64'), 0, nbins-2)
+    frac = pos-left
+    rows = np.arange(ngroups)[:, None]
+    density = density[rows, left]*(1-frac) + density[rows, left+1]*frac
+    return np.clip(density, 0, None)
+
+
+def _direct_kde_2d(data, xs, ys, covariance):
+    """
+    Evaluates the 2D Gaussian KDE with the supplied kernel covariance
+    of the (2, N) data on the grid defined by the xs and ys by
+    directly summing the kernels of the samples within eight
+    bandwidths of each x-coordinate, which are looked up in the
+    samples sorted along the x-axis.
+    """
+    inverse = np.linalg.inv(covariance)
+    bandwidth = np.sqrt(covariance[0, 0])
+    data = data[:, np.argsort(data[0])]
+    starts = np.searchsorted(data[0], xs-8*bandwidth)
+    ends = np.searchsorted(data[0], xs+8*bandwidth, side='right')
+    density = np.zeros((len(xs), len(ys)))
+    for i, (start, end) in enumerate(zip(starts, ends)):
+        dx = xs[i]-data[0, start:end]
+        dy = ys[:, None]-data[1, start:end]
+        quad = inverse[0, 0]*dx**2 + 2*inverse[0, 1]*dx*dy + inverse[1, 1]*dy**2
+        density[i] = np.exp(-0.5*quad).sum(axis=1)
+    return density/(2*np.pi*np.sqrt(np.linalg.det(covariance))*data.shape[1])
+
+
+def _binned_kde_2d(data, xs, ys, covariance, max_bins=2**10):
+    """
+    Evaluates the 2D Gaussian KDE with the supplied kernel covariance
+    of the (2, N) data on the grid defined by the evenly spaced xs
+    and ys by linearly binning the samples onto a fine grid and
+    convolving the bin counts with the kernel using an FFT. Data
+    spanning too many bandwidths to be resolved by max_bins along
+    either axis, e.g. due to outliers, is evaluated directly instead.
+    """
+    inverse = np.linalg.inv(covariance)
+    bandwidths = np.sqrt(np.diag(covariance))
+    lower = np.array([xs[0], ys[0]]) - 4*bandwidths
+    upper = np.array([xs[-1], ys[-1]]) + 4*bandwidths
+    nbins = np.ceil((upper-lower)/bandwidths*4)+1
+    if (nbins > max_bins).any():
+        return _direct_kde_2d(data, xs, ys, covariance)
+    nbins = np.maximum(nbins, [len(xs), len(ys)]).astype('int64')
+    step = (upper-lower)/(nbins-1)
+
+    # Linear binning onto the four surrounding bins
+    pos = (data-lower[:, None])/step[:, None]
+    valid = ((pos >= 0) & (pos <= (nbins-1)[:, None])).all(axis=0)
+    pos = pos[:, valid]
+    left = np.minimum(pos.astype('int64'), (nbins-2)[:, None])
+    frac = pos-left
+    counts = np.zeros(nbins[0]*nbins[1])
+    for dx, dy in [(0, 0), (0, 1), (1, 0), (1, 1)]:
+        weights = ((frac[0] if dx else 1-frac[0])*(frac[1] if dy else 1-frac[1]))
+        index = (left[0]+dx)*nbins[1]+left[1]+dy
+        counts += np.bincount(index, weights, minlength=len(counts))
+    counts = counts.reshape(nbins)
+
+    # Convolve with the kernel
+    widths = np.minimum(np.ceil(4*bandwidths/step), nbins-1).astype('int64')
+    ox = np.arange(-widths[0], widths[0]+1)[:, None]*step[0]
+    oy = np.arange(-widths[1], widths[1]+1)[None, :]*step[1]
+    quad = inverse[0, 0]*ox**2 + 2*inverse[0, 1]*ox*oy + inverse[1, 1]*oy**2
+    norm = 2*np.pi*np.sqrt(np.linalg.det(covariance))*data.shape[1]
+    kernel = np.exp(-0.5*quad)/norm
+    size = [_fft_size(n+2*w) for n, w in zip(nbins, widths)]
+    density = np.fft.irfft2(np.fft.rfft2(counts, size)*np.fft.rfft2(kernel, size), size)
+    density = density[widths[0]:widths[0]+nbins[0], widths[1]:widths[1]+nbins[1]]
+
+    # Bilinear interpolation onto the requested grid
+    for axis, points in enumerate([xs, ys]):
+        pos = (points-lower[axis])/step[axis]
+        left = np.clip(pos.astype('int64'), 0, nbins[axis]-2)
+        frac = pos-left
+        shape = (-1, 1) if axis == 0 else (1, -1)
+        density = (np.take(density, left, axis=axis)*(1-frac).reshape(shape) +
+                   np.take(density, left+1, axis=axis)*frac.reshape(shape))
+    return np.clip(density, 0, None)
+
+
+def _univariate_kdes(samples, bin_ranges, bandwidth=None, cut=3, n_samples=100,
+                     clip=(None, None), explicit_range=False):
+    """
+    Computes binned KDEs of multiple 1D samples in a single pass using
+    the same support and bandwidth as univariate_kde. Returns a list
+    of (xs, ys) tuples, where ys is None if the sample has zero
+    variance.
+    """
+    xs = [None]*len(samples)
+    ys = [None]*len(samples)
+    kde_samples, grids, bandwidths, indexes = [], [], [], []
+    for i, (sample, bin_range) in enumerate(zip(samples, bin_ranges)):
+        if len(sample) < 2:
+            xs[i] = np.linspace(bin_range[0], bin_range[1], n_samples)
+            ys[i] = np.full_like(xs[i], 0)
+            continue
+        std = sample.std(ddof=1)
+        if std == 0:
+            xs[i] = np.linspace(bin_range[0], bin_range[1], n_samples)
+            continue
+        scott = len(sample)**(-1./5)
+        bw = scott * std
+        if explicit_range:
+            xs[i] = np.linspace(bin_range[0], bin_range[1], n_samples)
+        else:
+            xs[i] = _kde_support(bin_range, bw, n_samples, cut, clip)
+        kde_samples.append(sample)
+        grids.append(xs[i])
+        bandwidths.append(std*(bandwidth or scott))
+        indexes.append(i)
+    if kde_samples:
+        densities = _binned_kde(kde_samples, np.array(grids), bandwidths)
+        for i, density in zip(indexes, densities):
+            ys[i] = density
+    return list(zip(xs, ys))
+
+
 class univariate_kde(Operation):
     """
     Computes a 1D kernel density estimate (KDE) along the supplied
@@ -56,6 +257,12 @@ class univariate_kde(Operation):
     groupby = param.ClassSelector(default=None, class_=(basestring, Dimension), doc="""
       Defines a dimension to group the Histogram returning an NdOverlay of Histograms.""")
 
+    estimator = param.ObjectSelector(default='scipy', objects=['scipy', 'binned'], doc="""
+        Whether to evaluate the kernel at every sample using SciPy's
+        gaussian_kde or to bin the samples on a fine grid and convolve
+        them with the kernel using an FFT, which is much faster for
+        large numbers of samples.""")
+
     def _process(self, element, key=None):
         if self.p.groupby:
             if not isinstance(element, Dataset):
@@ -64,11 +271,13 @@ class univariate_kde(Operation):
             self.p.groupby = None
             return grouped.map(self._process, Dataset)
 
+        binned = self.p.estimator == 'binned'
         try:
             from scipy import stats
             from scipy.linalg import LinAlgError
         except ImportError:
-            raise ImportError('%s operation requires SciPy to be installed.' % type(self).__name__)
+            if not binned:
+                raise ImportError('%s operation requires SciPy to be installed.' % type(self).__name__)
 
         params = {}
         if isinstance(element, Distribution):
@@ -101,7 +310,13 @@ class univariate_kde(Operation):
 
         element_type = Area if self.p.filled else Curve
         data = data[isfinite(data)] if len(data) else []
-        if len(data) > 1:
+        if binned:
+            [(xs, ys)] = _univariate_kdes(
+                [np.asarray(data)], [bin_range], self.p.bandwidth, self.p.cut,
+                self.p.n_samples, selected_dim.range, bool(self.p.bin_range))
+            if ys is None:
+                return element_type([], selected_dim, vdims, **params)
+        elif len(data) > 1:
             try:
                 kde = stats.gaussian_kde(data)
             except LinAlgError:
@@ -166,11 +381,19 @@ class bivariate_kde(Operation):
        The x_range as a tuple of min and max y-value. Auto-ranges
        if set to None.""")
 
+    estimator = param.ObjectSelector(default='scipy', objects=['scipy', 'binned'], doc="""
+        Whether to evaluate the kernel at every sample using SciPy's
+        gaussian_kde or to bin the samples on a fine grid and convolve
+        them with the kernel using an FFT, which is much faster for
+        large numbers of samples.""")
+
     def _process(self, element, key=None):
+        binned = self.p.estimator == 'binned'
         try:
             from scipy import stats
         except ImportError:
-            raise ImportError('%s operation requires SciPy to be installed.' % type(self).__name__)
+            if not binned:
+                raise ImportError('%s operation requires SciPy to be installed.' % type(self).__name__)
 
         if len(element.dimensions()) < 2:
             raise ValueError("bivariate_kde can only be computed on elements "
@@ -199,10 +422,14 @@ class bivariate_kde(Operation):
 
         data = data[:, isfinite(data).min(axis=0)] if data.shape[1] > 1 else np.empty((2, 0))
         if data.shape[1] > 1:
-            kde = stats.gaussian_kde(data)
-            if self.p.bandwidth:
-                kde.set_bandwidth(self.p.bandwidth)
-            bw = kde.scotts_factor() * data.std(ddof=1)
+            scott = data.shape[1]**(-1./6)
+            if binned:
+                covariance = np.cov(data)*(self.p.bandwidth or scott)**2
+            else:
+                kde = stats.gaussian_kde(data)
+                if self.p.bandwidth:
+                    kde.set_bandwidth(self.p.bandwidth)
+            bw = scott * data.std(ddof=1)
             if self.p.x_range:
                 xs = np.linspace(xmin, xmax, self.p.n_samples)
             else:
@@ -211,9 +438,12 @@ class bivariate_kde(Operation):
                 ys = np.linspace(ymin, ymax, self.p.n_samples)
             else:
                 ys = _kde_support((ymin, ymax), bw, self.p.n_samples, self.p.cut, ydim.range)
-            xx, yy = cartesian_product([xs, ys], False)
-            positions = np.vstack([xx.ravel(), yy.ravel()])
-            f = np.reshape(kde(positions).T, xx.shape)
+            if binned:
+                f = _binned_kde_2d(data, xs, ys, covariance)
+            else:
+                xx, yy = cartesian_product([xs, ys], False)
+                positions = np.vstack([xx.ravel(), yy.ravel()])
+                f = np.reshape(kde(positions).T, xx.shape)
         elif self.p.contours:
             eltype = Polygons if self.p.filled else Contours
             return eltype([], kdims=[xdim, ydim], vdims=[vdim])
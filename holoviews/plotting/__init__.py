@@ -11,6 +11,7 @@ from ..core.options import Cycle, Compositor
 from ..element import Area, Polygons
 from ..element.sankey import _layout_sankey, Sankey
 from .plot import Plot
+from .profiling import PlotProfiler # noqa (API import)
 from .renderer import Renderer, HTML_TAGS # noqa (API import)
 from .util import list_cmaps # noqa (API import)
 from ..operation.stats import univariate_kde, bivariate_kde
@@ -21,6 +21,7 @@ from bokeh.transform import dodge
 from ...core.util import datetime_types, dimension_sanitizer, basestring
 from ...element import HLine, VLine, VSpan
 from ..plot import GenericElementPlot
+from ..profiling import PlotProfiler
 from .element import AnnotationPlot, ElementPlot, CompositeElementPlot, ColorbarPlot
 from .selection import BokehOverlaySelectionDisplay
 from .styles import base_properties, fill_properties, line_properties, text_properties
@@ -373,6 +374,7 @@ class DivPlot(BokehPlot, GenericElementPlot, AnnotationPlot):
         return element.data, {}, style
 
 
+    @PlotProfiler.profiled('initialize_plot')
     def initialize_plot(self, ranges=None, plot=None, plots=None, source=None):
         """
         Initializes a new plot object with the last available frame.
@@ -383,7 +385,9 @@ class DivPlot(BokehPlot, GenericElementPlot, AnnotationPlot):
         self.current_frame = element
         self.current_key = key
 
-        data, _, _ = self.get_data(element, ranges, {})
+        with PlotProfiler.stage(self, 'get_data'):
+            data, _, _ = self.get_data(element, ranges, {})
+            PlotProfiler.annotate(data)
         div = BkDiv(text=data, width=self.width, height=self.height)
         self.handles['plot'] = div
         self._execute_hooks(element)
@@ -391,11 +395,14 @@ class DivPlot(BokehPlot, GenericElementPlot, AnnotationPlot):
         return div
 
 
+    @PlotProfiler.profiled('update_frame')
     def update_frame(self, key, ranges=None, plot=None):
         """
         Updates an existing plot with data corresponding
         to the key.
         """
         element = self._get_frame(key)
-        text, _, _ = self.get_data(element, ranges, {})
+        with PlotProfiler.stage(self, 'get_data'):
+            text, _, _ = self.get_data(element, ranges, {})
+            PlotProfiler.annotate(text)
         self.handles['plot'].text = text
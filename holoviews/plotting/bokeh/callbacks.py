@@ -1,8 +1,15 @@
 from __future__ import absolute_import, division, unicode_literals
 
-from collections import defaultdict
+import time
+
+from collections import defaultdict, deque
 from functools import partial
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
 import param
 import numpy as np
 
@@ -16,8 +23,12 @@ from panel.callbacks import PeriodicCallback
 from pyviz_comms import JS_CALLBACK
 
 from ...core import OrderedDict
+from ...core.operation import OperationCallable
 from ...core.options import CallbackError
-from ...core.util import dimension_sanitizer, isscalar, dt64_to_dt
+from ...core.spaces import DynamicMap, get_nested_dmaps
+from ...core.util import (
+    dimension_sanitizer, isscalar, dt64_to_dt, is_param_method, get_method_owner
+)
 from ...element import Table
 from ...streams import (Stream, PointerXY, RangeXY, Selection1D, RangeX,
                         RangeY, PointerX, PointerY, BoundsX, BoundsY,
@@ -30,6 +41,18 @@ from ..plot import GenericElementPlot, GenericOverlayPlot
 from .util import convert_timestamp
 
 
+def threaded_operation(dmap):
+    """
+    Whether the supplied DynamicMap applies an operation which
+    requested to be computed on a worker thread.
+    """
+    callback = dmap.callback
+    if not isinstance(callback, OperationCallable):
+        return False
+    default = getattr(callback.operation, 'threaded', False)
+    return bool(callback.operation_kwargs.get('threaded', default))
+
+
 class MessageCallback(object):
     """
     A MessageCallback is an abstract baseclass used to supply Streams
@@ -131,6 +154,15 @@ class MessageCallback(object):
 
 
     def on_msg(self, msg):
+        streams = self._update_streams(msg)
+        self._trigger_streams(streams)
+
+
+    def _update_streams(self, msg):
+        """
+        Updates the streams with the supplied msg, returning the
+        streams which should be triggered.
+        """
         streams = []
         for stream in self.streams:
             handle_ids = self.handle_ids[stream]
@@ -143,7 +175,10 @@ class MessageCallback(object):
             stream._metadata = {h: {'id': hid, 'events': self.on_events}
                                 for h, hid in handle_ids.items()}
             streams.append(stream)
+        return streams
 
+
+    def _trigger_streams(self, streams):
         try:
             Stream.trigger(streams)
         except CallbackError as e:
@@ -308,9 +343,198 @@ class ServerCallback(MessageCallback):
     Stream(s) attached to the callback.
     """
 
+    _executor = None
+
+    _max_workers = 4
+
+    # Bounds (in ms) of the window events are batched over, which
+    # adapts to the measured latency of the plot updates
+    _throttle_bounds = (20, 1000)
+
+    # Throttle window (in ms) used before any latency was measured
+    _throttle_default = 50
+
+    # Number of recent update latencies the throttle is based on
+    _latency_samples = 10
+
     def __init__(self, plot, streams, source, **params):
         super(ServerCallback, self).__init__(plot, streams, source, **params)
         self._active = False
+        self._pending = None
+        self._computing = False
+        self._compute_start = None
+        self._latencies = deque(maxlen=self._latency_samples)
+
+
+    @property
+    def latencies(self):
+        """
+        The wall times (in ms) of the most recent plot updates
+        triggered by this callback, including any time spent
+        computing the update on a worker thread.
+        """
+        return list(self._latencies)
+
+
+    @property
+    def throttle_timeout(self):
+        """
+        The window (in ms) over which events arriving while or right
+        after an update is processed are batched, given by the median
+        latency of recent updates clipped to the throttle bounds.
+        """
+        if not self._latencies:
+            return self._throttle_default
+        lower, upper = self._throttle_bounds
+        return int(min(max(np.median(self._latencies), lower), upper))
+
+
+    def _schedule(self, callback, idle=False):
+        """
+        Schedules the callback to process the queued events once the
+        throttle window has elapsed. The first event after an idle
+        period is only batched over the short default window, since
+        no update is competing with it.
+        """
+        timeout = self.throttle_timeout
+        if idle:
+            timeout = min(timeout, self._throttle_default)
+        if self.plot.document.session_context:
+            self.plot.document.add_timeout_callback(callback, timeout)
+        else:
+            PeriodicCallback(callback=callback, period=timeout, count=1).start()
+
+
+    def _trigger_streams(self, streams):
+        start = self._compute_start or time.time()
+        self._compute_start = None
+        try:
+            super(ServerCallback, self)._trigger_streams(streams)
+        finally:
+            if streams:
+                self._latencies.append((time.time()-start)*1000)
+
+
+    @classmethod
+    def _get_executor(cls):
+        """
+        Returns the worker pool shared by all server callbacks.
+        """
+        if ServerCallback._executor is None:
+            ServerCallback._executor = ThreadPoolExecutor(max_workers=cls._max_workers)
+        return ServerCallback._executor
+
+
+    def _threaded_plots(self):
+        """
+        Returns the plots subscribed to the streams whose DynamicMaps
+        apply an operation requesting threaded execution.
+        """
+        plots = []
+        for stream in self.streams:
+            for _, subscriber in stream._subscribers:
+                if not is_param_method(subscriber):
+                    continue
+                plot = get_method_owner(subscriber)
+                hmap = getattr(plot, 'hmap', None)
+                if (plot in plots or getattr(plot, 'current_key', None) is None or
+                    not isinstance(hmap, DynamicMap)):
+                    continue
+                if any(threaded_operation(dmap) for dmap in get_nested_dmaps(hmap)):
+                    plots.append(plot)
+        return plots
+
+
+    def on_msg(self, msg):
+        """
+        On the bokeh server plots containing threaded operations are
+        computed on a worker thread. Messages arriving while a
+        computation is in flight are coalesced into the most recent
+        one and the superseded result is discarded.
+        """
+        if (self._pending is None and not self._computing and
+            (ThreadPoolExecutor is None or not self.plot.document or
+             not self.plot.document.session_context or not self._threaded_plots())):
+            return super(ServerCallback, self).on_msg(msg)
+        self._pending = msg
+        if not self._computing:
+            self._compute_threaded()
+
+
+    def _compute_threaded(self):
+        plots = self._threaded_plots()
+        busy = [p for p in plots if getattr(p, '_computing_callback', None) not in (None, self)]
+        if busy:
+            # Only one computation may be in flight per plot, so the
+            # events are kept pending until the plot is released
+            self._computing = True
+            waiting = getattr(busy[0], '_waiting_callbacks', [])
+            if self not in waiting:
+                busy[0]._waiting_callbacks = waiting + [self]
+            return
+        msg, self._pending = self._pending, None
+        streams = self._update_streams(msg)
+        if not streams or not plots:
+            self._computing = False
+            self._trigger_streams(streams)
+            return
+        for plot in plots:
+            plot._computing_callback = self
+        self._computing = True
+        self._compute_start = time.time()
+        document = self.plot.document
+        future = self._get_executor().submit(self._precompute, plots)
+        future.add_done_callback(lambda f: document.add_next_tick_callback(
+            partial(self._on_computed, streams, plots)))
+
+
+    def _precompute(self, plots):
+        """
+        Evaluates the current frame of the plots, populating the
+        memoized results of their DynamicMaps so the subsequent
+        refresh does not have to recompute them.
+        """
+        for plot in plots:
+            key_map = dict(zip([d.name for d in plot.dimensions], plot.current_key))
+            key = tuple(key_map[kd.name] for kd in plot.hmap.kdims if kd.name in key_map)
+            try:
+                plot.hmap[key]
+            except Exception:
+                # Errors are raised again when the plot is refreshed
+                pass
+
+
+    def _on_computed(self, streams, plots):
+        if self.plot is not None and self._pending is None:
+            self._computing = False
+            self._trigger_streams(streams)
+        self._release(plots)
+        if self.plot is None:
+            self._computing = False
+            self._pending = None
+        elif self._pending is not None:
+            # Discard the result if newer events arrived meanwhile
+            self._compute_threaded()
+
+
+    def _release(self, plots):
+        """
+        Releases the plots once the computation of this callback has
+        been applied and resumes the callbacks waiting on them.
+        """
+        waiting = []
+        for plot in plots:
+            if getattr(plot, '_computing_callback', None) is self:
+                plot._computing_callback = None
+            waiting += [cb for cb in getattr(plot, '_waiting_callbacks', [])
+                        if cb not in waiting]
+            plot._waiting_callbacks = []
+        for callback in waiting:
+            if callback.plot is None or callback._pending is None:
+                callback._computing = False
+                callback._pending = None
+            else:
+                callback._compute_threaded()
 
 
     @classmethod
@@ -345,10 +569,7 @@ class ServerCallback(MessageCallback):
         self._queue.append((attr, old, new))
         if not self._active and self.plot.document:
             self._active = True
-            if self.plot.document.session_context:
-                self.plot.document.add_timeout_callback(self.process_on_change, 50)
-            else:
-                PeriodicCallback(callback=self.process_on_change, period=50, count=1).start()
+            self._schedule(self.process_on_change, idle=not self._computing)
 
 
     def on_event(self, event):
@@ -359,10 +580,7 @@ class ServerCallback(MessageCallback):
         self._queue.append((event))
         if not self._active and self.plot.document:
             self._active = True
-            if self.plot.document.session_context:
-                self.plot.document.add_timeout_callback(self.process_on_event, 50)
-            else:
-                PeriodicCallback(callback=self.process_on_event, period=50, count=1).start()
+            self._schedule(self.process_on_event, idle=not self._computing)
 
 
     def process_on_event(self):
@@ -372,6 +590,11 @@ class ServerCallback(MessageCallback):
         if not self._queue:
             self._active = False
             return
+        elif self._computing:
+            # Leave events queued while an update is in flight so only
+            # the latest state is processed once it has completed
+            self._schedule(self.process_on_event)
+            return
         # Get unique event types in the queue
         events = list(OrderedDict([(event.event_name, event)
                                    for event in self._queue]).values())
@@ -384,17 +607,19 @@ class ServerCallback(MessageCallback):
                 model_obj = self.plot_handles.get(self.models[0])
                 msg[attr] = self.resolve_attr_spec(path, event, model_obj)
             self.on_msg(msg)
-
-        if self.plot.document.session_context:
-            self.plot.document.add_timeout_callback(self.process_on_event, 50)
-        else:
-            PeriodicCallback(callback=self.process_on_event, period=50, count=1).start()
+        self._schedule(self.process_on_event)
 
 
     def process_on_change(self):
+        """
+        Resolve the changed attributes and trigger the corresponding streams.
+        """
         if not self._queue:
             self._active = False
             return
+        elif self._computing:
+            self._schedule(self.process_on_change)
+            return
         self._queue = []
 
         msg = {}
@@ -409,11 +634,7 @@ class ServerCallback(MessageCallback):
             msg[attr] = self.resolve_attr_spec(path, cb_obj)
 
         self.on_msg(msg)
-
-        if self.plot.document.session_context:
-            self.plot.document.add_timeout_callback(self.process_on_change, 50)
-        else:
-            PeriodicCallback(callback=self.process_on_change, period=100, count=1).start()
+        self._schedule(self.process_on_change)
 
 
     def set_server_callback(self, handle):
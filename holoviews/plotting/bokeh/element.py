@@ -37,6 +37,7 @@ from ...streams import Stream, Buffer, PlotSize
 from ...util.transform import dim
 from ..plot import GenericElementPlot, GenericOverlayPlot
 from ..util import dynamic_update, process_cmap, color_intervals, dim_range_key
+from ..profiling import PlotProfiler
 from .callbacks import PlotSizeCallback
 from .plot import BokehPlot
 from .styles import (
@@ -196,6 +197,10 @@ class ElementPlot(BokehPlot, GenericElementPlot):
         self.callbacks = self._construct_callbacks()
         self.static_source = False
         self.streaming = [s for s in self.streams if isinstance(s, Buffer)]
+        # Fingerprints and patchable copies of the columns sent to
+        # each ColumnDataSource
+        self._column_fingerprints = {}
+        self._column_copies = {}
         self.geographic = bool(self.hmap.last.traverse(lambda x: x, Tiles))
         if self.geographic and self.projection is None:
             self.projection = 'mercator'
@@ -989,9 +994,18 @@ class ElementPlot(BokehPlot, GenericElementPlot):
                 ds = Dataset({d.name: v for d, v in self.overlay_dims.items()},
                              list(self.overlay_dims))
                 val = v.apply(ds, ranges=ranges, flat=True)[0]
+            elif (isinstance(element, Path) and not isinstance(element, Contours)
+                  and element.interface.datatype == 'packed'):
+                # Evaluate the transform on the flat vertices of all paths
+                interface = element.interface
+                vertices = Dataset(interface.vertex_columns(element),
+                                   element.kdims, element.vdims)
+                val = v.apply(vertices, ranges=ranges, flat=True)
+                path_vals = None
             elif isinstance(element, Path) and not isinstance(element, Contours):
-                val = np.concatenate([v.apply(el, ranges=ranges, flat=True)
-                                      for el in element.split()])
+                path_vals = [v.apply(el, ranges=ranges, flat=True)
+                             for el in element.split()]
+                val = np.concatenate(path_vals)
             else:
                 val = v.apply(element, ranges=ranges, flat=True)
 
@@ -1014,7 +1028,11 @@ class ElementPlot(BokehPlot, GenericElementPlot):
                     if isinstance(element, VectorField):
                         val = np.tile(val, 3)
                     elif isinstance(element, Path) and not isinstance(element, Contours):
-                        val = val[:-1]
+                        # Drop the value of the last vertex of each path
+                        if path_vals is None:
+                            val = val[element.interface.segment_starts(element)]
+                        else:
+                            val = np.concatenate([pv[:-1] for pv in path_vals])
                     else:
                         continue
 
@@ -1233,10 +1251,14 @@ class ElementPlot(BokehPlot, GenericElementPlot):
         # Get data and initialize data source
         if self.batched:
             current_id = tuple(element.traverse(lambda x: x._plot_id, [Element]))
-            data, mapping, style = self.get_batched_data(element, ranges)
+            with PlotProfiler.stage(self, 'get_data'):
+                data, mapping, style = self.get_batched_data(element, ranges)
+                PlotProfiler.annotate(data)
         else:
             style = self.style[self.cyclic_index]
-            data, mapping, style = self.get_data(element, ranges, style)
+            with PlotProfiler.stage(self, 'get_data'):
+                data, mapping, style = self.get_data(element, ranges, style)
+                PlotProfiler.annotate(data)
             current_id = element._plot_id
 
         with abbreviated_exception():
@@ -1262,6 +1284,7 @@ class ElementPlot(BokehPlot, GenericElementPlot):
             self._update_glyph(renderer, properties, mapping, glyph, source, source.data)
 
 
+    @PlotProfiler.profiled('initialize_plot')
     def initialize_plot(self, ranges=None, plot=None, plots=None, source=None):
         """
         Initializes a new plot object with the last available frame.
@@ -1326,9 +1349,13 @@ class ElementPlot(BokehPlot, GenericElementPlot):
         self.handles['previous_id'] = current_id
         self.static_source = (self.dynamic and (current_id == previous_id))
         if self.batched:
-            data, mapping, style = self.get_batched_data(element, ranges)
+            with PlotProfiler.stage(self, 'get_data'):
+                data, mapping, style = self.get_batched_data(element, ranges)
+                PlotProfiler.annotate(data)
         else:
-            data, mapping, style = self.get_data(element, ranges, style)
+            with PlotProfiler.stage(self, 'get_data'):
+                data, mapping, style = self.get_data(element, ranges, style)
+                PlotProfiler.annotate(data)
 
         # Include old data if source static
         if self.static_source:
@@ -1350,6 +1377,7 @@ class ElementPlot(BokehPlot, GenericElementPlot):
             self._update_datasource(source, data)
 
 
+    @PlotProfiler.profiled('update_frame')
     def update_frame(self, key, ranges=None, plot=None, element=None):
         """
         Updates an existing plot with data corresponding
@@ -1450,7 +1478,9 @@ class CompositeElementPlot(ElementPlot):
         # Get data and initialize data source
         if None in (data, mapping):
             style = self.style[self.cyclic_index]
-            data, mapping, style = self.get_data(element, ranges, style)
+            with PlotProfiler.stage(self, 'get_data'):
+                data, mapping, style = self.get_data(element, ranges, style)
+                PlotProfiler.annotate(data)
 
 
         keys = glyph_order(dict(data, **mapping), self._draw_order)
@@ -1520,7 +1550,9 @@ class CompositeElementPlot(ElementPlot):
             current_id = element._plot_id
         self.handles['previous_id'] = current_id
         self.static_source = (self.dynamic and (current_id == previous_id))
-        data, mapping, style = self.get_data(element, ranges, style)
+        with PlotProfiler.stage(self, 'get_data'):
+            data, mapping, style = self.get_data(element, ranges, style)
+            PlotProfiler.annotate(data)
 
         keys = glyph_order(dict(data, **mapping), self._draw_order)
         for key in keys:
@@ -1675,6 +1707,7 @@ class ColorbarPlot(ElementPlot):
         self.handles[prefix+'colorbar'] = color_bar
 
 
+    @PlotProfiler.profiled('colormapping')
     def _get_colormapper(self, eldim, element, ranges, style, factors=None, colors=None,
                          group=None, name='color_mapper'):
         # The initial colormapper instance is cached the first time
@@ -2112,6 +2145,7 @@ class OverlayPlot(GenericOverlayPlot, LegendPlot):
         return super(OverlayPlot, self)._get_axis_dims(element)
 
 
+    @PlotProfiler.profiled('initialize_plot')
     def initialize_plot(self, ranges=None, plot=None, plots=None):
         key = util.wrap_tuple(self.hmap.last_key)
         nonempty = [(k, el) for k, el in self.hmap.data.items() if el]
@@ -2181,6 +2215,7 @@ class OverlayPlot(GenericOverlayPlot, LegendPlot):
         return self.handles['plot']
 
 
+    @PlotProfiler.profiled('update_frame')
     def update_frame(self, key, ranges=None, element=None):
         """
         Update the internal state of the Plot to represent the given
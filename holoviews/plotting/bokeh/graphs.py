@@ -13,6 +13,7 @@ from ...core.util import basestring, dimension_sanitizer, unique_array
 from ...util.transform import dim
 from ..mixins import ChordMixin
 from ..util import process_cmap, get_directed_graph_paths
+from ..profiling import PlotProfiler
 from .chart import ColorbarPlot, PointPlot
 from .element import CompositeElementPlot, LegendPlot
 from .styles import (
@@ -153,16 +154,25 @@ class GraphPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
 
     def _get_edge_paths(self, element, ranges):
         path_data, mapping = {}, {}
-        xidx, yidx = (1, 0) if self.invert_axes else (0, 1)
         if element._edgepaths is not None:
-            edges = element._split_edgepaths.split(datatype='array', dimensions=element.edgepaths.kdims)
-            if len(edges) == len(element):
-                path_data['xs'] = [path[:, xidx] for path in edges]
-                path_data['ys'] = [path[:, yidx] for path in edges]
+            edgepaths = element._split_edgepaths
+            xdim, ydim = edgepaths.kdims[:2]
+            if edgepaths.interface.datatype == 'packed':
+                # Slice views of the flat vertex columns instead of
+                # splitting into a sub-dataset per edge
+                xs = edgepaths.data.split_column(xdim.name)
+                ys = edgepaths.data.split_column(ydim.name)
+            else:
+                edges = edgepaths.split(datatype='array', dimensions=[xdim, ydim])
+                xs = [path[:, 0] for path in edges]
+                ys = [path[:, 1] for path in edges]
+            if len(xs) == len(element):
+                path_data['xs'] = ys if self.invert_axes else xs
+                path_data['ys'] = xs if self.invert_axes else ys
                 mapping = {'xs': 'xs', 'ys': 'ys'}
             else:
                 raise ValueError("Edge paths do not match the number of supplied edges."
-                                 "Expected %d, found %d paths." % (len(element), len(edges)))
+                                 "Expected %d, found %d paths." % (len(element), len(xs)))
         elif self.directed:
             xdim, ydim = element.nodes.kdims[:2]
             x_range = ranges[xdim.name]['combined']
@@ -249,6 +259,7 @@ class GraphPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
         return data, mapping, style
 
 
+    @PlotProfiler.profiled('datasource')
     def _update_datasource(self, source, data):
         """
         Update datasource with data for a new frame.
@@ -340,7 +351,9 @@ class GraphPlot(CompositeElementPlot, ColorbarPlot, LegendPlot):
     def _init_glyphs(self, plot, element, ranges, source):
         # Get data and initialize data source
         style = self.style[self.cyclic_index]
-        data, mapping, style = self.get_data(element, ranges, style)
+        with PlotProfiler.stage(self, 'get_data'):
+            data, mapping, style = self.get_data(element, ranges, style)
+            PlotProfiler.annotate(data)
         self.handles['previous_id'] = element._plot_id
 
         # Initialize GraphRenderer
@@ -33,9 +33,14 @@ class PathPlot(LegendPlot, ColorbarPlot):
 
     _plot_methods = dict(single='multi_line', batched='multi_line')
     _mapping = dict(xs='xs', ys='ys')
+    _segment_mapping = dict(x0='x0', y0='y0', x1='x1', y1='y1')
     _nonvectorized_styles = base_properties + ['cmap']
     _batched_style_opts = line_properties
 
+    def __init__(self, *args, **params):
+        super(PathPlot, self).__init__(*args, **params)
+        self._segmented = None
+
     def _hover_opts(self, element):
         cdim = element.get_dimension(self.color_index)
         if self.batched:
@@ -60,7 +65,11 @@ class PathPlot(LegendPlot, ColorbarPlot):
                 data[dim] = [v for _ in range(len(list(data.values())[0]))]
 
 
-    def get_data(self, element, ranges, style):
+    def _color_spec(self, element, style):
+        """
+        Returns the dimension the path color is mapped to, whether it
+        is constant along each path and the set of mapped styles.
+        """
         color = style.get('color', None)
         cdim = None
         if isinstance(color, util.basestring) and not validate('color', color):
@@ -73,9 +82,32 @@ class PathPlot(LegendPlot, ColorbarPlot):
             (s, v) for s, v in style.items() if (s not in self._nonvectorized_styles) and
             ((isinstance(v, util.basestring) and v in element) or isinstance(v, dim)) and
             not (v == color and s == 'color')}
-        mapping = dict(self._mapping)
+        return cdim, scalar, style_mapping
+
+
+    def _set_segmented(self, segmented):
+        """
+        Decides once, before the glyph is created, whether the paths
+        are drawn as individual segments using a Segment glyph. Plots
+        with drawing tools always require a MultiLine glyph.
+        """
+        if self._segmented is not None:
+            return
+        self._segmented = segmented and not any(
+            isinstance(cb, (PolyDrawCallback, PolyEditCallback))
+            for cb in self.callbacks)
+        if self._segmented:
+            self._plot_methods = dict(single='segment', batched='segment')
+
 
-        if (not cdim or scalar) and not style_mapping and 'hover' not in self.handles:
+    def get_data(self, element, ranges, style):
+        cdim, scalar, style_mapping = self._color_spec(element, style)
+        hover = 'hover' in self.handles
+        segmented = bool((cdim and not scalar) or style_mapping or hover)
+        self._set_segmented(segmented)
+
+        if not segmented and not self._segmented:
+            mapping = dict(self._mapping)
             if self.static_source:
                 data = {}
             else:
@@ -86,27 +118,71 @@ class PathPlot(LegendPlot, ColorbarPlot):
                 data = dict(xs=xs, ys=ys)
             return data, mapping, style
 
-        hover = 'hover' in self.handles
+        mapping = dict(self._segment_mapping if self._segmented else self._mapping)
         vals = defaultdict(list)
         if hover:
             vals.update({util.dimension_sanitizer(vd.name): [] for vd in element.vdims})
-        if cdim and self.color_index is not None:
+        colored = bool(cdim and self.color_index is not None)
+        if colored:
             dim_name = util.dimension_sanitizer(cdim.name)
             cmapper = self._get_colormapper(cdim, element, ranges, style)
             mapping['line_color'] = {'field': dim_name, 'transform': cmapper}
             vals[dim_name] = []
 
-        xpaths, ypaths = [], []
+        if element.interface.datatype == 'packed':
+            segments = self._get_packed_segments(element, cdim, colored, hover, vals)
+        else:
+            segments = self._get_split_segments(element, cdim, colored, hover, vals)
+        x0, y0, x1, y1, values = segments
+        if self.invert_axes:
+            x0, y0, x1, y1 = y0, x0, y1, x1
+        if self._segmented:
+            data = dict(x0=x0, y0=y0, x1=x1, y1=y1, **values)
+        else:
+            data = dict(xs=list(np.column_stack([x0, x1])),
+                        ys=list(np.column_stack([y0, y1])), **values)
+        self._get_hover_data(data, element)
+        return data, mapping, style
+
+
+    def _get_packed_segments(self, element, cdim, colored, hover, vals):
+        """
+        Gathers the segments of all packed paths at once from the flat
+        vertex arrays.
+        """
+        interface = element.interface
+        starts = interface.segment_starts(element)
+        xs, ys = (interface.vertex_values(element, kd) for kd in element.kdims)
+        values = {d: [] for d in vals}
+        if colored:
+            dim_name = util.dimension_sanitizer(cdim.name)
+            values[dim_name] = interface.vertex_values(element, cdim)[starts]
+        for vd in (element.vdims if hover else []):
+            if vd == cdim:
+                continue
+            vd_vals = interface.vertex_values(element, vd)[starts]
+            vd_name = util.dimension_sanitizer(vd.name)
+            values[vd_name] = vd_vals
+            if vd_vals.dtype.kind == 'M' or (len(vd_vals) and isinstance(vd_vals[0], util.datetime_types)):
+                values[vd_name+'_dt_strings'] = [vd.pprint_value(v) for v in vd_vals]
+        return xs[starts], ys[starts], xs[starts+1], ys[starts+1], values
+
+
+    def _get_split_segments(self, element, cdim, colored, hover, vals):
+        """
+        Collects the segments by splitting the element into paths.
+        """
+        # Each vertex except the last starts a segment
+        x0, y0, x1, y1 = [], [], [], []
         for path in element.split():
-            if cdim and self.color_index is not None:
-                scalar = path.interface.isunique(path, cdim, per_geom=True)
-                cvals = path.dimension_values(cdim, not scalar)
-                vals[dim_name].append(cvals[:-1])
             cols = path.columns(path.kdims)
             xs, ys = (cols[kd.name] for kd in element.kdims)
-            alen = len(xs)
-            xpaths += [xs[s1:s2+1] for (s1, s2) in zip(range(alen-1), range(1, alen+1))]
-            ypaths += [ys[s1:s2+1] for (s1, s2) in zip(range(alen-1), range(1, alen+1))]
+            x0.append(xs[:-1])
+            x1.append(xs[1:])
+            y0.append(ys[:-1])
+            y1.append(ys[1:])
+            if colored:
+                vals[util.dimension_sanitizer(cdim.name)].append(path.dimension_values(cdim)[:-1])
             if not hover:
                 continue
             for vd in element.vdims:
@@ -118,17 +194,26 @@ class PathPlot(LegendPlot, ColorbarPlot):
                 if values.dtype.kind == 'M' or (len(values) and isinstance(values[0], util.datetime_types)):
                     vals[vd_name+'_dt_strings'].append([vd.pprint_value(v) for v in values])
         values = {d: np.concatenate(vs) if len(vs) else [] for d, vs in vals.items()}
-        if self.invert_axes:
-            xpaths, ypaths = ypaths, xpaths
-        data = dict(xs=xpaths, ys=ypaths, **values)
-        self._get_hover_data(data, element)
-        return data, mapping, style
+        x0, y0, x1, y1 = (np.concatenate(c) if c else np.array([])
+                          for c in (x0, y0, x1, y1))
+        return x0, y0, x1, y1, values
 
 
     def get_batched_data(self, element, ranges=None):
         data = defaultdict(list)
 
         zorders = self._updated_zorders(element)
+        if self._segmented is None:
+            # All batched paths have to share the same glyph
+            segmented = 'hover' in self.handles
+            for (key, el), zorder in zip(element.data.items(), zorders):
+                self.param.set_param(**self.lookup_options(el, 'plot').options)
+                style = self.lookup_options(el, 'style')
+                style = style.max_cycles(len(self.ordering))[zorder]
+                cdim, scalar, style_mapping = self._color_spec(el, style)
+                segmented |= bool((cdim and not scalar) or style_mapping)
+            self._set_segmented(segmented)
+
         for (key, el), zorder in zip(element.data.items(), zorders):
             self.param.set_param(**self.lookup_options(el, 'plot').options)
             style = self.lookup_options(el, 'style')
@@ -29,12 +29,13 @@ from ..plot import (
     GenericElementPlot, GenericOverlayPlot, GenericAdjointLayoutPlot,
     CallbackPlot
 )
+from ..profiling import PlotProfiler
 from ..util import attach_streams, displayable, collate
 from .callbacks import LinkCallback
 from .util import (
     TOOL_TYPES, filter_toolboxes, make_axis, update_shared_sources,
     empty_plot, decode_bytes, theme_attr_json, cds_column_replace,
-    get_default
+    cds_column_diff, cds_column_fingerprint, get_default
 )
 
 
@@ -100,14 +101,20 @@ class BokehPlot(DimensionedPlot, CallbackPlot):
         raise NotImplementedError
 
 
+    @PlotProfiler.profiled('datasource')
     def _init_datasource(self, data):
         """
         Initializes a data source to be passed into the bokeh glyph.
         """
         data = self._postprocess_data(data)
-        return ColumnDataSource(data=data)
+        PlotProfiler.annotate(data)
+        source = ColumnDataSource(data=data)
+        self._column_fingerprints[source.id] = {
+            k: cds_column_fingerprint(v) for k, v in data.items()}
+        return source
 
 
+    @PlotProfiler.profiled('postprocess_data')
     def _postprocess_data(self, data):
         """
         Applies necessary type transformation to the data before
@@ -131,6 +138,7 @@ class BokehPlot(DimensionedPlot, CallbackPlot):
         return new_data
 
 
+    @PlotProfiler.profiled('datasource')
     def _update_datasource(self, source, data):
         """
         Update datasource with data for a new frame.
@@ -145,13 +153,49 @@ class BokehPlot(DimensionedPlot, CallbackPlot):
             stream = self.streaming[0]
             if stream._triggering:
                 data = {k: v[-stream._chunk_length:] for k, v in data.items()}
+                self._column_fingerprints.pop(source.id, None)
                 source.stream(data, stream.length)
+                PlotProfiler.annotate(data)
             return
 
+        fingerprints = self._column_fingerprints.setdefault(source.id, {})
+        copies = self._column_copies.setdefault(source.id, {})
         if cds_column_replace(source, data):
+            fingerprints.clear()
+            fingerprints.update({k: cds_column_fingerprint(v) for k, v in data.items()})
+            copies.clear()
             source.data = data
-        else:
-            source.data.update(data)
+            PlotProfiler.annotate(data)
+            return
+
+        # Only send the columns, rows or appended rows which changed
+        owned = [k for k, v in copies.items() if source.data.get(k) is v]
+        update, changes = cds_column_diff(source.data, data, fingerprints,
+                                          owned=owned)
+        if update == 'stream':
+            for k in changes:
+                copies.pop(k, None)
+            source.stream(changes)
+        elif update == 'patch':
+            # Patches are applied in place, so only patch copies of
+            # the columns previously sent by the plot and otherwise
+            # send a copy of the column which later patches may modify
+            patches = {k: v for k, v in changes.items()
+                       if source.data[k] is copies.get(k)}
+            columns = {k: data[k].copy() for k in changes if k not in patches}
+            copies.update(columns)
+            if patches:
+                source.patch(patches)
+                PlotProfiler.annotate(patches, patches=True)
+            if columns:
+                source.data.update(columns)
+                PlotProfiler.annotate(columns)
+            return
+        elif changes:
+            for k in changes:
+                copies.pop(k, None)
+            source.data.update(changes)
+        PlotProfiler.annotate(changes)
 
     def _update_callbacks(self, plot):
         """
@@ -572,6 +616,7 @@ class GridPlot(CompositePlot, GenericCompositePlot):
         return subplots, collapsed_layout
 
 
+    @PlotProfiler.profiled('initialize_plot')
     def initialize_plot(self, ranges=None, plots=[]):
         ranges = self.compute_ranges(self.layout, self.keys[-1], None)
         passed_plots = list(plots)
@@ -655,6 +700,7 @@ class GridPlot(CompositePlot, GenericCompositePlot):
 
 
     @update_shared_sources
+    @PlotProfiler.profiled('update_frame')
     def update_frame(self, key, ranges=None):
         """
         Update the internal state of the Plot to represent the given
@@ -857,6 +903,7 @@ class LayoutPlot(CompositePlot, GenericLayoutPlot):
         return grid
 
 
+    @PlotProfiler.profiled('initialize_plot')
     def initialize_plot(self, plots=None, ranges=None):
         ranges = self.compute_ranges(self.layout, self.keys[-1], None)
         opts = self.layout.opts.get('plot', self.backend)
@@ -985,6 +1032,7 @@ class LayoutPlot(CompositePlot, GenericLayoutPlot):
         return self.handles['plot']
 
     @update_shared_sources
+    @PlotProfiler.profiled('update_frame')
     def update_frame(self, key, ranges=None):
         """
         Update the internal state of the Plot to represent the given
@@ -1017,6 +1065,7 @@ class AdjointLayoutPlot(BokehPlot, GenericAdjointLayoutPlot):
         super(AdjointLayoutPlot, self).__init__(subplots=subplots, **params)
 
 
+    @PlotProfiler.profiled('initialize_plot')
     def initialize_plot(self, ranges=None, plots=[]):
         """
         Plot all the views contained in the AdjointLayout Object using axes
@@ -1041,6 +1090,7 @@ class AdjointLayoutPlot(BokehPlot, GenericAdjointLayoutPlot):
         return adjoined_plots
 
 
+    @PlotProfiler.profiled('update_frame')
     def update_frame(self, key, ranges=None):
         plot = None
         for pos in ['main', 'right', 'top']:
@@ -3,9 +3,11 @@ from __future__ import absolute_import, division, unicode_literals
 import numpy as np
 import param
 
-from bokeh.models import DatetimeAxis, CustomJSHover
+from bokeh.models import (
+    DatetimeAxis, CustomJSHover, LinearColorMapper, LogColorMapper
+)
 
-from ...core.util import cartesian_product, dimension_sanitizer, isfinite
+from ...core.util import cartesian_product, dimension_sanitizer, fingerprint, isfinite
 from ...element import Raster
 from .element import ElementPlot, ColorbarPlot
 from .selection import BokehOverlaySelectionDisplay
@@ -17,6 +19,17 @@ class RasterPlot(ColorbarPlot):
 
     clipping_colors = param.Dict(default={'NaN': 'transparent'})
 
+    image_dtype = param.ObjectSelector(default=None, objects=[
+        None, 'float32', 'uint16', 'uint8'], doc="""
+        The data type used to transfer the image to the browser. By
+        default the image is sent at its original precision, 'float32'
+        downcasts double precision data while 'uint16' and 'uint8'
+        quantize the values into the range of the color mapper,
+        reducing the size of each update by a factor of 4 or 8
+        compared to float64. Quantization falls back to float32 when
+        the values cannot be represented by the color mapper, e.g.
+        when hover is enabled or for clipped NaNs.""")
+
     padding = param.ClassSelector(default=0, class_=(int, float, tuple))
 
     show_legend = param.Boolean(default=False, doc="""
@@ -74,11 +87,113 @@ class RasterPlot(ColorbarPlot):
         super(RasterPlot, self).__init__(*args, **kwargs)
         if self.hmap.type == Raster:
             self.invert_yaxis = not self.invert_yaxis
+        self._image_cache = {}
+
+    def _quantize_image(self, img, cmapper):
+        """
+        Quantizes the image into integer codes of the image_dtype
+        spanning the range of the supplied color mapper. Code zero
+        encodes NaNs (or values below the range when a low_color is
+        set) and the maximum code values above the range. Returns the
+        quantized image and a matching color mapper or None if the
+        image cannot be quantized.
+        """
+        log = type(cmapper) is LogColorMapper
+        if (type(cmapper) not in (LinearColorMapper, LogColorMapper) or
+            img.dtype.kind not in 'uif' or cmapper.low is None or
+            cmapper.high is None or not cmapper.high > cmapper.low or
+            (log and cmapper.low <= 0)):
+            return None
+        nans = np.isnan(img) if img.dtype.kind == 'f' else None
+        if nans is not None and not nans.any():
+            nans = None
+        if nans is not None and cmapper.low_color is not None:
+            return None
+
+        levels = np.iinfo(self.image_dtype).max - 1
+        low, high = cmapper.low, cmapper.high
+        if log:
+            low, high = np.log(low), np.log(high)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                img = np.log(img)
+        scaled = (img - low) * (levels / (high - low))
+        codes = np.floor(scaled)
+        codes += 1
+        np.clip(codes, 1, levels, out=codes)
+        if cmapper.low_color is not None:
+            codes[scaled < 0] = 0
+        if cmapper.high_color is not None:
+            codes[scaled > levels] = levels + 1
+        if nans is not None:
+            codes[nans] = 0
+        codes = codes.astype(self.image_dtype, order='C')
+
+        qmapper = self.handles.get('quantized_mapper')
+        opts = dict(palette=cmapper.palette, low=0.5, high=levels+0.5,
+                    low_color=cmapper.nan_color if cmapper.low_color is None else cmapper.low_color,
+                    high_color=cmapper.high_color)
+        if qmapper is None:
+            qmapper = LinearColorMapper(**opts)
+            self.handles['quantized_mapper'] = qmapper
+        else:
+            opts = {k: v for k, v in opts.items() if getattr(qmapper, k) != v}
+            if opts:
+                qmapper.update(**opts)
+        return codes, qmapper
+
+    def _get_image(self, element, index, cmapper=None):
+        """
+        Returns the oriented image array of the vdim at the supplied
+        index in the image_dtype, along with the color mapper to apply
+        to it. Images are cached by the content fingerprint of the
+        element data so that the same array object is returned while
+        the data is unchanged, including after in-place updates.
+        """
+        quantize = (cmapper is not None and self.image_dtype in ('uint8', 'uint16')
+                    and 'hover' not in self.handles)
+        params = (self.image_dtype, self.invert_axes, self.invert_xaxis, self.invert_yaxis,
+                  quantize and (type(cmapper), cmapper.low, cmapper.high,
+                                cmapper.low_color, cmapper.high_color))
+        data = element.data
+        if isinstance(data, dict):
+            key = tuple((k, fingerprint(v)) for k, v in data.items())
+            if any(fp is None for _, fp in key):
+                key = None
+        else:
+            key = fingerprint(data)
+        cached = self._image_cache.get(index)
+        if key is not None and cached and cached[0] == key and cached[1] == params:
+            return cached[2], cached[3] or cmapper
+
+        img = element.dimension_values(index, flat=False)
+        if img.dtype.kind == 'b':
+            img = img.astype(np.int8)
+        if 0 in img.shape:
+            img = np.array([[np.NaN]])
+        if ((self.invert_axes and not type(element) is Raster) or
+            (not self.invert_axes and type(element) is Raster)):
+            img = img.T
+        if self.invert_xaxis:
+            img = img[:, ::-1]
+        if self.invert_yaxis:
+            img = img[::-1]
+
+        qmapper = None
+        if quantize:
+            quantized = self._quantize_image(img, cmapper)
+            if quantized is not None:
+                img, qmapper = quantized
+        if self.image_dtype is not None and qmapper is None and img.dtype.kind == 'f':
+            img = img.astype(np.float32, order='C', copy=False)
+        if key is not None:
+            self._image_cache[index] = (key, params, img, qmapper)
+        return img, qmapper or cmapper
 
     def get_data(self, element, ranges, style):
         mapping = dict(image='image', x='x', y='y', dw='dw', dh='dh')
         val_dim = element.vdims[0]
-        style['color_mapper'] = self._get_colormapper(val_dim, element, ranges, style)
+        cmapper = self._get_colormapper(val_dim, element, ranges, style)
+        style['color_mapper'] = cmapper
         if 'alpha' in style:
             style['global_alpha'] = style['alpha']
 
@@ -104,19 +219,12 @@ class RasterPlot(ColorbarPlot):
         for i, vdim in enumerate(element.vdims, 2):
             if i > 2 and 'hover' not in self.handles:
                 break
-            img = element.dimension_values(i, flat=False)
-            if img.dtype.kind == 'b':
-                img = img.astype(np.int8)
-            if 0 in img.shape:
-                img = np.array([[np.NaN]])
-            if ((self.invert_axes and not type(element) is Raster) or
-                (not self.invert_axes and type(element) is Raster)):
-                img = img.T
-            if self.invert_xaxis:
-                img = img[:, ::-1]
-            if self.invert_yaxis:
-                img = img[::-1]
-            key = 'image' if i == 2 else dimension_sanitizer(vdim.name)
+            if i == 2:
+                img, style['color_mapper'] = self._get_image(element, i, cmapper)
+                key = 'image'
+            else:
+                img, _ = self._get_image(element, i)
+                key = dimension_sanitizer(vdim.name)
             data[key] = [img]
 
         return (data, mapping, style)
@@ -140,6 +248,30 @@ class RGBPlot(ElementPlot):
         return [(xdim.pprint_label, '$x'), (ydim.pprint_label, '$y'),
                 ('RGBA', '@image')], {}
 
+    def _pack_rgba(self, channels):
+        """
+        Packs the RGB(A) channels into a NxM uint32 array, writing
+        each channel directly into a single uint8 RGBA buffer.
+        """
+        N, M = channels[0].shape
+        rgba = np.empty((N, M, 4), dtype=np.uint8)
+        scale = any(c.dtype.kind == 'f' for c in channels)
+        clipped = False
+        for i, channel in enumerate(channels):
+            if scale:
+                channel = channel*255
+            if channel.size and (channel.min() < 0 or channel.max() > 255):
+                clipped = True
+                channel = np.clip(channel, 0, 255)
+            rgba[..., i] = channel
+        if len(channels) == 3: # alpha channel not included
+            rgba[..., 3] = 255
+        if clipped:
+            self.param.warning('Clipping input data to the valid '
+                               'range for RGB data ([0..1] for '
+                               'floats or [0..255] for integers).')
+        return rgba.view(dtype=np.uint32).reshape((N, M))
+
     def get_data(self, element, ranges, style):
         mapping = dict(image='image', x='x', y='y', dw='dw', dh='dh')
         if 'alpha' in style:
@@ -148,42 +280,23 @@ class RGBPlot(ElementPlot):
         if self.static_source:
             return {}, mapping, style
 
-        img = np.dstack([element.dimension_values(d, flat=False)
-                         for d in element.vdims])
-        if img.ndim == 3:
-            if img.dtype.kind == 'f':
-                img = img*255
-            if img.size and (img.min() < 0 or img.max() > 255):
-                self.param.warning('Clipping input data to the valid '
-                                   'range for RGB data ([0..1] for '
-                                   'floats or [0..255] for integers).')
-                img = np.clip(img, 0, 255)
-
-            if img.dtype.name != 'uint8':
-                img = img.astype(np.uint8)
-            if img.shape[2] == 3: # alpha channel not included
-                alpha = np.full(img.shape[:2], 255, dtype='uint8')
-                img = np.dstack([img, alpha])
-            N, M, _ = img.shape
-            #convert image NxM dtype=uint32
-            if not img.flags['C_CONTIGUOUS']:
-                img = img.copy()
-            img = img.view(dtype=np.uint32).reshape((N, M))
-
-        # Ensure axis inversions are handled correctly
+        # Orient the channels before packing so the RGBA buffer is
+        # allocated once, in C order
+        channels = [element.dimension_values(d, flat=False) for d in element.vdims]
         l, b, r, t = element.bounds.lbrt()
         if self.invert_axes:
-            img = img.T
+            channels = [c.T for c in channels]
             l, b, r, t = b, l, t, r
-            
+
         dh, dw = t-b, r-l
         if self.invert_xaxis:
             l, r = r, l
-            img = img[:, ::-1]
+            channels = [c[:, ::-1] for c in channels]
         if self.invert_yaxis:
-            img = img[::-1]
+            channels = [c[::-1] for c in channels]
             b, t = t, b
 
+        img = self._pack_rgba(channels)
         if 0 in img.shape:
             img = np.zeros((1, 1), dtype=np.uint32)
 
@@ -18,6 +18,7 @@ from param.parameterized import bothmethod
 from ...core import Store, HoloMap
 from ..plot import Plot
 from ..renderer import Renderer, MIME_TYPES, HTML_TAGS
+from ..profiling import PlotProfiler
 from .util import compute_plot_size
 
 
@@ -77,6 +78,7 @@ class BokehRenderer(Renderer):
         return plot
 
 
+    @PlotProfiler.profiled('render', plot_arg=True)
     def _figure_data(self, plot, fmt, doc=None, as_script=False, **kwargs):
         """
         Given a plot instance, an output format and an optional bokeh
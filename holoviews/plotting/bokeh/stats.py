@@ -9,12 +9,13 @@ import numpy as np
 from bokeh.models import FactorRange, Circle, VBar, HBar
 
 from .selection import BokehOverlaySelectionDisplay
-from ...core import NdOverlay
+from ...core import NdOverlay, OrderedDict
 from ...core.dimension import Dimension, Dimensioned
 from ...core.ndmapping import sorted_context
 from ...core.util import (basestring, dimension_sanitizer, wrap_tuple,
                           unique_iterator, unique_array, isfinite)
-from ...operation.stats import univariate_kde
+from ...element import Area
+from ...operation.stats import univariate_kde, _univariate_kdes
 from ...util.transform import dim
 from .chart import AreaPlot
 from .element import CompositeElementPlot, ColorbarPlot, LegendPlot
@@ -308,6 +309,13 @@ class ViolinPlot(BoxWhiskerPlot):
     cut = param.Number(default=5, doc="""
         Draw the estimate to cut * bw from the extreme data points.""")
 
+    estimator = param.ObjectSelector(default='scipy', objects=['scipy', 'binned'], doc="""
+        Whether to compute the density estimates using SciPy's
+        gaussian_kde or by binning the samples and convolving them
+        with the kernel using an FFT, which computes the estimates
+        of all violins in a single pass and is much faster for large
+        numbers of samples.""")
+
     inner = param.ObjectSelector(objects=['box', 'quartiles', 'stick', None],
                                  default='box', doc="""
         Inner visual indicator for distribution values:
@@ -371,9 +379,12 @@ class ViolinPlot(BoxWhiskerPlot):
             xfactors, yfactors = factors, []
         return (yfactors, xfactors) if self.invert_axes else (xfactors, yfactors)
 
-    def _kde_data(self, element, el, key, split_dim, **kwargs):
-        vdims = el.vdims
-        vdim = vdims[0]
+    def _kde_element(self, element, el, split_dim):
+        """
+        Returns the group element to compute the density estimate on,
+        with the clip range applied and the split categories added.
+        """
+        vdim = el.vdims[0]
         if self.clip:
             vdim = vdim(range=self.clip)
             el = el.clone(vdims=[vdim])
@@ -388,11 +399,56 @@ class ViolinPlot(BoxWhiskerPlot):
                     'greater than 2! Found {0} categories: {1}'.format(
                         len(bin_cats), ', '.join(bin_cats)))
             el = el.add_dimension(repr(split_dim), len(el.kdims), all_cats)
+        return el, vdim
 
-            kdes = univariate_kde(el, dimension=vdim.name, groupby=repr(split_dim), **kwargs)
+
+    def _binned_kdes(self, element, groups, split_dim, **kwargs):
+        """
+        Computes the density estimates of all groups (and split
+        categories) in a single pass, returning a list of the
+        estimates in the same format as univariate_kde.
+        """
+        samples, ranges, structure, clip = [], [], [], (None, None)
+        for g in groups:
+            el, vdim = self._kde_element(element, g, split_dim)
+            clip = vdim.range
+            subsets = el.groupby(repr(split_dim)) if split_dim is not None else {None: el}
+            structure.append((vdim, list(subsets.keys())))
+            for subset in subsets.values():
+                values = subset.dimension_values(vdim)
+                bin_range = subset.range(vdim)
+                if bin_range == (0, 0) or any(not isfinite(r) for r in bin_range):
+                    bin_range = (0, 1)
+                elif bin_range[0] == bin_range[1]:
+                    bin_range = (bin_range[0]-0.5, bin_range[1]+0.5)
+                samples.append(values[isfinite(values)])
+                ranges.append(bin_range)
+
+        kdes = iter(_univariate_kdes(samples, ranges, kwargs.get('bandwidth'),
+                                     kwargs.get('cut', 3), clip=clip))
+        results = []
+        for vdim, keys in structure:
+            vdims = [Dimension('{}_density'.format(vdim.name), label='Density')]
+            areas = OrderedDict()
+            for k in keys:
+                xs, ys = next(kdes)
+                areas[k] = Area((xs, ys) if ys is not None else [], [vdim], vdims)
+            if split_dim is None:
+                results.append([areas[None]]*2)
+            else:
+                results.append(NdOverlay(areas, kdims=[repr(split_dim)]))
+        return results
+
+
+    def _kde_data(self, element, el, key, split_dim, kdes=None, **kwargs):
+        el, vdim = self._kde_element(element, el, split_dim)
+        if split_dim is not None:
+            if kdes is None:
+                kdes = univariate_kde(el, dimension=vdim.name, groupby=repr(split_dim), **kwargs)
             scale = 4
         else:
-            kdes = [univariate_kde(el, dimension=vdim.name, **kwargs)] * 2
+            if kdes is None:
+                kdes = [univariate_kde(el, dimension=vdim.name, **kwargs)] * 2
             scale = 2
 
         x_range = el.range(vdim)
@@ -503,11 +559,15 @@ class ViolinPlot(BoxWhiskerPlot):
             bar_glyph = 'vbar'
 
         kwargs = {'bandwidth': self.bandwidth, 'cut': self.cut}
+        if self.estimator == 'binned':
+            kdes = self._binned_kdes(element, groups.values(), split_dim, **kwargs)
+        else:
+            kdes = [None]*len(groups)
         mapping, data = {}, {}
         kde_data, line_data, seg_data, bar_data, scatter_data = (defaultdict(list) for i in range(5))
-        for i, (key, g) in enumerate(groups.items()):
+        for i, ((key, g), kde) in enumerate(zip(groups.items(), kdes)):
             key = decode_bytes(key)
-            kde, line, segs, bars, scatter = self._kde_data(element, g, key, split_dim, **kwargs)
+            kde, line, segs, bars, scatter = self._kde_data(element, g, key, split_dim, kde, **kwargs)
             for k, v in segs.items():
                 seg_data[k] += v
             for k, v in bars.items():
@@ -13,6 +13,7 @@ from ...element import ItemTable
 from ...streams import Buffer
 from ...core.util import dimension_sanitizer, isdatetime
 from ..plot import GenericElementPlot
+from ..profiling import PlotProfiler
 from .plot import BokehPlot
 from .selection import TabularSelectionDisplay
 
@@ -47,12 +48,15 @@ class TablePlot(BokehPlot, GenericElementPlot):
         self.callbacks = self._construct_callbacks()
         self.streaming = [s for s in self.streams if isinstance(s, Buffer)]
         self.static_source = False
+        self._column_fingerprints = {}
+        self._column_copies = {}
 
     def get_data(self, element, ranges, style):
         return ({dimension_sanitizer(d.name): element.dimension_values(d)
                  for d in element.dimensions()}, {}, style)
 
 
+    @PlotProfiler.profiled('initialize_plot')
     def initialize_plot(self, ranges=None, plot=None, plots=None, source=None):
         """
         Initializes a new plot object with the last available frame.
@@ -64,7 +68,9 @@ class TablePlot(BokehPlot, GenericElementPlot):
         self.current_key = key
 
         style = self.lookup_options(element, 'style')[self.cyclic_index]
-        data, _, style = self.get_data(element, ranges, style)
+        with PlotProfiler.stage(self, 'get_data'):
+            data, _, style = self.get_data(element, ranges, style)
+            PlotProfiler.annotate(data)
         if source is None:
             source = self._init_datasource(data)
         self.handles['source'] = self.handles['cds'] = source
@@ -118,6 +124,7 @@ class TablePlot(BokehPlot, GenericElementPlot):
         return columns
 
 
+    @PlotProfiler.profiled('update_frame')
     def update_frame(self, key, ranges=None, plot=None):
         """
         Updates an existing plot with data corresponding
@@ -137,7 +144,9 @@ class TablePlot(BokehPlot, GenericElementPlot):
             return
         source = self.handles['source']
         style = self.lookup_options(element, 'style')[self.cyclic_index]
-        data, _, style = self.get_data(element, ranges, style)
+        with PlotProfiler.stage(self, 'get_data'):
+            data, _, style = self.get_data(element, ranges, style)
+            PlotProfiler.annotate(data)
         columns = self._get_columns(element, data)
         self.handles['table'].columns = columns
         if 'selected' in style:
@@ -43,7 +43,8 @@ from ...core.ndmapping import NdMapping
 from ...core.overlay import Overlay
 from ...core.util import (
     LooseVersion, _getargspec, basestring, callable_name, cftime_types,
-    cftime_to_timestamp, pd, unique_array, isnumeric, arraylike_types
+    cftime_to_timestamp, pd, unique_array, isnumeric, arraylike_types,
+    fingerprint
 )
 from ...core.spaces import get_nested_dmaps, DynamicMap
 from ..util import dim_axis_label
@@ -659,6 +660,127 @@ def cds_column_replace(source, data):
     return bool(untouched and current_length and new_length and current_length[0] != new_length[0])
 
 
+def _changed_rows(old, new):
+    """
+    Returns a boolean mask of the rows which differ between two
+    numeric, boolean or datetime arrays of the same shape and dtype,
+    treating NaNs and NaTs as equal, or None if the arrays cannot be
+    compared row by row.
+    """
+    if not (isinstance(old, np.ndarray) and isinstance(new, np.ndarray) and
+            old.ndim == new.ndim == 1 and old.shape == new.shape and
+            old.dtype == new.dtype and new.dtype.kind in 'biufMm'):
+        return None
+    changed = old != new
+    if new.dtype.kind == 'f':
+        changed &= ~(np.isnan(old) & np.isnan(new))
+    elif new.dtype.kind in 'Mm':
+        changed &= ~(np.isnat(old) & np.isnat(new))
+    return changed
+
+
+def cds_column_fingerprint(column):
+    """
+    Returns a fingerprint of the contents of a ColumnDataSource
+    column, which may be an array or a list of values or arrays, or
+    None if the column cannot be fingerprinted.
+    """
+    if isinstance(column, np.ndarray):
+        fp = fingerprint(column)
+        if fp is not None or column.dtype.kind != 'O':
+            return fp
+    elif not isinstance(column, list):
+        return None
+    fps = []
+    for value in column:
+        if isinstance(value, np.ndarray):
+            value = fingerprint(value)
+            if value is None:
+                return None
+        fps.append(value)
+    try:
+        return ('column', len(fps), hash(tuple(fps)))
+    except TypeError:
+        return None
+
+
+def cds_column_diff(current, data, fingerprints=None, patch_fraction=0.1,
+                    owned=()):
+    """
+    Compares new ColumnDataSource data against the current data column
+    by column and determines the smallest update. Returns a tuple of
+    the update type and the corresponding data, where the type is one
+    of:
+
+    * 'stream': All columns append rows to the current columns, the
+                data contains only the appended rows.
+    * 'patch':  At most the patch_fraction of rows changed in numeric
+                columns, the data contains the patches by column.
+    * 'update': The data contains only the changed columns, which is
+                empty if nothing changed.
+
+    Columns are compared against the fingerprints of the columns
+    when they were last sent, since the current arrays may have been
+    modified in place since. The fingerprints dictionary is updated
+    with those of the new data and defaults to the fingerprints of
+    the current columns. Current columns listed in owned are known
+    to still hold the data last sent, e.g. copies only modified by
+    the caller, and are not fingerprinted again.
+    """
+    if fingerprints is None:
+        fingerprints = {k: cds_column_fingerprint(v) for k, v in current.items()}
+        owned = current
+    sent = dict(fingerprints)
+    fingerprints.clear()
+    fingerprints.update({k: cds_column_fingerprint(v) for k, v in data.items()})
+
+    intact_columns = {}
+    def intact(k):
+        # Whether the current column still holds the data last sent
+        # and may therefore be compared row by row
+        if k not in intact_columns:
+            old = current.get(k)
+            intact_columns[k] = (
+                old is not None and old is not data[k] and sent.get(k) is not None
+                and (k in owned or cds_column_fingerprint(old) == sent[k]))
+        return intact_columns[k]
+
+    old_lengths = {len(v) for v in current.values()}
+    new_lengths = {len(v) for v in data.values()}
+    if (data and set(data) == set(current) and len(old_lengths) == 1 and
+        len(new_lengths) == 1 and 0 < list(old_lengths)[0] < list(new_lengths)[0]
+        and all(intact(k) for k in data)):
+        nrows = list(old_lengths)[0]
+        masks = [_changed_rows(current[k], v[:nrows]) for k, v in data.items()]
+        if all(mask is not None and not mask.any() for mask in masks):
+            return 'stream', {k: v[nrows:] for k, v in data.items()}
+
+    changed, masks = {}, {}
+    for k, new in data.items():
+        if fingerprints[k] is not None and fingerprints[k] == sent.get(k):
+            continue
+        mask = _changed_rows(current[k], new) if intact(k) else None
+        if mask is not None:
+            if not mask.any():
+                continue
+            masks[k] = mask
+        changed[k] = new
+
+    if not changed or set(changed) != set(masks):
+        return 'update', changed
+    patches = {}
+    for k, mask in masks.items():
+        new = changed[k]
+        if new.dtype.kind not in 'biuf' or mask.sum() > len(mask)*patch_fraction:
+            return 'update', changed
+        index = np.flatnonzero(mask)
+        values = new[index]
+        if values.dtype.kind == 'f' and not np.isfinite(values).all():
+            return 'update', changed
+        patches[k] = list(zip(index.tolist(), values.tolist()))
+    return 'patch', patches
+
+
 @contextmanager
 def hold_policy(document, policy, server=False):
     """
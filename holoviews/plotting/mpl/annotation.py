@@ -9,6 +9,7 @@ from matplotlib.lines import Line2D
 
 from ...core.util import match_spec, basestring
 from ...core.options import abbreviated_exception
+from ..profiling import PlotProfiler
 from .element import ElementPlot, ColorbarPlot
 from .plot import mpl_rc_context
 
@@ -59,6 +60,7 @@ class AnnotationPlot(ElementPlot):
         self.handles['annotations'] = []
 
     @mpl_rc_context
+    @PlotProfiler.profiled('initialize_plot')
     def initialize_plot(self, ranges=None):
         annotation = self.hmap.last
         key = self.keys[-1]
@@ -20,6 +20,7 @@ from ...util.transform import dim
 from ..plot import PlotSelector
 from ..mixins import AreaMixin, BarsMixin, SpikesMixin
 from ..util import compute_sizes, get_sideplot_ranges, get_min_distance
+from ..profiling import PlotProfiler
 from .element import ElementPlot, ColorbarPlot, LegendPlot
 from .path  import PathPlot
 from .plot import AdjoinedPlot, mpl_rc_context
@@ -99,7 +100,9 @@ class CurvePlot(ChartPlot):
 
     def update_handles(self, key, axis, element, ranges, style):
         artist = self.handles['artist']
-        (xs, ys), style, axis_kwargs = self.get_data(element, ranges, style)
+        with PlotProfiler.stage(self, 'get_data'):
+            (xs, ys), style, axis_kwargs = self.get_data(element, ranges, style)
+            PlotProfiler.annotate((xs, ys))
         artist.set_xdata(xs)
         artist.set_ydata(ys)
         return axis_kwargs
@@ -170,7 +173,8 @@ class ErrorPlot(ColorbarPlot):
         tops = self.handles['tops']
         verts = self.handles['verts']
 
-        _, style, axis_kwargs = self.get_data(element, ranges, style)
+        with PlotProfiler.stage(self, 'get_data'):
+            _, style, axis_kwargs = self.get_data(element, ranges, style)
         xs, ys, neg_error = (element.dimension_values(i) for i in range(3))
         pos_idx = 3 if len(element.dimensions()) > 3 else 2
         pos_error = element.dimension_values(pos_idx)
@@ -311,6 +315,7 @@ class HistogramPlot(ColorbarPlot):
 
 
     @mpl_rc_context
+    @PlotProfiler.profiled('initialize_plot')
     def initialize_plot(self, ranges=None):
         hist = self.hmap.last
         key = self.keys[-1]
@@ -653,7 +658,9 @@ class PointPlot(ChartPlot, ColorbarPlot):
 
     def update_handles(self, key, axis, element, ranges, style):
         paths = self.handles['artist']
-        (xs, ys), style, _ = self.get_data(element, ranges, style)
+        with PlotProfiler.stage(self, 'get_data'):
+            (xs, ys), style, _ = self.get_data(element, ranges, style)
+            PlotProfiler.annotate((xs, ys))
         xdim, ydim = element.dimensions()[:2]
         if 'factors' in ranges.get(xdim.name, {}):
             factors = list(ranges[xdim.name]['factors'])
@@ -819,7 +826,9 @@ class VectorFieldPlot(ColorbarPlot):
         return args, style, {}
 
     def update_handles(self, key, axis, element, ranges, style):
-        args, style, axis_kwargs = self.get_data(element, ranges, style)
+        with PlotProfiler.stage(self, 'get_data'):
+            args, style, axis_kwargs = self.get_data(element, ranges, style)
+            PlotProfiler.annotate(args)
 
         # Set magnitudes, angles and colors if supplied.
         quiver = self.handles['artist']
@@ -892,6 +901,7 @@ class BarPlot(BarsMixin, ColorbarPlot, LegendPlot):
 
 
     @mpl_rc_context
+    @PlotProfiler.profiled('initialize_plot')
     def initialize_plot(self, ranges=None):
         element = self.hmap.last
         vdim = element.vdims[0]
@@ -1114,7 +1124,9 @@ class SpikesPlot(SpikesMixin, PathPlot, ColorbarPlot):
 
     def update_handles(self, key, axis, element, ranges, style):
         artist = self.handles['artist']
-        (data,), kwargs, axis_kwargs = self.get_data(element, ranges, style)
+        with PlotProfiler.stage(self, 'get_data'):
+            (data,), kwargs, axis_kwargs = self.get_data(element, ranges, style)
+            PlotProfiler.annotate((data,))
         artist.set_paths(data)
         artist.set_visible(style.get('visible', True))
         if 'color' in kwargs:
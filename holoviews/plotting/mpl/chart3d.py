@@ -9,6 +9,7 @@ from ...core import Dimension
 from ...core.options import abbreviated_exception
 from ...core.util import basestring
 from ..util import map_colors
+from ..profiling import PlotProfiler
 from .element import ColorbarPlot
 from .chart import PointPlot
 from .path import PathPlot
@@ -137,7 +138,9 @@ class Scatter3DPlot(Plot3D, PointPlot):
 
     def update_handles(self, key, axis, element, ranges, style):
         artist = self.handles['artist']
-        artist._offsets3d, style, _ = self.get_data(element, ranges, style)
+        with PlotProfiler.stage(self, 'get_data'):
+            artist._offsets3d, style, _ = self.get_data(element, ranges, style)
+            PlotProfiler.annotate(artist._offsets3d)
         cdim = element.get_dimension(self.color_index)
         if cdim and 'cmap' in style:
             clim = style['vmin'], style['vmax']
@@ -21,6 +21,7 @@ from ...streams import Stream
 from ...util.transform import dim
 from ..plot import GenericElementPlot, GenericOverlayPlot
 from ..util import dynamic_update, process_cmap, color_intervals, dim_range_key
+from ..profiling import PlotProfiler
 from .plot import MPLPlot, mpl_rc_context
 from .util import mpl_version, validate, wrap_formatter
 
@@ -443,6 +444,7 @@ class ElementPlot(GenericElementPlot, MPLPlot):
 
 
     @mpl_rc_context
+    @PlotProfiler.profiled('update_frame')
     def update_frame(self, key, ranges=None, element=None):
         """
         Set the plot(s) to the given frame number.  Operates by
@@ -490,6 +492,7 @@ class ElementPlot(GenericElementPlot, MPLPlot):
 
 
     @mpl_rc_context
+    @PlotProfiler.profiled('initialize_plot')
     def initialize_plot(self, ranges=None):
         element = self.hmap.last
         ax = self.handles['axis']
@@ -507,7 +510,9 @@ class ElementPlot(GenericElementPlot, MPLPlot):
         if self.show_legend:
             style['label'] = element.label
 
-        plot_data, plot_kwargs, axis_kwargs = self.get_data(element, ranges, style)
+        with PlotProfiler.stage(self, 'get_data'):
+            plot_data, plot_kwargs, axis_kwargs = self.get_data(element, ranges, style)
+            PlotProfiler.annotate(plot_data)
 
         with abbreviated_exception():
             handles = self.init_artists(ax, plot_data, plot_kwargs)
@@ -538,7 +543,9 @@ class ElementPlot(GenericElementPlot, MPLPlot):
         Update the elements of the plot.
         """
         self.teardown_handles()
-        plot_data, plot_kwargs, axis_kwargs = self.get_data(element, ranges, style)
+        with PlotProfiler.stage(self, 'get_data'):
+            plot_data, plot_kwargs, axis_kwargs = self.get_data(element, ranges, style)
+            PlotProfiler.annotate(plot_data)
 
         with abbreviated_exception():
             handles = self.init_artists(axis, plot_data, plot_kwargs)
@@ -816,6 +823,7 @@ class ColorbarPlot(ElementPlot):
         ColorbarPlot._colorbars[id(axis)] = (ax_colorbars, (l, b, w, h))
 
 
+    @PlotProfiler.profiled('colormapping')
     def _norm_kwargs(self, element, ranges, opts, vdim, values=None, prefix=''):
         """
         Returns valid color normalization kwargs
@@ -1089,6 +1097,7 @@ class OverlayPlot(LegendPlot, GenericOverlayPlot):
 
 
     @mpl_rc_context
+    @PlotProfiler.profiled('initialize_plot')
     def initialize_plot(self, ranges=None):
         axis = self.handles['axis']
         key = self.keys[-1]
@@ -1109,6 +1118,7 @@ class OverlayPlot(LegendPlot, GenericOverlayPlot):
 
 
     @mpl_rc_context
+    @PlotProfiler.profiled('update_frame')
     def update_frame(self, key, ranges=None, element=None):
         axis = self.handles['axis']
         reused = isinstance(self.hmap, DynamicMap) and self.overlaid
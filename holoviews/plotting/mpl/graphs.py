@@ -11,6 +11,7 @@ from ...core.util import basestring, unique_array, search_indices, is_number, is
 from ...util.transform import dim
 from ..mixins import ChordMixin
 from ..util import process_cmap, get_directed_graph_paths
+from ..profiling import PlotProfiler
 from .element import ColorbarPlot
 from .util import filter_styles
 
@@ -227,7 +228,9 @@ class GraphPlot(ColorbarPlot):
 
 
     def update_handles(self, key, axis, element, ranges, style):
-        data, style, axis_kwargs = self.get_data(element, ranges, style)
+        with PlotProfiler.stage(self, 'get_data'):
+            data, style, axis_kwargs = self.get_data(element, ranges, style)
+            PlotProfiler.annotate(data)
         self._update_nodes(element, data, style)
         self._update_edges(element, data, style)
         return axis_kwargs
@@ -382,7 +385,9 @@ class ChordPlot(ChordMixin, GraphPlot):
         self.handles['labels'] = labels
 
     def update_handles(self, key, axis, element, ranges, style):
-        data, style, axis_kwargs = self.get_data(element, ranges, style)
+        with PlotProfiler.stage(self, 'get_data'):
+            data, style, axis_kwargs = self.get_data(element, ranges, style)
+            PlotProfiler.annotate(data)
         self._update_nodes(element, data, style)
         self._update_edges(element, data, style)
         self._update_arcs(element, data, style)
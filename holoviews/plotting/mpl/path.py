@@ -10,6 +10,7 @@ from ...core import util
 from ...core.dimension import Dimension
 from ...core.options import abbreviated_exception
 from ...element import Polygons
+from ..profiling import PlotProfiler
 from .element import ColorbarPlot
 from .util import polygons_to_path_patches
 
@@ -84,7 +85,9 @@ class PathPlot(ColorbarPlot):
 
     def update_handles(self, key, axis, element, ranges, style):
         artist = self.handles['artist']
-        data, style, axis_kwargs = self.get_data(element, ranges, style)
+        with PlotProfiler.stage(self, 'get_data'):
+            data, style, axis_kwargs = self.get_data(element, ranges, style)
+            PlotProfiler.annotate(data)
         artist.set_paths(data[0])
         if 'array' in style:
             artist.set_array(style['array'])
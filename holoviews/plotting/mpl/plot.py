@@ -20,6 +20,7 @@ from ...core.util import int_to_roman, int_to_alpha, basestring, wrap_tuple_stre
 from ..plot import (DimensionedPlot, GenericLayoutPlot, GenericCompositePlot,
                     GenericElementPlot, GenericAdjointLayoutPlot)
 from ..util import attach_streams, collate, displayable
+from ..profiling import PlotProfiler
 from .util import compute_ratios, fix_aspect, mpl_version
 
 
@@ -295,6 +296,7 @@ class CompositePlot(GenericCompositePlot, MPLPlot):
             self.handles['title'] = title
 
     @mpl_rc_context
+    @PlotProfiler.profiled('update_frame')
     def update_frame(self, key, ranges=None):
         ranges = self.compute_ranges(self.layout, key, ranges)
         for subplot in self.subplots.values():
@@ -482,6 +484,7 @@ class GridPlot(CompositePlot):
 
 
     @mpl_rc_context
+    @PlotProfiler.profiled('initialize_plot')
     def initialize_plot(self, ranges=None):
         # Get the extent of the layout elements (not the whole layout)
         key = self.keys[-1]
@@ -651,6 +654,7 @@ class AdjointLayoutPlot(MPLPlot, GenericAdjointLayoutPlot):
 
 
     @mpl_rc_context
+    @PlotProfiler.profiled('initialize_plot')
     def initialize_plot(self, ranges=None):
         """
         Plot all the views contained in the AdjointLayout Object using axes
@@ -723,6 +727,7 @@ class AdjointLayoutPlot(MPLPlot, GenericAdjointLayoutPlot):
 
 
     @mpl_rc_context
+    @PlotProfiler.profiled('update_frame')
     def update_frame(self, key, ranges=None):
         for pos in self.view_positions:
             subplot = self.subplots.get(pos)
@@ -1095,6 +1100,7 @@ class LayoutPlot(GenericLayoutPlot, CompositePlot):
 
 
     @mpl_rc_context
+    @PlotProfiler.profiled('initialize_plot')
     def initialize_plot(self):
         key = self.keys[-1]
         ranges = self.compute_ranges(self.layout, key, None)
@@ -7,6 +7,7 @@ from ...core import CompositeOverlay, Element
 from ...core import traversal
 from ...core.util import match_spec, max_range, unique_iterator
 from ...element.raster import Image, Raster, RGB
+from ..profiling import PlotProfiler
 from .element import ElementPlot, ColorbarPlot, OverlayPlot
 from .plot import MPLPlot, GridPlot, mpl_rc_context
 from .util import get_raster_array, mpl_version
@@ -86,7 +87,9 @@ class RasterPlot(RasterBasePlot, ColorbarPlot):
 
     def update_handles(self, key, axis, element, ranges, style):
         im = self.handles['artist']
-        data, style, axis_kwargs = self.get_data(element, ranges, style)
+        with PlotProfiler.stage(self, 'get_data'):
+            data, style, axis_kwargs = self.get_data(element, ranges, style)
+            PlotProfiler.annotate(data)
         l, r, b, t = style['extent']
         im.set_data(data[0])
         im.set_extent((l, r, b, t))
@@ -116,7 +119,9 @@ class RGBPlot(RasterBasePlot):
 
     def update_handles(self, key, axis, element, ranges, style):
         im = self.handles['artist']
-        data, style, axis_kwargs = self.get_data(element, ranges, style)
+        with PlotProfiler.stage(self, 'get_data'):
+            data, style, axis_kwargs = self.get_data(element, ranges, style)
+            PlotProfiler.annotate(data)
         l, r, b, t = style['extent']
         im.set_data(data[0])
         im.set_extent((l, r, b, t))
@@ -271,11 +276,13 @@ class RasterGridPlot(GridPlot, OverlayPlot):
         return (0, 0, width, height)
 
 
+    @PlotProfiler.profiled('get_frame')
     def _get_frame(self, key):
         return GridPlot._get_frame(self, key)
 
 
     @mpl_rc_context
+    @PlotProfiler.profiled('initialize_plot')
     def initialize_plot(self, ranges=None):
         _, _, b_w, b_h, widths, heights = self.border_extents
 
@@ -315,6 +322,7 @@ class RasterGridPlot(GridPlot, OverlayPlot):
         return self._finalize_axis(key, ranges=ranges, **kwargs)
 
     @mpl_rc_context
+    @PlotProfiler.profiled('update_frame')
     def update_frame(self, key, ranges=None):
         grid = self._get_frame(key)
         ranges = self.compute_ranges(self.layout, key, ranges)
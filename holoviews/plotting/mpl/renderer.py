@@ -2,6 +2,7 @@ from __future__ import absolute_import, division, unicode_literals
 
 import os
 import base64
+import subprocess
 
 from io import BytesIO
 from tempfile import NamedTemporaryFile
@@ -18,6 +19,7 @@ from param.parameterized import bothmethod
 from ...core import HoloMap
 from ...core.options import Store
 from ..renderer import Renderer, MIME_TYPES, HTML_TAGS
+from ..profiling import PlotProfiler
 from .util import get_tight_bbox, mpl_version
 
 class OutputWarning(param.Parameterized):pass
@@ -133,6 +135,7 @@ class MPLRenderer(Renderer):
         return (int(w*dpi), int(h*dpi))
 
 
+    @PlotProfiler.profiled('render', plot_arg=True)
     def _figure_data(self, plot, fmt, bbox_inches='tight', as_script=False, **kwargs):
         """
         Render matplotlib figure object and return the corresponding
@@ -142,7 +145,11 @@ class MPLRenderer(Renderer):
         Similar to IPython.core.pylabtools.print_figure but without
         any IPython dependency.
         """
-        if fmt in ['gif', 'mp4', 'webm']:
+        if fmt in ['gif', 'mp4', 'webm'] and self.workers > 1:
+            with mpl.rc_context(rc=plot.fig_rcparams):
+                frames = self.render_frames(plot, 'png', bbox_inches=None)
+            data = self._encode_frames(frames, fmt)
+        elif fmt in ['gif', 'mp4', 'webm']:
             with mpl.rc_context(rc=plot.fig_rcparams):
                 anim = plot.anim(fps=self.fps)
             data = self._anim_data(anim, fmt)
@@ -203,6 +210,46 @@ class MPLRenderer(Renderer):
         return video
 
 
+    def _encode_frames(self, frames, fmt):
+        """
+        Encode a list of rendered PNG frames in the requested animation
+        format and return the corresponding data.
+        """
+        (writer, _, anim_kwargs, extra_args) = ANIMATION_OPTS[fmt]
+        fps = anim_kwargs.get('fps', 5) if self.fps is None else max([int(self.fps), 1])
+        if writer == 'pillow':
+            from PIL import Image
+            images = [Image.open(BytesIO(frame)) for frame in frames]
+            bytes_io = BytesIO()
+            images[0].save(bytes_io, format='GIF', save_all=True, loop=0,
+                           append_images=images[1:], duration=int(1000./fps))
+            return bytes_io.getvalue()
+
+        # Frames are piped to ffmpeg, padding them to even dimensions
+        # as required by most video codecs
+        args = [mpl.rcParams['animation.ffmpeg_path'], '-y', '-f', 'image2pipe',
+                '-framerate', str(fps), '-vcodec', 'png', '-i', '-',
+                '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2']
+        if 'codec' in anim_kwargs:
+            args += ['-vcodec', anim_kwargs['codec']]
+        with NamedTemporaryFile(suffix='.%s' % fmt, delete=False) as f:
+            filename = f.name
+        try:
+            process = subprocess.Popen(args + extra_args + [filename],
+                                       stdin=subprocess.PIPE,
+                                       stdout=subprocess.PIPE,
+                                       stderr=subprocess.PIPE)
+            _, err = process.communicate(b''.join(frames))
+            if process.returncode:
+                raise RuntimeError('ffmpeg failed to encode the %s animation:\n%s'
+                                   % (fmt, err.decode('utf-8', 'replace')))
+            with open(filename, 'rb') as f:
+                video = f.read()
+        finally:
+            os.remove(filename)
+        return video
+
+
     def _compute_bbox(self, fig, kw):
         """
         Compute the tight bounding box for each figure once, reducing
@@ -7,6 +7,7 @@ from matplotlib.collections import PatchCollection
 
 from ...core.util import basestring, max_range
 from ...util.transform import dim
+from ..profiling import PlotProfiler
 from .graphs import GraphPlot
 from .util import filter_styles
 
@@ -153,7 +154,9 @@ class SankeyPlot(GraphPlot):
         return artists
 
     def update_handles(self, key, axis, element, ranges, style):
-        data, style, axis_kwargs = self.get_data(element, ranges, style)
+        with PlotProfiler.stage(self, 'get_data'):
+            data, style, axis_kwargs = self.get_data(element, ranges, style)
+            PlotProfiler.annotate(data)
         self._update_nodes(element, data, style)
         self._update_edges(element, data, style)
         self.handles['labels'] = self._update_labels(axis, data, style)
@@ -7,6 +7,7 @@ import param
 from matplotlib.font_manager import FontProperties
 from matplotlib.table import Table as mpl_Table
 
+from ..profiling import PlotProfiler
 from .element import ElementPlot
 from .plot import mpl_rc_context
 
@@ -102,6 +103,7 @@ class TablePlot(ElementPlot):
 
 
     @mpl_rc_context
+    @PlotProfiler.profiled('initialize_plot')
     def initialize_plot(self, ranges=None):
 
         # Render table
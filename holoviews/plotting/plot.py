@@ -24,6 +24,7 @@ from pyviz_comms import JupyterComm
 from ..selection import NoOpSelectionDisplay
 from ..core import OrderedDict
 from ..core import util, traversal
+from ..core.data import Dataset
 from ..core.element import Element, Element3D
 from ..core.overlay import Overlay, CompositeOverlay
 from ..core.layout import Empty, NdLayout, Layout
@@ -34,6 +35,7 @@ from ..core.util import stream_parameters, isfinite
 from ..element import Table, Graph, Contours
 from ..streams import Stream, RangeXY, RangeX, RangeY
 from ..util.transform import dim
+from .profiling import PlotProfiler
 from .util import (get_dynamic_mode, initialize_unbounded, dim_axis_label,
                    attach_streams, traverse_setter, get_nested_streams,
                    compute_overlayable_zorders, get_nested_plot_frame,
@@ -251,6 +253,7 @@ class Plot(param.Parameterized):
             self.update(key)
 
 
+    @PlotProfiler.profiled('push')
     def push(self):
         """
         Pushes plot updates to the frontend.
@@ -282,6 +285,7 @@ class Plot(param.Parameterized):
 
 
     @classmethod
+    @PlotProfiler.profiled('lookup_options')
     def lookup_options(cls, obj, group):
         return lookup_options(obj, group, cls.backend)
 
@@ -424,6 +428,7 @@ class DimensionedPlot(Plot):
         self.current_frame = None
         self.current_key = None
         self.ranges = {}
+        self._stream_ranges = {}
         self._updated = False # Whether the plot should be marked as updated
         super(DimensionedPlot, self).__init__(**params)
 
@@ -589,6 +594,7 @@ class DimensionedPlot(Plot):
         return {label: scale_fontsize(size, self.fontscale)}
 
 
+    @PlotProfiler.profiled('compute_ranges')
     def compute_ranges(self, obj, key, ranges):
         """
         Given an object, a specific key, and the normalization options,
@@ -627,11 +633,80 @@ class DimensionedPlot(Plot):
             # or not framewise on a Overlay or ElementPlot
             if (not (axiswise and not isinstance(obj, HoloMap)) or
                 (not framewise and isinstance(obj, HoloMap))):
-                self._compute_group_range(group, elements, ranges, framewise)
+                stream_ranges = self._get_stream_ranges(elements)
+                self._compute_group_range(group, elements, ranges, framewise,
+                                          stream_ranges)
         self.ranges.update(ranges)
         return ranges
 
 
+    def _get_stream_ranges(self, elements):
+        """
+        Computes the data ranges of elements backed by the data of a
+        Buffer stream. Rather than rescanning the whole window on each
+        update the ranges of the chunk appended to the Buffer are
+        merged into the cached ranges, a full rescan is only required
+        if the evicted rows may have contained the current extrema.
+        Only numeric columns are summarized, the ranges and factors of
+        categorical columns are still computed from the whole window
+        on every update. Returns a dictionary of data ranges indexed
+        by element id and dimension name.
+        """
+        from ..streams import Buffer
+        buffers = [s for s in getattr(self, 'streams', []) if isinstance(s, Buffer)]
+        stream_ranges = {}
+        if not buffers:
+            return stream_ranges
+        for el in elements:
+            if el is None or not hasattr(el, 'interface'):
+                continue
+            for stream in buffers:
+                columns = self._buffer_columns(el, stream)
+                if not columns:
+                    continue
+                el_ranges = stream_ranges.setdefault(id(el), {})
+                chunk_ranges = stream._chunk_ranges or {}
+                for el_dim in el.dimensions('ranges'):
+                    dim_name = el_dim.name
+                    if dim_name not in columns or dim_name in el_ranges:
+                        continue
+                    key = (id(stream), dim_name)
+                    cached = self._stream_ranges.get(key)
+                    data_range = None
+                    if cached is not None and cached[0] == stream._count:
+                        data_range = cached[1]
+                    elif (cached is not None and cached[0] == stream._count-1
+                          and dim_name in chunk_ranges):
+                        appended, evicted = chunk_ranges[dim_name]
+                        lower, upper = cached[1]
+                        if evicted is None or not (evicted[0] <= lower or evicted[1] >= upper):
+                            data_range = util.max_range([cached[1], appended])
+                    if data_range is None:
+                        data_range = el.range(el_dim, dimension_range=False)
+                    self._stream_ranges[key] = (stream._count, data_range)
+                    el_ranges[dim_name] = data_range
+        return stream_ranges
+
+
+    @classmethod
+    def _buffer_columns(cls, element, stream):
+        """
+        Returns the numeric columns of the Buffer stream data which are
+        shared by the supplied element, ensuring cached ranges are only
+        applied to elements which wrap the current window.
+        """
+        data = stream.data
+        if util.pd and isinstance(data, util.pd.DataFrame):
+            if element.data is not data:
+                return []
+            columns = [(c, data[c]) for c in data.columns]
+        elif isinstance(data, dict) and isinstance(element.data, dict):
+            columns = [(c, v) for c, v in data.items() if element.data.get(c) is v]
+        else:
+            return []
+        return [c for c, v in columns if v.dtype.kind in 'iuf']
+
+
     def _get_norm_opts(self, obj):
         """
         Gets the normalization options for a LabelledData object by
@@ -679,9 +754,30 @@ class DimensionedPlot(Plot):
 
 
     @classmethod
-    def _compute_group_range(cls, group, elements, ranges, framewise):
+    def _bulk_data_ranges(cls, el, dimensions):
+        """
+        Computes the data ranges of multiple dimensions of an element
+        in a single pass using the Interface.ranges API. Only applies
+        to elements which do not customize the Dataset.range method.
+        """
+        range_fn = getattr(type(el), 'range', None)
+        if (len(dimensions) < 2 or not isinstance(el, Dataset) or
+            getattr(range_fn, '__func__', range_fn) is not
+            getattr(Dataset.range, '__func__', Dataset.range)):
+            return {}
+        dimensions = [d for d in dimensions if d in el.dimensions()]
+        if len(dimensions) < 2 or not el:
+            return {}
+        return el.interface.ranges(el, dimensions)
+
+    @classmethod
+    def _compute_group_range(cls, group, elements, ranges, framewise,
+                             stream_ranges=None):
         # Iterate over all elements in a normalization group
         # and accumulate their ranges into the supplied dictionary.
+        # Data ranges precomputed from streamed chunks are looked
+        # up by element id in the supplied stream_ranges.
+        stream_ranges = {} if stream_ranges is None else stream_ranges
         elements = [el for el in elements if el is not None]
         group_ranges = OrderedDict()
         for el in elements:
@@ -722,9 +818,9 @@ class DimensionedPlot(Plot):
                         group_ranges[dim_name]['data'].append(drange)
 
             # Compute dimension normalization
+            el_dims, dtypes = [], {}
             for el_dim in el.dimensions('ranges'):
-                dim_name = el_dim.name
-                if dim_name in ranges.get(group, {}) and not framewise:
+                if el_dim.name in ranges.get(group, {}) and not framewise:
                     continue
                 if hasattr(el, 'interface'):
                     if isinstance(el, Graph) and el_dim in el.nodes.dimensions():
@@ -735,13 +831,31 @@ class DimensionedPlot(Plot):
                         dtype = el.interface.dtype(el, el_dim)
                 else:
                     dtype = None
-
+                el_dims.append(el_dim)
+                dtypes[el_dim.name] = dtype
+
+            # Compute the data ranges of all remaining dimensions at once
+            bulk_dims = [
+                d for d in el_dims if not (
+                    all(util.isfinite(r) for r in d.range) or
+                    (dtypes[d.name] is not None and dtypes[d.name].kind in 'SU') or
+                    (isinstance(el, Graph) and d in el.kdims[:2]) or
+                    d.name in stream_ranges.get(id(el), {}))]
+            bulk_ranges = cls._bulk_data_ranges(el, bulk_dims)
+
+            for el_dim in el_dims:
+                dim_name = el_dim.name
+                dtype = dtypes[dim_name]
                 if all(util.isfinite(r) for r in el_dim.range):
                     data_range = (None, None)
                 elif dtype is not None and dtype.kind in 'SU':
                     data_range = ('', '')
                 elif isinstance(el, Graph) and el_dim in el.kdims[:2]:
                     data_range = el.nodes.range(2, dimension_range=False)
+                elif dim_name in stream_ranges.get(id(el), {}):
+                    data_range = stream_ranges[id(el)][dim_name]
+                elif dim_name in bulk_ranges:
+                    data_range = bulk_ranges[dim_name]
                 else:
                     data_range = el.range(el_dim, dimension_range=False)
 
@@ -1154,6 +1268,7 @@ class GenericElementPlot(DimensionedPlot):
         return [self.ordering.index(spec) for spec in specs]
 
 
+    @PlotProfiler.profiled('get_frame')
     def _get_frame(self, key):
         if isinstance(self.hmap, DynamicMap) and self.overlaid and self.current_frame:
             self.current_key = key
@@ -1408,6 +1523,7 @@ class GenericElementPlot(DimensionedPlot):
         return (label, group, type_name, dim_title)
 
 
+    @PlotProfiler.profiled('update_frame')
     def update_frame(self, key, ranges=None):
         """
         Set the plot(s) to the given frame number.  Operates by
@@ -1769,6 +1885,7 @@ class GenericCompositePlot(DimensionedPlot):
         streams change.
         """
 
+    @PlotProfiler.profiled('get_frame')
     def _get_frame(self, key):
         """
         Creates a clone of the Layout with the nth-frame for each
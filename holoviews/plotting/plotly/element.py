@@ -12,6 +12,7 @@ from ...streams import Stream
 from ...util.transform import dim
 from ..plot import GenericElementPlot, GenericOverlayPlot
 from ..util import dim_range_key, dynamic_update
+from ..profiling import PlotProfiler
 from .plot import PlotlyPlot
 from .util import (
     STYLE_ALIASES, get_colorscale, merge_figure, legend_trace_types)
@@ -110,6 +111,7 @@ class ElementPlot(PlotlyPlot, GenericElementPlot):
         self.callbacks = self._construct_callbacks()
 
 
+    @PlotProfiler.profiled('initialize_plot')
     def initialize_plot(self, ranges=None):
         """
         Initializes a new plot object with the last available frame.
@@ -146,7 +148,9 @@ class ElementPlot(PlotlyPlot, GenericElementPlot):
         style = self.style[self.cyclic_index]
 
         # Get data and options and merge them
-        data = self.get_data(element, ranges, style)
+        with PlotProfiler.stage(self, 'get_data'):
+            data = self.get_data(element, ranges, style)
+            PlotProfiler.annotate(data)
         opts = self.graph_options(element, ranges, style)
 
         components = {
@@ -489,6 +493,7 @@ class ElementPlot(PlotlyPlot, GenericElementPlot):
                 axis_props['tickvals'] = ticker
             axis.update(axis_props)
 
+    @PlotProfiler.profiled('update_frame')
     def update_frame(self, key, ranges=None, element=None):
         """
         Updates an existing plot with data corresponding
@@ -584,6 +589,7 @@ class OverlayPlot(GenericOverlayPlot, ElementPlot):
         'invert_xaxis', 'invert_yaxis', 'sizing_mode', 'title', 'title_format',
         'padding', 'xlabel', 'ylabel', 'zlabel', 'xlim', 'ylim', 'zlim']
 
+    @PlotProfiler.profiled('initialize_plot')
     def initialize_plot(self, ranges=None):
         """
         Initializes a new plot object with the last available frame.
@@ -630,6 +636,7 @@ class OverlayPlot(GenericOverlayPlot, ElementPlot):
         self.handles['fig'] = figure
         return figure
 
+    @PlotProfiler.profiled('update_frame')
     def update_frame(self, key, ranges=None, element=None):
         reused = isinstance(self.hmap, DynamicMap) and self.overlaid
         if not reused and element is None:
@@ -12,6 +12,7 @@ from ..plot import (
     DimensionedPlot, GenericLayoutPlot, GenericCompositePlot,
     GenericElementPlot, GenericAdjointLayoutPlot, CallbackPlot
 )
+from ..profiling import PlotProfiler
 from .util import figure_grid, configure_matching_axes_from_dims
 
 
@@ -41,10 +42,12 @@ class PlotlyPlot(DimensionedPlot, CallbackPlot):
             self.current_frame = None
 
 
+    @PlotProfiler.profiled('initialize_plot')
     def initialize_plot(self, ranges=None):
         return self.generate_plot(self.keys[-1], ranges)
 
 
+    @PlotProfiler.profiled('update_frame')
     def update_frame(self, key, ranges=None):
         return self.generate_plot(key, ranges)
 
@@ -253,6 +256,7 @@ class AdjointLayoutPlot(PlotlyPlot, GenericAdjointLayoutPlot):
         super(AdjointLayoutPlot, self).__init__(subplots=subplots, **params)
 
 
+    @PlotProfiler.profiled('initialize_plot')
     def initialize_plot(self, ranges=None):
         """
         Plot all the views contained in the AdjointLayout Object using axes
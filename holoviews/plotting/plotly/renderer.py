@@ -13,6 +13,7 @@ with param.logging_level('CRITICAL'):
 from param.parameterized import bothmethod
 
 from ..renderer import Renderer, MIME_TYPES, HTML_TAGS
+from ..profiling import PlotProfiler
 from ...core.options import Store
 from ...core import HoloMap
 from .callbacks import callbacks
@@ -83,6 +84,7 @@ class PlotlyRenderer(Renderer):
         return fig_dict
 
 
+    @PlotProfiler.profiled('render', plot_arg=True)
     def _figure_data(self, plot, fmt, as_script=False, **kwargs):
         if fmt == 'gif':
             import plotly.io as pio
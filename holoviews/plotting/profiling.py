@@ -0,0 +1,286 @@
+"""
+Opt-in instrumentation recording the wall time spent in each stage
+of initializing and updating plots, e.g. fetching the frame,
+computing ranges, looking up options, getting the data and
+colormapping, along with the size of the data produced.
+
+The plotting classes mark each stage explicitly, either by
+decorating the method implementing it with PlotProfiler.profiled or
+by wrapping the call in the PlotProfiler.stage context manager, both
+of which only check whether a profiler is running while profiling is
+disabled:
+
+    with PlotProfiler() as profiler:
+        hv.render(obj)
+    profiler.dframe()
+    profiler.export('trace.json')
+
+The exported trace uses the Chrome trace event format and may be
+opened in chrome://tracing or https://ui.perfetto.dev.
+"""
+from __future__ import absolute_import
+
+import json
+import threading
+import time
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
+
+import numpy as np
+
+
+def data_size(data):
+    """
+    Returns the number of rows and bytes of the supplied plotting
+    data, which may be an array, a list of values or arrays (e.g. a
+    ragged column) or a dictionary, tuple or list of dictionaries
+    holding such columns, in which case the number of rows is that of
+    the longest column.
+    """
+    if isinstance(data, np.ndarray):
+        return (len(data) if data.ndim else 1), data.nbytes
+    elif isinstance(data, dict):
+        data = tuple(data.values())
+    elif isinstance(data, list) and not any(isinstance(d, dict) for d in data):
+        if any(isinstance(d, (np.ndarray, list)) for d in data):
+            nbytes = sum(data_size(d)[1] for d in data)
+        else:
+            nbytes = np.asarray(data).nbytes
+        return len(data), nbytes
+    elif not isinstance(data, (list, tuple)):
+        return 0, 0
+    rows, nbytes = 0, 0
+    for d in data:
+        r, b = data_size(d)
+        rows, nbytes = max(rows, r), nbytes+b
+    return rows, nbytes
+
+
+def patch_size(patches):
+    """
+    Returns the number of rows and bytes of a dictionary of
+    ColumnDataSource patches, i.e. lists of (index, value) pairs by
+    column, counting a row per patch and the bytes of the values.
+    """
+    rows, nbytes = 0, 0
+    for column in patches.values():
+        for _, value in column:
+            if isinstance(value, (np.ndarray, list)):
+                nbytes += data_size(value)[1]
+            else:
+                nbytes += np.asarray(value).nbytes
+        rows = max(rows, len(column))
+    return rows, nbytes
+
+
+class PlotProfiler(object):
+    """
+    PlotProfiler records the wall time of each stage of initializing
+    and updating plots while it is running. Each record is a
+    dictionary containing:
+
+    * plot:     The type and id of the plot the stage ran on
+    * backend:  The plotting backend
+    * stage:    The name of the stage, e.g. 'get_data'
+    * method:   The initialize_plot or update_frame call the stage
+                ran within, if any
+    * start:    The start time (in seconds) since profiling started
+    * duration: The wall time (in ms)
+    * depth:    The nesting depth of the stage
+    * thread:   The id of the thread the stage ran on
+    * rows:     The number of rows of data returned by get_data or
+                sent to a bokeh ColumnDataSource
+    * bytes:    The number of bytes of data returned by get_data or
+                sent to a bokeh ColumnDataSource
+    """
+
+    _active = []
+
+    _local = threading.local()
+
+    def __init__(self, document=None):
+        """
+        If a bokeh Document is supplied only the stages of plots
+        attached to it are recorded, e.g. to profile a single bokeh
+        server session.
+        """
+        self.document = document
+        self.records = []
+        self._start = None
+
+
+    def __enter__(self):
+        self.start()
+        return self
+
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+    def start(self):
+        """
+        Starts recording.
+        """
+        if self in self._active:
+            return
+        self._start = time.time()
+        self._active.append(self)
+
+
+    def stop(self):
+        """
+        Stops recording.
+        """
+        if self in self._active:
+            self._active.remove(self)
+
+
+    def clear(self):
+        """
+        Clears all records.
+        """
+        self.records = []
+
+
+    @classmethod
+    @contextmanager
+    def stage(cls, plot, stage):
+        """
+        Context manager recording the wall time of the named stage
+        running on the plot while a profiler is active. If no plot is
+        supplied the stage is attributed to the plot of the enclosing
+        stage. Only the outermost call of a stage on a plot is
+        recorded, e.g. when a method calls the method it overrides.
+        """
+        if not cls._active:
+            yield
+            return
+        stack = getattr(cls._local, 'stack', None)
+        if stack is None:
+            stack = cls._local.stack = []
+        if plot is None and stack:
+            plot = stack[-1][0]
+        if any(p is plot and s == stage for p, s, _ in stack):
+            yield
+            return
+        info = {}
+        stack.append((plot, stage, info))
+        start = time.time()
+        try:
+            yield
+        finally:
+            stack.pop()
+            end = time.time()
+        cls._record(plot, stage, start, end, stack, info)
+
+
+    @classmethod
+    def profiled(cls, stage, plot_arg=False):
+        """
+        Decorator recording the wall time of a plotting method as the
+        named stage while a profiler is active. The stage runs on the
+        plot the method is called on or, if plot_arg is enabled, on
+        the plot passed as the first argument, e.g. to a Renderer.
+        """
+        def decorator(fn):
+            @wraps(fn)
+            def wrapped(self, *args, **kwargs):
+                if not cls._active:
+                    return fn(self, *args, **kwargs)
+                plot = args[0] if plot_arg else self
+                with cls.stage(None if isinstance(plot, type) else plot, stage):
+                    return fn(self, *args, **kwargs)
+            return wrapped
+        return decorator
+
+
+    @classmethod
+    def annotate(cls, data, patches=False):
+        """
+        Records the size of the data produced or sent by the innermost
+        stage currently running on this thread, e.g. the columns
+        actually sent when updating a bokeh ColumnDataSource. If
+        patches is enabled the data is a dictionary of patches by
+        column.
+        """
+        stack = getattr(cls._local, 'stack', None)
+        if not cls._active or not stack:
+            return
+        rows, nbytes = patch_size(data) if patches else data_size(data)
+        info = stack[-1][2]
+        info['rows'] = max(info.get('rows') or 0, rows)
+        info['bytes'] = (info.get('bytes') or 0) + nbytes
+
+
+    @classmethod
+    def _record(cls, plot, stage, start, end, stack, info):
+        method = None
+        for p, s, _ in stack[::-1]:
+            if p is plot and s in ('initialize_plot', 'update_frame'):
+                method = s
+                break
+        record = dict(
+            plot=None if plot is None else '%s-%d' % (type(plot).__name__, id(plot)),
+            backend=getattr(plot, 'backend', None), stage=stage,
+            method=method, duration=(end-start)*1000, depth=len(stack),
+            thread=threading.current_thread().ident, rows=info.get('rows'),
+            bytes=info.get('bytes')
+        )
+        document = getattr(plot, 'document', None)
+        for profiler in cls._active:
+            if profiler.document is not None and document is not profiler.document:
+                continue
+            profiler.records.append(dict(record, start=start-profiler._start))
+
+
+    def dframe(self):
+        """
+        Returns the records as a pandas DataFrame.
+        """
+        import pandas as pd
+        columns = ['plot', 'backend', 'stage', 'method', 'start', 'duration',
+                   'depth', 'thread', 'rows', 'bytes']
+        return pd.DataFrame(self.records, columns=columns)
+
+
+    def summary(self):
+        """
+        Returns the total time (in ms), number of calls and bytes of
+        each stage, ordered by the total time spent in the stage.
+        """
+        totals = OrderedDict()
+        for record in self.records:
+            stage = totals.setdefault(record['stage'], dict(duration=0, calls=0, bytes=0))
+            stage['duration'] += record['duration']
+            stage['calls'] += 1
+            stage['bytes'] += record['bytes'] or 0
+        return OrderedDict(sorted(totals.items(), key=lambda x: -x[1]['duration']))
+
+
+    def trace(self):
+        """
+        Returns the records as a list of events in the Chrome trace
+        event format.
+        """
+        events = []
+        for record in self.records:
+            args = {k: record[k] for k in ('plot', 'method', 'rows', 'bytes')
+                    if record[k] is not None}
+            events.append({
+                'name': record['stage'], 'cat': record['backend'] or 'plotting',
+                'ph': 'X', 'ts': record['start']*1e6, 'dur': record['duration']*1e3,
+                'pid': 0, 'tid': record['thread'], 'args': args
+            })
+        return events
+
+
+    def export(self, filename):
+        """
+        Exports the records to a trace file in the Chrome trace event
+        format.
+        """
+        with open(filename, 'w') as f:
+            json.dump({'traceEvents': self.trace()}, f)
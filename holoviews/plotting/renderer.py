@@ -4,14 +4,17 @@ regardless of plotting package or backend.
 """
 from __future__ import unicode_literals, absolute_import
 
+import sys
 import base64
+import multiprocessing
 
 from io import BytesIO
 try:
     from StringIO import StringIO
 except ImportError:
     from io import StringIO
-from contextlib import contextmanager
+from contextlib import contextmanager, closing
+from itertools import chain, count
 
 import param
 
@@ -68,6 +71,29 @@ MIME_TYPES = {
     'server': None
 }
 
+# The jobs executed by the frame rendering worker processes indexed
+# by job id, set before the workers are forked so that each holds its
+# own copy of the plot.
+_frame_jobs = {}
+
+_frame_job_ids = count()
+
+
+def _render_frames(job):
+    """
+    Updates the plot of the frame rendering job with the supplied id
+    to each of the (index, key) pairs and returns the rendered frame
+    data.
+    """
+    job_id, frames = job
+    renderer, plot, fmt, kwargs = _frame_jobs[job_id]
+    rendered = []
+    for i, key in frames:
+        plot.update(key)
+        rendered.append((i, renderer._figure_data(plot, fmt, **kwargs)))
+    return rendered
+
+
 static_template = """
 <html>
   <body>
@@ -130,6 +156,23 @@ class Renderer(Exporter):
     css = param.Dict(default={}, doc="""
         Dictionary of CSS attributes and values to apply to HTML output.""")
 
+    workers = param.Integer(default=1, bounds=(1, None), doc="""
+        Number of processes used by render_frames to render the frames
+        of a HoloMap, each rendering a subset of the frames using its
+        own copy of the plot. Currently only the gif, mp4 and webm
+        exports of the matplotlib renderer render their frames this
+        way. All other output is still rendered sequentially, including
+        the frames embedded in HTML widgets, single frames written by
+        save and the bokeh gif export, whose screenshots share a
+        browser webdriver which cannot be used from forked processes.
+        Since the workers are forked processes this is only supported
+        on Linux, elsewhere frames are rendered sequentially.""")
+
+    chunksize = param.Integer(default=None, allow_None=True, bounds=(1, None), doc="""
+        Number of consecutive frames rendered by a worker process per
+        task. By default the frames are split evenly across the
+        worker processes.""")
+
     info_fn = param.Callable(None, allow_None=True, constant=True,  doc="""
         Renderers do not support the saving of object info metadata""")
 
@@ -545,6 +588,48 @@ class Renderer(Exporter):
             with open(filename, 'wb') as f:
                 f.write(encoded)
 
+    def render_frames(self, obj, fmt='png', workers=None, chunksize=None, **kwargs):
+        """
+        Renders each frame of a HoloViews object or plot in the
+        specified format, returning a list of the rendered data in the
+        order of the plot keys. If more than one worker is requested
+        the frames are rendered in a pool of forked processes, each
+        updating its own copy of the plot. Forking is only considered
+        safe on Linux, on other platforms the frames are rendered
+        sequentially.
+        """
+        plot = obj if isinstance(obj, Plot) else self.get_plot(obj)
+        frames = list(enumerate(plot.keys))
+        workers = self.workers if workers is None else workers
+        chunksize = chunksize or self.chunksize or max(1, (len(frames)+workers-1)//workers)
+        chunks = [frames[i:i+chunksize] for i in range(0, len(frames), chunksize)]
+        pool_type = None
+        if workers > 1 and len(chunks) > 1:
+            # Forking a process with threads running (e.g. on macOS) may
+            # crash or deadlock the workers, so it is restricted to Linux
+            if not sys.platform.startswith('linux'):
+                self.param.warning('Rendering frames in parallel requires forking '
+                                   'processes, which is only supported on Linux, '
+                                   'falling back to rendering the frames sequentially.')
+            elif hasattr(multiprocessing, 'get_context'):
+                pool_type = multiprocessing.get_context('fork').Pool
+            else:
+                pool_type = multiprocessing.Pool
+
+        job_id = next(_frame_job_ids)
+        jobs = [(job_id, chunk) for chunk in chunks]
+        _frame_jobs[job_id] = (self, plot, fmt, kwargs)
+        try:
+            if pool_type is not None:
+                with closing(pool_type(min(workers, len(chunks)))) as pool:
+                    rendered = pool.map(_render_frames, jobs)
+            else:
+                rendered = [_render_frames(job) for job in jobs]
+        finally:
+            _frame_jobs.pop(job_id, None)
+        return [data for _, data in sorted(chain(*rendered), key=lambda x: x[0])]
+
+
     @bothmethod
     def _save_prefix(self_or_cls, ext):
         "Hook to prefix content for instance JS when saving HTML"
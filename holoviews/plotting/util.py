@@ -1044,6 +1044,22 @@ def get_directed_graph_paths(element, arrow_length):
     indicate the directionality of each edge.
     """
     edgepaths = element._split_edgepaths
+    if edgepaths.interface.datatype == 'packed':
+        data = edgepaths.data
+        if len(data) and (data.lengths >= 2).all():
+            starts = data.offsets[:-1]
+            xs, ys = (data.expand(kd.name) for kd in edgepaths.kdims[:2])
+            sx, sy = xs[starts], ys[starts]
+            ex, ey = xs[starts+1], ys[starts+1]
+            rad = np.arctan2(ey-sy, ex-sx)
+            xa0 = ex - np.cos(rad+np.pi/8)*arrow_length
+            ya0 = ey - np.sin(rad+np.pi/8)*arrow_length
+            xa1 = ex - np.cos(rad-np.pi/8)*arrow_length
+            ya1 = ey - np.sin(rad-np.pi/8)*arrow_length
+            nans = np.full(len(sx), np.nan)
+            arrow_xs = np.column_stack([sx, ex, nans, xa0, ex, xa1])
+            arrow_ys = np.column_stack([sy, ey, nans, ya0, ey, ya1])
+            return list(np.dstack([arrow_xs, arrow_ys]))
     edges = edgepaths.split(datatype='array', dimensions=edgepaths.kdims)
     arrows = []
     for e in edges:
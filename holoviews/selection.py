@@ -1,3 +1,6 @@
+import operator
+import weakref
+
 from collections import namedtuple
 
 import numpy as np
@@ -5,6 +8,7 @@ import param
 
 from param.parameterized import bothmethod
 
+from .core import util
 from .core.dimension import OrderedDict
 from .core.element import Element, Layout
 from .core.options import CallbackError, Store
@@ -13,7 +17,7 @@ from .core.spaces import GridSpace
 from .streams import SelectionExpr, PlotReset, Stream
 from .operation.element import function
 from .util import DynamicMap
-from .util.transform import dim
+from .util.transform import dim, iloc
 
 
 class _Cmap(Stream):
@@ -343,6 +347,134 @@ class link_selections(_base_link_selections):
                 self._region_streams[hvobj].event(region_element=region_element)
 
 
+class _SelectionMaskCache(object):
+    """
+    Cache of the selection masks computed when displaying a selection
+    expression, shared between all linked views displaying the same
+    underlying data.
+
+    Entries are keyed by the identity of the Dataset's data, its
+    dimensions and the structure of the selection expression, with
+    array arguments identified by their content fingerprint, so that
+    a selection event is evaluated only once however many views
+    display it. The data is only referenced weakly and only the masks
+    are cached, not the selected subsets, which may be as large as
+    the data itself. When an expression extends a cached expression
+    by combining it with another expression using & or | (as additive
+    selection modes and cross-filtering do), the cached mask is
+    combined with the mask of the new expression rather than
+    evaluating the whole expression.
+    """
+
+    _combinators = (operator.and_, operator.or_)
+
+    def __init__(self, max_datasets=8, max_entries=8):
+        self.max_datasets = max_datasets
+        self.max_entries = max_entries
+        self._datasets = []
+
+    def clear(self):
+        self._datasets = []
+
+    @classmethod
+    def _arg_key(cls, arg):
+        if isinstance(arg, dim):
+            return cls._expr_key(arg)
+        elif isinstance(arg, iloc):
+            return ('iloc', cls._arg_key(arg.index))
+        elif isinstance(arg, slice):
+            return ('slice',)+tuple(cls._arg_key(v) for v in (arg.start, arg.stop, arg.step))
+        elif isinstance(arg, (list, tuple)):
+            return (type(arg).__name__,)+tuple(cls._arg_key(v) for v in arg)
+        elif isinstance(arg, dict):
+            return ('dict',)+tuple(sorted(((repr(k), cls._arg_key(v)) for k, v in arg.items()),
+                                          key=operator.itemgetter(0)))
+        elif isinstance(arg, (set, frozenset)):
+            return ('set', frozenset(cls._arg_key(v) for v in arg))
+        fp = util.fingerprint(arg)
+        if fp is not None:
+            return ('data', fp)
+        try:
+            hash(arg)
+        except TypeError:
+            return ('repr', repr(arg))
+        # Include the type so that e.g. 1, 1.0 and True are distinct
+        return (type(arg).__name__, arg)
+
+    @classmethod
+    def _expr_key(cls, expr):
+        key = ('dim', expr.dimension.spec)
+        for op in expr.ops:
+            fn = op['fn']
+            fn_key = cls._arg_key(fn) if isinstance(fn, iloc) else fn
+            kwargs = tuple(sorted((k, cls._arg_key(v)) for k, v in op['kwargs'].items()))
+            key += ((fn_key, cls._arg_key(op['args']), kwargs, op['reverse']),)
+        return key
+
+    @classmethod
+    def _data_ref(cls, dataset):
+        try:
+            return weakref.ref(dataset.data)
+        except TypeError:
+            # Data which does not support weak references (e.g. a dict
+            # of arrays) is cached while the Dataset holding it is alive
+            ref = weakref.ref(dataset)
+            return lambda: getattr(ref(), 'data', None)
+
+    def _entries(self, dataset):
+        dims = tuple(d.spec for d in dataset.dimensions())
+        self._datasets = [entry for entry in self._datasets if entry[0]() is not None]
+        for ref, ddims, entries in self._datasets:
+            if ref() is dataset.data and ddims == dims:
+                return entries
+        entries = OrderedDict()
+        self._datasets.append((self._data_ref(dataset), dims, entries))
+        if len(self._datasets) > self.max_datasets:
+            self._datasets.pop(0)
+        return entries
+
+    def _lookup(self, entries, key):
+        if key not in entries:
+            return None
+        value = entries.pop(key)
+        entries[key] = value
+        return value
+
+    def _store(self, entries, key, value):
+        entries[key] = value
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+        return value
+
+    def mask(self, dataset, expr, **kwargs):
+        """
+        Returns the mask of the expression evaluated on the dataset,
+        passing the supplied keywords to dim.apply.
+        """
+        entries = self._entries(dataset)
+        kwargs_key = tuple(sorted(kwargs.items()))
+        key = ('mask', self._expr_key(expr), kwargs_key)
+        mask = self._lookup(entries, key)
+        if mask is not None:
+            return mask
+
+        op = expr.ops[-1] if expr.ops else None
+        if (op and op['fn'] in self._combinators and not op['reverse'] and
+            len(op['args']) == 1 and isinstance(op['args'][0], dim)):
+            prev_expr = expr.clone(ops=expr.ops[:-1])
+            prev_key = ('mask', self._expr_key(prev_expr), kwargs_key)
+            prev_mask = self._lookup(entries, prev_key)
+            if prev_mask is not None:
+                new_mask = self.mask(dataset, op['args'][0], **kwargs)
+                mask = op['fn'](prev_mask, new_mask)
+        if mask is None:
+            mask = expr.apply(dataset, **kwargs)
+        return self._store(entries, key, mask)
+
+
+_selection_mask_cache = _SelectionMaskCache()
+
+
 class SelectionDisplay(object):
     """
     Base class for selection display classes.  Selection display classes are
@@ -475,15 +607,18 @@ class OverlaySelectionDisplay(SelectionDisplay):
         from .util.transform import dim
         if isinstance(selection_expr, dim):
             dataset = element.dataset
+            cache = _selection_mask_cache
             try:
                 if dataset.interface.gridded:
-                    mask = selection_expr.apply(dataset, expanded=True, flat=False, strict=True)
+                    mask = cache.mask(dataset, selection_expr, expanded=True,
+                                      flat=False, strict=True)
                     selection = dataset.clone(dataset.interface.mask(dataset, ~mask))
                 elif isinstance(element, (Curve, Spread)) and hasattr(dataset.interface, 'mask'):
-                    mask = selection_expr.apply(dataset, compute=False, strict=True)
+                    mask = cache.mask(dataset, selection_expr, compute=False, strict=True)
                     selection = dataset.clone(dataset.interface.mask(dataset, ~mask))
                 else:
-                    mask = selection_expr.apply(dataset, compute=False, keep_index=True, strict=True)
+                    mask = cache.mask(dataset, selection_expr, compute=False,
+                                      keep_index=True, strict=True)
                     selection = dataset.select(selection_mask=mask)
                 element = element.pipeline(selection)
             except KeyError as e:
@@ -528,7 +663,7 @@ class ColorListSelectionDisplay(SelectionDisplay):
                 if not expr:
                     color_inds[:] = i
                 else:
-                    color_inds[expr.apply(ds)] = i
+                    color_inds[_selection_mask_cache.mask(ds, expr)] = i
 
             colors = clrs[color_inds]
             color_opts = {color_prop: colors for color_prop in self.color_props}
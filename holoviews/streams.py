@@ -4,7 +4,9 @@ generate and respond to events, originating either in Python on the
 server-side or in Javascript in the Jupyter notebook (client-side).
 """
 
+import sys
 import weakref
+import warnings
 from numbers import Number
 from collections import defaultdict
 from contextlib import contextmanager
@@ -136,37 +138,24 @@ class Stream(param.Parameterized):
         subscriber may be set multiple times across streams but only
         needs to be called once.
         """
-        # Union of stream contents
-        items = [stream.contents.items() for stream in set(streams)]
-        union = [kv for kvs in items for kv in kvs]
-        klist = [k for k, _ in union]
-        key_clashes = []
-        for k, v in union:
-            key_count = klist.count(k)
-            try:
-                value_count = union.count((k, v))
-            except Exception:
-                # If we can't compare values we assume they are not equal
-                value_count = 1
-            if key_count > 1 and key_count > value_count and k not in key_clashes:
-                key_clashes.append(k)
+        # Union of stream contents, detecting clashing keys in a single
+        # pass without comparing the (potentially large) values
+        union, key_clashes = {}, []
+        for stream in util.unique_iterator(streams):
+            for k, v in stream.contents.items():
+                if k in union and not cls._same_value(union[k], v) and k not in key_clashes:
+                    key_clashes.append(k)
+                union[k] = v
         if key_clashes:
             print('Parameter name clashes for keys %r' % key_clashes)
 
-        # Group subscribers by precedence while keeping the ordering
-        # within each group
-        subscriber_precedence = defaultdict(list)
         for stream in streams:
             stream._on_trigger()
-            for precedence, subscriber in stream._subscribers:
-                subscriber_precedence[precedence].append(subscriber)
-        sorted_subscribers = sorted(subscriber_precedence.items(), key=lambda x: x[0])
-        subscribers = util.unique_iterator([s for _, subscribers in sorted_subscribers
-                                            for s in subscribers])
+        subscribers = cls._trigger_subscribers(streams)
 
         with triggering_streams(streams):
             for subscriber in subscribers:
-                subscriber(**dict(union))
+                subscriber(**union)
 
         for stream in streams:
             with util.disable_constant(stream):
@@ -174,6 +163,62 @@ class Stream(param.Parameterized):
                     stream.reset()
 
 
+    @classmethod
+    def _same_value(cls, value, other):
+        """
+        Whether two stream values are the same by identity or equality.
+        Arrays and pandas, dask or xarray objects are only compared by
+        identity to avoid comparing potentially large data element-wise.
+        """
+        if value is other:
+            return True
+        elif any(cls._is_data(v) for v in (value, other)):
+            return False
+        try:
+            return bool(value == other)
+        except Exception:
+            return False
+
+
+    @classmethod
+    def _is_data(cls, value):
+        "Whether the value is an array or pandas, dask or xarray object."
+        if (isinstance(value, util.arraylike_types) or util.is_dataframe(value)
+            or util.is_series(value) or util.is_dask_array(value)):
+            return True
+        elif 'xarray' in sys.modules:
+            import xarray as xr
+            return isinstance(value, (xr.DataArray, xr.Dataset))
+        return False
+
+
+    @classmethod
+    def _trigger_subscribers(cls, streams):
+        """
+        Returns the unique subscribers of the streams grouped by
+        precedence, keeping the ordering within each group. The
+        result for the most recently triggered set of streams is
+        cached on the first stream until the subscribers of any of
+        the streams change.
+        """
+        streams = tuple(streams)
+        versions = tuple(stream._subscriber_version for stream in streams)
+        cached = streams[0]._subscriber_cache if streams else None
+        if (cached and len(cached[0]) == len(streams) and cached[1] == versions
+            and all(s1 is s2 for s1, s2 in zip(cached[0], streams))):
+            return cached[2]
+        subscriber_precedence = defaultdict(list)
+        for stream in streams:
+            for precedence, subscriber in stream._subscribers:
+                subscriber_precedence[precedence].append(subscriber)
+        sorted_subscribers = sorted(subscriber_precedence.items(), key=lambda x: x[0])
+        subscribers = list(util.unique_iterator([s for _, subscribers in sorted_subscribers
+                                                 for s in subscribers]))
+        if streams:
+            streams[0]._subscriber_cache = (streams, versions, subscribers)
+        return subscribers
+
+
     def _on_trigger(self):
         """Called when a stream has been triggered"""
 
@@ -241,6 +286,10 @@ class Stream(param.Parameterized):
         # Source is stored as a weakref to allow it to be garbage collected
         self._source = None if source is None else weakref.ref(source)
 
+        # Incremented whenever the subscribers change, invalidating the
+        # precedence ordered subscribers cached by trigger
+        self._subscriber_version = 0
+        self._subscriber_cache = None
         self._subscribers = []
         for subscriber in subscribers:
             self.add_subscriber(subscriber)
@@ -265,6 +314,17 @@ class Stream(param.Parameterized):
                 self.registry[source] = [self]
 
 
+    @property
+    def _subscribers(self):
+        return self._subscriber_list
+
+
+    @_subscribers.setter
+    def _subscribers(self, subscribers):
+        self._subscriber_list = subscribers
+        self._subscriber_version += 1
+
+
     @property
     def subscribers(self):
         """Property returning the subscriber list"""
@@ -317,7 +377,8 @@ class Stream(param.Parameterized):
         """
         if not callable(subscriber):
             raise TypeError('Subscriber must be a callable.')
-        self._subscribers.append((precedence, subscriber))
+        self._subscriber_list.append((precedence, subscriber))
+        self._subscriber_version += 1
 
 
     def _validate_rename(self, mapping):
@@ -498,9 +559,21 @@ class Buffer(Pipe):
     subscribed to this stream will update the axis ranges when an
     update is pushed. This makes it possible to control whether zooming
     is allowed while streaming.
+
+    Array and dictionary data may also be accumulated in a ring buffer
+    by setting ring=True. Rather than concatenating the retained
+    window with each new chunk, the rows are written into preallocated
+    column arrays and the ``data`` is an ordered view onto them, which
+    avoids copying the whole window on every update.
+
+    On each update the Buffer summarizes the ranges of the rows that
+    were appended and of the rows evicted from the window, which
+    allows subscribed plots to update their axis ranges incrementally
+    rather than rescanning the whole window.
     """
 
-    def __init__(self, data, length=1000, index=True, following=True, **params):
+    def __init__(self, data, length=1000, index=True, following=True,
+                 ring=False, **params):
         if (util.pd and isinstance(data, util.pd.DataFrame)):
             example = data
         elif isinstance(data, np.ndarray):
@@ -532,6 +605,9 @@ class Buffer(Pipe):
             data.stream.sink(self.send)
             self.sdf = data
 
+        if ring and not isinstance(example, (np.ndarray, dict)):
+            raise ValueError("Buffer only supports ring=True for NumPy "
+                             "array and dictionary data.")
         if index and (util.pd and isinstance(example, util.pd.DataFrame)):
             example = example.reset_index()
         params['data'] = example
@@ -539,8 +615,15 @@ class Buffer(Pipe):
         self.length = length
         self.following = following
         self._chunk_length = 0
+        self._chunk_ranges = None
         self._count = 0
         self._index = index
+        self._ring = ring
+        self._ring_storage = None
+        self._ring_end = 0
+        if ring:
+            with util.disable_constant(self):
+                self.data = self._ring_append(example)
 
 
     def verify(self, x):
@@ -574,17 +657,116 @@ class Buffer(Pipe):
             data = self.data.iloc[:0]
         elif isinstance(self.data, dict):
             data = {k: v[:0] for k, v in self.data.items()}
+        self._ring_storage = None
+        self._ring_end = 0
         with util.disable_constant(self):
             self.data = data
         self.send(data)
 
 
+    def _ring_append(self, data):
+        """
+        Writes the data into the preallocated ring buffer columns and
+        returns an ordered, zero-copy view of the last length rows.
+
+        The columns have twice the capacity of the buffer length so
+        new rows are always written after the current window. Once
+        the capacity is exhausted the retained rows are copied into
+        newly allocated columns, ensuring views that were previously
+        handed out are never overwritten.
+        """
+        columns = {None: data} if isinstance(data, np.ndarray) else data
+        if not columns:
+            return data
+        data_length = len(next(iter(columns.values())))
+        nrows = min(data_length, self.length)
+        storage = self._ring_storage
+        if storage is not None:
+            dtypes = {k: np.promote_types(arr.dtype, columns[k].dtype)
+                      for k, arr in storage.items()}
+        if (storage is None or self._ring_end + nrows > len(next(iter(storage.values())))
+            or any(dtypes[k] != arr.dtype for k, arr in storage.items())):
+            capacity = 2*self.length
+            keep = 0 if storage is None else min(self._ring_end, self.length-nrows)
+            new_storage = {}
+            for k, v in columns.items():
+                dtype = v.dtype if storage is None else dtypes[k]
+                arr = np.empty((capacity,)+v.shape[1:], dtype=dtype)
+                if keep:
+                    arr[:keep] = storage[k][self._ring_end-keep:self._ring_end]
+                new_storage[k] = arr
+            self._ring_storage = storage = new_storage
+            self._ring_end = keep
+
+        start, end = self._ring_end, self._ring_end+nrows
+        for k, arr in storage.items():
+            arr[start:end] = columns[k][data_length-nrows:]
+        self._ring_end = end
+        start = max(0, end-self.length)
+        views = {k: arr[start:end] for k, arr in storage.items()}
+        return views[None] if isinstance(data, np.ndarray) else views
+
+
+    @classmethod
+    def _column_range(cls, values):
+        """
+        Returns the (min, max) of a numeric column ignoring NaNs or
+        None if the range cannot be summarized.
+        """
+        values = np.asarray(values)
+        if values.dtype.kind not in 'iuf':
+            return None
+        elif not len(values):
+            return (np.NaN, np.NaN)
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore', r'All-NaN (slice|axis) encountered')
+            return (np.nanmin(values), np.nanmax(values))
+
+
+    def _chunk_summary(self, data, data_length):
+        """
+        Summarizes the ranges of the columns in the incoming chunk and
+        of the rows it evicts from the current window. Returns a
+        dictionary mapping from column name to a tuple of the appended
+        and evicted ranges, where the evicted range is None if no rows
+        were evicted. Columns which cannot be summarized are omitted
+        and None is returned if the window is empty or entirely
+        replaced.
+        """
+        if (isinstance(data, np.ndarray) or not data_length or
+            data_length >= self.length):
+            return None
+        if util.pd and isinstance(data, util.pd.DataFrame):
+            columns = [(c, data[c].values, self.data[c].values) for c in data.columns]
+        else:
+            columns = [(c, v, self.data[c]) for c, v in data.items()]
+        current = len(columns[0][2]) if columns else 0
+        evicted = max(0, current+data_length-self.length)
+        summary = {}
+        for column, new, old in columns:
+            appended = self._column_range(new)
+            if appended is None:
+                continue
+            evicted_range = self._column_range(old[:evicted]) if evicted else None
+            summary[column] = (appended, evicted_range)
+        return summary
+
+
     def _concat(self, data):
         """
         Concatenate and slice the accepted data types to the defined
         length.
         """
-        if isinstance(data, np.ndarray):
+        if isinstance(data, dict) and not data:
+            self._chunk_ranges = None
+        else:
+            data_length = len(data) if not isinstance(data, dict) else len(list(data.values())[0])
+            self._chunk_ranges = self._chunk_summary(data, data_length)
+        if self._ring:
+            data_length = len(data) if isinstance(data, np.ndarray) else (
+                len(list(data.values())[0]) if data else 0)
+            data = self._ring_append(data)
+        elif isinstance(data, np.ndarray):
             data_length = len(data)
             if data_length < self.length:
                 prev_chunk = self.data[-(self.length-data_length):]
@@ -530,6 +530,12 @@ class HeterogeneousColumnTests(HomogeneousColumnTests):
         ds = Dataset((['A', 'B', 'C', None],), 'A')
         self.assertEqual(ds.range(0), ('A', 'C'))
 
+    def test_dataset_ranges(self):
+        ranges = self.table.interface.ranges(self.table, self.table.dimensions())
+        self.assertEqual(list(ranges), ['Gender', 'Age', 'Weight', 'Height'])
+        self.assertEqual(ranges, {'Gender': ('F', 'M'), 'Age': (10, 16),
+                                  'Weight': (10, 18), 'Height': (0.6, 0.8)})
+
     def test_dataset_sort_vdim_ht(self):
         dataset = Dataset({'x':self.xs, 'y':-self.ys},
                           kdims=['x'], vdims=['y'])
@@ -625,6 +631,10 @@ class HeterogeneousColumnTests(HomogeneousColumnTests):
                           kdims=['Gender'], sort=False)
         self.assertEqual(self.table.groupby(['Gender']), grouped)
 
+    def test_dataset_groupby_lazy(self):
+        self.assertEqual(self.table.groupby(['Gender'], lazy=True),
+                         self.table.groupby(['Gender']))
+
     def test_dataset_groupby_alias(self):
         group1 = {'age':[10,16], 'weight':[15,18], 'height':[0.8,0.6]}
         group2 = {'age':[12], 'weight':[10], 'height':[0.8]}
@@ -710,6 +720,10 @@ class HeterogeneousColumnTests(HomogeneousColumnTests):
                           kdims=self.kdims, vdims=self.vdims)
         self.assertEquals(row, indexed)
 
+    def test_dataset_select_expr_mask_length_mismatch(self):
+        with self.assertRaises(IndexError):
+            self.table.select(selection_expr=dim('Age').iloc[:2] > 0)
+
     def test_dataset_select_rows_gender_male_alias(self):
         row = self.alias_table.select(Gender='M')
         alias_row = self.alias_table.select(gender='M')
@@ -0,0 +1,124 @@
+import os
+import shutil
+import tempfile
+
+from unittest import SkipTest
+
+import numpy as np
+
+try:
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except:
+    raise SkipTest("Could not import pyarrow, skipping ArrowInterface tests.")
+
+from holoviews.core.data import Dataset
+from holoviews.element.comparison import ComparisonTestCase
+from holoviews.core.data.arrow import ArrowInterface
+
+from .base import HeterogeneousColumnTests, InterfaceTests
+
+
+class ArrowInterfaceTests(HeterogeneousColumnTests, InterfaceTests):
+    """
+    Tests for the ArrowInterface.
+    """
+
+    datatype = 'arrow'
+    data_type = pa.Table
+
+    __test__ = True
+
+    def test_table_groupby_multiple_keys_missing(self):
+        table = pa.table({'a': ['y', 'x', None, 'y', 'x', 'y'],
+                          'b': [1, 2, 1, 1, 2, 2],
+                          'c': np.arange(6.)})
+        dataset = Dataset(table, kdims=['a', 'b'], vdims=['c'])
+        grouped = dataset.groupby(['a', 'b'])
+        self.assertEqual(grouped.keys(), [('y', 1), ('x', 2), ('y', 2)])
+        self.assertEqual(grouped['y', 1].dimension_values('c'), np.array([0., 3.]))
+        self.assertEqual(grouped['x', 2].dimension_values('c'), np.array([1., 4.]))
+        self.assertEqual(grouped['y', 2].dimension_values('c'), np.array([5.]))
+        self.assertIsInstance(grouped['y', 1].data, pa.Table)
+
+
+class ArrowParquetTests(ComparisonTestCase):
+    """
+    Tests for the ArrowInterface wrapping a lazily loaded Parquet dataset.
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'data.parquet')
+        self.df = pd.DataFrame({
+            'x': np.arange(10), 'y': np.arange(10)*0.5,
+            'z': list('AABBCCDDEE'), 'w': np.ones(10)
+        })
+        pq.write_table(pa.Table.from_pandas(self.df, preserve_index=False),
+                       self.path, row_group_size=2)
+        self.dataset = Dataset(ds.dataset(self.path), kdims=['x', 'z'], vdims=['y'])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_parquet_dataset_lazy(self):
+        self.assertIsInstance(self.dataset.data, ds.Dataset)
+        self.assertEqual(self.dataset.interface, ArrowInterface)
+        self.assertEqual(len(self.dataset), 10)
+
+    def test_parquet_dataset_values(self):
+        self.assertEqual(self.dataset.dimension_values('y'), self.df.y.values)
+
+    def test_parquet_dataset_unique_values(self):
+        self.assertEqual(self.dataset.dimension_values('z', expanded=False),
+                         np.array(list('ABCDE'), dtype=object))
+
+    def test_parquet_dataset_statistics_range(self):
+        self.assertEqual(ArrowInterface._statistics_range(self.dataset.data, 'x'), (0, 9))
+        self.assertEqual(self.dataset.range('x'), (0, 9))
+        self.assertEqual(self.dataset.range('z'), ('A', 'E'))
+
+    def test_parquet_dataset_range_missing_statistics(self):
+        df = pd.DataFrame({'x': [0., np.NaN, 3.], 'y': [1, 2, 3]})
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False),
+                       self.path, row_group_size=1)
+        dataset = Dataset(ds.dataset(self.path), kdims=['x'], vdims=['y'])
+        self.assertIs(ArrowInterface._statistics_range(dataset.data, 'x'), None)
+        self.assertEqual(dataset.range('x'), (0, 3))
+
+    def test_parquet_dataset_select_pushdown(self):
+        expression = ArrowInterface._filter_expression(self.dataset, {'x': (2, 5)})
+        self.assertIsInstance(expression, ds.Expression)
+        selected = self.dataset.select(x=(2, 5))
+        self.assertIsInstance(selected.data, pa.Table)
+        self.assertEqual(selected.data.column_names, ['x', 'y', 'z'])
+        self.assertEqual(selected.dimension_values('x'), np.array([2, 3, 4]))
+
+    def test_parquet_dataset_select_list(self):
+        selected = self.dataset.select(z=['A', 'E'])
+        self.assertEqual(selected.dimension_values('x'), np.array([0, 1, 8, 9]))
+
+    def test_parquet_dataset_select_callable(self):
+        self.assertIs(ArrowInterface._filter_expression(self.dataset, {'x': lambda x: x > 7}), None)
+        selected = self.dataset.select(x=lambda x: x > 7)
+        self.assertEqual(selected.dimension_values('x'), np.array([8, 9]))
+
+    def test_parquet_dataset_select_scalar(self):
+        self.assertEqual(self.dataset.select(x=3, z='B'), 1.5)
+
+    def test_parquet_dataset_groupby(self):
+        grouped = self.dataset.groupby('z')
+        self.assertEqual(grouped.keys(), list('ABCDE'))
+        self.assertEqual(grouped['C'].dimension_values('x'), np.array([4, 5]))
+        self.assertIsInstance(grouped['C'].data, pa.Table)
+
+    def test_parquet_dataset_datetime_select(self):
+        df = pd.DataFrame({'t': pd.date_range('2020-01-01', periods=4), 'y': np.arange(4)})
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), self.path)
+        dataset = Dataset(ds.dataset(self.path), kdims=['t'], vdims=['y'])
+        selected = dataset.select(t=('2020-01-02', '2020-01-04'))
+        self.assertEqual(selected.dimension_values('y'), np.array([1, 2]))
+        self.assertEqual(dataset.range('t'), (np.datetime64('2020-01-01'),
+                                              np.datetime64('2020-01-04')))
@@ -32,6 +32,9 @@ class cuDFInterfaceTests(HeterogeneousColumnTests, InterfaceTests):
     def test_dataset_2D_aggregate_spread_fn_with_duplicates(self):
         raise SkipTest("cuDF does not support variance aggregation")
 
+    def test_dataset_select_expr_mask_length_mismatch(self):
+        raise SkipTest("Lazy masks are not length checked")
+
     def test_dataset_mixed_type_range(self):
         ds = Dataset((['A', 'B', 'C', None],), 'A')
         vmin, vmax = ds.range(0)
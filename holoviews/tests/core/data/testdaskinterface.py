@@ -61,6 +61,9 @@ class DaskDatasetTest(BasePandasInterfaceTests):
     def test_dataset_aggregate_string_types_size(self):
         raise SkipTest("Not supported")
 
+    def test_dataset_select_expr_mask_length_mismatch(self):
+        raise SkipTest("Lazy masks are not length checked")
+
     def test_dataset_2D_aggregate_partial_hm(self):
         raise SkipTest("Temporarily skipped")
 
@@ -111,3 +114,10 @@ class DaskDatasetTest(BasePandasInterfaceTests):
         # Make sure that selecting by expression didn't cause evaluation
         self.assertIsInstance(new_ds.data, dd.DataFrame)
         self.assertEqual(new_ds.data.compute(), df[df.b == 10])
+
+    def test_dataset_nbytes_counts_partitions_in_graph(self):
+        df = pd.DataFrame({'x': np.arange(1000.), 'y': np.arange(1000.)})
+        ds = Dataset(dd.from_pandas(df, npartitions=2), kdims=['x'], vdims=['y'])
+        nbytes = ds.interface.nbytes(ds)
+        self.assertGreaterEqual(nbytes, 16000)
+        self.assertEqual(nbytes, ds.interface.nbytes(ds.clone(ds.data*2)))
@@ -0,0 +1,101 @@
+"""
+Tests for the PackedInterface.
+"""
+
+import numpy as np
+
+from holoviews.core.data import Dataset, MultiInterface, PackedInterface, PackedGeometries
+from holoviews.element import Path, Polygons
+
+from .testmultiinterface import GeomTests
+
+
+class PackedInterfaceTest(GeomTests):
+    """
+    Test of the PackedInterface.
+    """
+
+    datatype = 'packed'
+
+    interface = PackedInterface
+
+    __test__ = True
+
+    def setUp(self):
+        self.geoms = PackedGeometries(
+            {'x': [0, 1, 2, 3, 4, 5, 6], 'y': [0, 1, 0, 1, 2, 3, 2]},
+            [0, 3, 5, 7], {'z': [0, 1, 0]})
+        super(PackedInterfaceTest, self).setUp()
+
+    def test_packed_constructor(self):
+        path = Path(self.geoms, vdims='z')
+        self.assertIs(path.interface, self.interface)
+        self.assertEqual(len(path), 3)
+        self.assertEqual(path.dimension_values('x'),
+                         np.array([0, 1, 2, np.nan, 3, 4, np.nan, 5, 6]))
+        self.assertEqual(path.dimension_values('z'),
+                         np.array([0, 0, 0, np.nan, 1, 1, np.nan, 0, 0]))
+        self.assertEqual(path.dimension_values('z', expanded=False), np.array([0, 1, 0]))
+
+    def test_packed_constructor_invalid_offsets(self):
+        with self.assertRaises(ValueError):
+            PackedGeometries({'x': [0, 1, 2], 'y': [0, 1, 2]}, [0, 2, 1])
+
+    def test_packed_constructor_mismatched_column(self):
+        with self.assertRaises(ValueError):
+            PackedGeometries({'x': [0, 1, 2], 'y': [0, 1]}, [0, 1, 3])
+
+    def test_packed_range(self):
+        path = Path(self.geoms, vdims='z')
+        self.assertEqual(path.range('x'), (0, 6))
+        self.assertEqual(path.range('y'), (0, 3))
+        self.assertEqual(path.range('z'), (0, 1))
+
+    def test_packed_select_scalar(self):
+        path = Path(self.geoms, vdims='z')
+        selected = path.select(z=0)
+        self.assertIs(selected.interface, self.interface)
+        self.assertEqual(selected.data.offsets, np.array([0, 3, 5]))
+        self.assertEqual(selected.dimension_values('x'), np.array([0, 1, 2, np.nan, 5, 6]))
+
+    def test_packed_select_vertices(self):
+        path = Dataset(self.geoms, kdims=['x', 'y'], vdims='z')
+        selected = path.select(x=(1, 5))
+        self.assertEqual(selected.data.offsets, np.array([0, 2, 4]))
+        self.assertEqual(selected.dimension_values('x'), np.array([1, 2, np.nan, 3, 4]))
+        self.assertEqual(selected.dimension_values('z', expanded=False), np.array([0, 1]))
+
+    def test_packed_groupby(self):
+        path = Path(self.geoms, vdims='z')
+        grouped = path.groupby('z')
+        self.assertEqual(grouped.keys(), [0, 1])
+        self.assertIs(grouped[0].interface, self.interface)
+        self.assertEqual(grouped[0].dimension_values('x'), np.array([0, 1, 2, np.nan, 5, 6]))
+        self.assertEqual(grouped[1].dimension_values('x'), np.array([3, 4]))
+
+    def test_packed_split_columns(self):
+        path = Path(self.geoms, vdims='z')
+        splits = path.split(datatype='columns')
+        self.assertEqual(len(splits), 3)
+        self.assertEqual(splits[1]['x'], np.array([3, 4]))
+        self.assertEqual(splits[1]['y'], np.array([1, 2]))
+        self.assertEqual(splits[1]['z'], 1)
+
+    def test_packed_multitabular_roundtrip(self):
+        path = Path(self.geoms, vdims='z')
+        multi = path.clone(datatype=['multitabular'])
+        self.assertIs(multi.interface, MultiInterface)
+        packed = multi.clone(datatype=['packed'])
+        self.assertIs(packed.interface, self.interface)
+        self.assertEqual(packed.data.offsets, self.geoms.offsets)
+        self.assertEqual(list(packed.data.scalars), ['z'])
+        for d in path.dimensions():
+            self.assertEqual(multi.dimension_values(d), path.dimension_values(d))
+            self.assertEqual(packed.dimension_values(d), path.dimension_values(d))
+
+    def test_packed_polygons_not_expanded_values_closed(self):
+        poly = Polygons(self.geoms, vdims='z')
+        xs = poly.dimension_values('x', expanded=False)
+        self.assertEqual(xs[0], np.array([0, 1, 2, 0]))
+        self.assertEqual(xs[1], np.array([3, 4, 3]))
+        self.assertEqual(xs[2], np.array([5, 6, 5]))
@@ -173,3 +173,43 @@ class PandasInterfaceTests(BasePandasInterfaceTests):
     data_type = pd.DataFrame
 
     __test__ = True
+
+    def test_dataset_groupby_lazy(self):
+        x, y, z = list('AB'*10), np.arange(20)%3, np.arange(20)
+        ds = Dataset((x, y, z), kdims=['x', 'y'], vdims=['z'])
+        grouped = ds.groupby(['x', 'y'], lazy=True)
+        self.assertEqual(grouped.data.built(), [])
+        self.assertEqual(grouped.keys(), ds.groupby(['x', 'y']).keys())
+        group = Dataset({'z': [5, 11, 17]}, vdims=['z'])
+        self.assertEqual(grouped.last, group)
+        self.assertEqual(grouped.data.built(), [('B', 2)])
+
+    def test_dataset_groupby_lazy_equal_to_eager(self):
+        df = pd.DataFrame({'x': [3, 1, np.NaN, 3, 2, 1], 'y': list('abcabd'),
+                           'z': np.arange(6)})
+        ds = Dataset(df, ['x', 'y'], 'z')
+        for dims in (['x'], ['y'], ['x', 'y']):
+            self.assertEqual(ds.groupby(dims, lazy=True), ds.groupby(dims))
+
+    def test_dataset_groupby_lazy_accessors_build_single_group(self):
+        ds = Dataset((np.arange(10)%5, np.arange(10)), 'x', 'y')
+        grouped = ds.groupby('x', lazy=True)
+        self.assertEqual(grouped.keys(), list(range(5)))
+        self.assertEqual(len(grouped), 5)
+        self.assertIn((2,), grouped)
+        self.assertEqual(grouped.data.built(), [])
+        self.assertIs(grouped.type, Dataset)
+        grouped.group, grouped.label
+        self.assertEqual(grouped.data.built(), [(0,)])
+        grouped.clone().last
+        self.assertEqual(grouped.data.built(), [(0,), (4,)])
+
+    def test_dataset_groupby_lazy_clone_unbuilt(self):
+        ds = Dataset((np.arange(10)%5, np.arange(10)), 'x', 'y')
+        grouped = ds.groupby('x', lazy=True)
+        grouped[3]
+        clone = grouped.clone()
+        self.assertEqual(clone.keys(), list(range(5)))
+        self.assertIn((3,), clone.data.built())
+        self.assertNotIn((1,), clone.data.built())
+        self.assertEqual(clone[1], Dataset({'y': [1, 6]}, vdims='y'))
@@ -599,6 +599,25 @@ class GroupbyTestCase(DatasetPropertyTestCase):
             )
 
 
+    def test_groupby_lazy_dataset(self):
+        ds_groups = self.ds.reindex(
+            kdims=['b', 'c'], vdims=['a', 'd']
+        ).groupby('b', lazy=True)
+
+        for k in ds_groups.keys():
+            ds_group = ds_groups[k]
+
+            # Check pipeline
+            ops = ds_group.pipeline.operations
+            self.assertEqual(ops[2].method_name, 'groupby')
+            self.assertEqual(ops[2].kwargs, {'lazy': True})
+            self.assertEqual(ops[3].method_name, '__getitem__')
+            self.assertEqual(ops[3].args, [k])
+
+            # Execute pipeline
+            self.assertEqual(ds_group.pipeline(ds_group.dataset), ds_group)
+
+
 class AddDimensionTestCase(DatasetPropertyTestCase):
     def test_add_dimension_dataset(self):
         ds_dim_added = self.ds.add_dimension('new', 1, 17)
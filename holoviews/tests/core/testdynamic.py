@@ -456,6 +456,55 @@ class DynamicMapUnboundedProperty(ComparisonTestCase):
         self.assertEqual(dmap.redim.range(z=(-0.5,0.5)).unbounded, [])
 
 
+class DynamicMapCache(ComparisonTestCase):
+
+    def test_cache_size_evicts_least_recently_used(self):
+        dmap = DynamicMap(lambda i: Curve([i]), kdims=['i'], cache_size=2)
+        dmap[0], dmap[1]
+        dmap[0]
+        dmap[2]
+        self.assertEqual(dmap.keys(), [0, 2])
+
+    def test_cache_info_counters(self):
+        dmap = DynamicMap(lambda i: Curve([i]), kdims=['i'], cache_size=2)
+        dmap[0], dmap[1], dmap[0], dmap[2]
+        info = dmap.cache_info
+        self.assertEqual(info['hits'], 1)
+        self.assertEqual(info['misses'], 3)
+        self.assertEqual(info['evictions'], 1)
+        self.assertEqual(info['size'], 2)
+
+    def test_cache_bytes_evicts_to_budget(self):
+        fn = lambda i: Image(np.zeros((10, 10)))
+        dmap = DynamicMap(fn, kdims=['i'], cache_bytes=2000)
+        dmap[0], dmap[1], dmap[2]
+        self.assertEqual(dmap.keys(), [1, 2])
+        self.assertEqual(dmap.cache_info['nbytes'], 1600)
+
+    def test_cache_bytes_evicts_after_hit(self):
+        fn = lambda i: Image(np.zeros((10, 10)))
+        dmap = DynamicMap(fn, kdims=['i'], cache_bytes=2000)
+        dmap[0], dmap[1], dmap[0], dmap[2]
+        self.assertEqual(dmap.keys(), [0, 2])
+
+    def test_cache_evicts_untracked_items_first(self):
+        dmap = DynamicMap(lambda i: Curve([i]), kdims=['i'], cache_size=2)
+        dmap[0]
+        dmap.data[(5,)] = Curve([5])
+        dmap[1]
+        self.assertEqual(dmap.keys(), [0, 1])
+        dmap.data.pop((0,))
+        dmap[2], dmap[3]
+        self.assertEqual(dmap.keys(), [2, 3])
+
+    def test_cache_reset_clears_info(self):
+        dmap = DynamicMap(lambda i: Curve([i]), kdims=['i'])
+        dmap[0], dmap[0]
+        dmap.reset()
+        self.assertEqual(dmap.cache_info, dict(hits=0, misses=0, evictions=0,
+                                               size=0, nbytes=0))
+
+
 class DynamicTransferStreams(ComparisonTestCase):
 
     def setUp(self):
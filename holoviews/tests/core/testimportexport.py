@@ -4,8 +4,9 @@ Unit test of the (non-rendering) exporters and importers.
 
 import os
 import numpy as np
-from holoviews import Image, Layout
-from holoviews.core.io import Serializer, Pickler, Unpickler, Deserializer
+from holoviews import Curve, HoloMap, Image, Layout
+from holoviews.core.io import (Serializer, Pickler, Unpickler, Deserializer,
+                               FramePickler, FrameUnpickler)
 from holoviews.element.comparison import ComparisonTestCase
 
 
@@ -187,3 +188,76 @@ class TestPicklerAdvanced(ComparisonTestCase):
                                 entries=['Image.I(L)'])
         self.assertEqual(single_layout, loaded)
 
+
+
+class TestFramePickler(ComparisonTestCase):
+    """
+    Test the frame pickler and unpickler using the .hvf format,
+    including lazy loading and appending of HoloMap frames.
+    """
+
+    def setUp(self):
+        xs = np.linspace(0, 1, 500)
+        self.hmap = HoloMap({i: Curve((xs, np.sin(xs*i))) for i in range(3)},
+                            kdims='Frequency')
+        self.image = Image(np.arange(1000.).reshape(25, 40))
+
+    def tearDown(self):
+        for f in os.listdir('.'):
+            if f.endswith('.hvf'):
+                os.remove(f)
+
+    def test_frame_pickler_save_load_element(self):
+        FramePickler.save(self.image, 'test_frame_pickler_element')
+        loaded = FrameUnpickler.load('test_frame_pickler_element.hvf')
+        self.assertEqual(loaded, self.image)
+
+    def test_frame_pickler_save_load_holomap(self):
+        FramePickler.save(self.hmap, 'test_frame_pickler_holomap')
+        loaded = FrameUnpickler.load('test_frame_pickler_holomap.hvf')
+        self.assertEqual(loaded, self.hmap)
+        self.assertEqual(loaded.kdims, self.hmap.kdims)
+
+    def test_frame_pickler_load_without_mmap(self):
+        FramePickler.save(self.hmap, 'test_frame_pickler_no_mmap')
+        loaded = FrameUnpickler.load('test_frame_pickler_no_mmap.hvf', mmap=False)
+        self.assertEqual(loaded, self.hmap)
+
+    def test_frame_pickler_serialize_deserialize(self):
+        data, info = FramePickler(self.hmap)
+        self.assertEqual(info['file-ext'], 'hvf')
+        self.assertEqual(FrameUnpickler(data), self.hmap)
+
+    def test_frame_pickler_load_keys_memmapped(self):
+        hmap = HoloMap({i: self.image.clone(self.image.data*i) for i in range(3)})
+        FramePickler.save(hmap, 'test_frame_pickler_keys')
+        loaded = FrameUnpickler.load('test_frame_pickler_keys.hvf', keys=[2])
+        self.assertEqual(loaded.keys(), [2])
+        self.assertEqual(loaded[2], hmap[2])
+        self.assertIsInstance(loaded[2].data, np.memmap)
+
+    def test_frame_pickler_frames(self):
+        FramePickler.save(self.hmap, 'test_frame_pickler_frames')
+        self.assertEqual(FrameUnpickler.frames('test_frame_pickler_frames.hvf'),
+                         [(0,), (1,), (2,)])
+
+    def test_frame_pickler_append(self):
+        FramePickler.save(self.hmap, 'test_frame_pickler_append')
+        extra = HoloMap({3: Curve(np.random.rand(500, 2))}, kdims='Frequency')
+        FramePickler.append(extra, 'test_frame_pickler_append.hvf')
+        loaded = FrameUnpickler.load('test_frame_pickler_append.hvf')
+        self.assertEqual(loaded.keys(), [0, 1, 2, 3])
+        self.assertEqual(loaded[3], extra[3])
+
+    def test_frame_pickler_append_mismatched_kdims(self):
+        FramePickler.save(self.hmap, 'test_frame_pickler_append_kdims')
+        extra = HoloMap({3: Curve([1, 2, 3])}, kdims='Phase')
+        with self.assertRaises(ValueError):
+            FramePickler.append(extra, 'test_frame_pickler_append_kdims.hvf')
+
+    def test_frame_pickler_metadata(self):
+        FramePickler.save(self.hmap, 'test_frame_pickler_metadata',
+                          info={'info':'example'}, key={1:2})
+        self.assertEqual(FrameUnpickler.key('test_frame_pickler_metadata.hvf'), {1:2})
+        info = FrameUnpickler.info('test_frame_pickler_metadata.hvf')
+        self.assertEqual(info['info'], 'example')
@@ -1,6 +1,8 @@
+import gc
 import os
 import sys
 import pickle
+import weakref
 from unittest import SkipTest
 
 import numpy as np
@@ -283,6 +285,50 @@ class TestOptionTree(ComparisonTestCase):
         self.assertEqual(options.MyType.Child.options('group2').kwargs,
                          {'kw2':'value2', 'kw4':'value4'})
 
+    def test_optiontree_closest_cached(self):
+        options = OptionTree(groups=['group1', 'group2'])
+        options.Image = {'group1': Options(kw1='value1')}
+        img = Image(np.random.rand(2, 2))
+        opts = options.closest(img, 'group1', defaults=False)
+        self.assertIs(options.closest(img, 'group1', defaults=False), opts)
+
+    def test_optiontree_closest_cache_invalidated_on_setattr(self):
+        options = OptionTree(groups=['group1', 'group2'])
+        options.Image = {'group1': Options(kw1='value1')}
+        img = Image(np.random.rand(2, 2), group='Custom')
+        self.assertEqual(options.closest(img, 'group1', defaults=False).kwargs,
+                         {'kw1': 'value1'})
+        options.Image.Custom = {'group1': Options(kw2='value2')}
+        self.assertEqual(options.closest(img, 'group1', defaults=False).kwargs,
+                         {'kw1': 'value1', 'kw2': 'value2'})
+
+    def test_optiontree_construction_does_not_clear_cache(self):
+        options = OptionTree(groups=['group1', 'group2'])
+        options.Image = {'group1': Options(kw1='value1')}
+        img = Image(np.random.rand(2, 2))
+        opts = options.closest(img, 'group1', defaults=False)
+        OptionTree(groups=['group1', 'group2'],
+                   options={'Curve': {'group1': dict(kw2='value2')}})
+        self.assertIs(options.closest(img, 'group1', defaults=False), opts)
+
+    def test_optiontree_closest_cache_released_with_tree(self):
+        options = OptionTree(groups=['group1', 'group2'])
+        options.closest(Image(np.random.rand(2, 2)), 'group1', defaults=False)
+        self.assertIn(options, OptionTree._option_cache)
+        ref = weakref.ref(options)
+        del options
+        gc.collect()
+        self.assertIs(ref(), None)
+
+    def test_optiontree_closest_cache_invalidated_on_delitem(self):
+        options = OptionTree(groups=['group1', 'group2'])
+        options.Image = {'group1': Options(kw1='value1')}
+        img = Image(np.random.rand(2, 2))
+        self.assertEqual(options.closest(img, 'group1', defaults=False).kwargs,
+                         {'kw1': 'value1'})
+        del options['Image']
+        self.assertEqual(options.closest(img, 'group1', defaults=False).kwargs, {})
+
 
 class TestStoreInheritanceDynamic(ComparisonTestCase):
     """
@@ -19,7 +19,7 @@ from holoviews.core.util import (
     sanitize_identifier_fn, find_range, max_range, wrap_tuple_streams,
     deephash, merge_dimensions, get_path, make_path_unique, compute_density,
     date_range, dt_to_int, compute_edges, isfinite, cross_index, closest_match,
-    dimension_range, tree_attribute
+    dimension_range, tree_attribute, fingerprint
 )
 from holoviews import Dimension, Element
 from holoviews.streams import PointerXY
@@ -141,6 +141,65 @@ class TestDeepHash(ComparisonTestCase):
         self.assertNotEqual(deephash(obj1), deephash(obj2))
 
 
+class TestFingerprint(ComparisonTestCase):
+    """
+    Tests of the content fingerprints used by deephash.
+    """
+
+    def test_fingerprint_numpy_equality(self):
+        self.assertEqual(fingerprint(np.arange(10)), fingerprint(np.arange(10)))
+
+    def test_fingerprint_numpy_dtype_inequality(self):
+        self.assertNotEqual(fingerprint(np.arange(10)),
+                            fingerprint(np.arange(10, dtype='int32')))
+
+    def test_fingerprint_numpy_noncontiguous(self):
+        arr = np.arange(10)
+        self.assertEqual(fingerprint(arr[::2]), fingerprint(arr[::2].copy()))
+
+    def test_fingerprint_numpy_writeable_updated(self):
+        arr = np.arange(10)
+        fp = fingerprint(arr)
+        arr[0] = 10
+        self.assertNotEqual(fingerprint(arr), fp)
+
+    def test_fingerprint_numpy_crc32_collision(self):
+        # The buffers have the same CRC32 checksum
+        self.assertNotEqual(fingerprint(np.array(list(b'plumless'), dtype='uint8')),
+                            fingerprint(np.array(list(b'buckeroo'), dtype='uint8')))
+
+    def test_fingerprint_numpy_object(self):
+        self.assertEqual(fingerprint(np.array(['a', 1], dtype=object)),
+                         fingerprint(np.array(['a', 1], dtype=object)))
+
+    def test_fingerprint_unsupported(self):
+        self.assertIs(fingerprint([1, 2, 3]), None)
+
+    @pd_skip
+    def test_fingerprint_dataframe_inequality_index(self):
+        self.assertNotEqual(fingerprint(pd.DataFrame({'a': [1, 2]}, index=[0, 1])),
+                            fingerprint(pd.DataFrame({'a': [1, 2]}, index=[1, 2])))
+
+    @pd_skip
+    def test_fingerprint_dataframe_inequality_columns(self):
+        self.assertNotEqual(fingerprint(pd.DataFrame({'a': [1, 2]})),
+                            fingerprint(pd.DataFrame({'b': [1, 2]})))
+
+    @pd_skip
+    def test_fingerprint_dataframe_mixed_equality(self):
+        df1 = pd.DataFrame({'a': [1, 2], 'b': ['x', 'y'],
+                            'c': pd.Categorical(['u', 'v'])})
+        df2 = pd.DataFrame({'a': [1, 2], 'b': ['x', 'y'],
+                            'c': pd.Categorical(['u', 'v'])})
+        self.assertEqual(fingerprint(df1), fingerprint(df2))
+
+    @pd_skip
+    def test_fingerprint_series_tz_inequality(self):
+        dates = pd.date_range('2020-01-01', periods=3)
+        self.assertNotEqual(fingerprint(pd.Series(dates)),
+                            fingerprint(pd.Series(dates.tz_localize('UTC'))))
+
+
 class TestAllowablePrefix(ComparisonTestCase):
     """
     Tests of allowable and hasprefix method.
@@ -10,7 +10,8 @@ from holoviews.core import util
 from holoviews.element.chart import Points
 from holoviews.element.graphs import (
     Graph, Nodes, TriMesh, Chord, circular_layout, connect_edges,
-    connect_edges_pd)
+    connect_edges_pd, connect_edges_arrays)
+from holoviews.element.util import lookup_nodes
 from holoviews.element.comparison import ComparisonTestCase
 
 pd_skip = skipIf(util.pd is None, 'Pandas not available')
@@ -77,6 +78,37 @@ class GraphTests(ComparisonTestCase):
             paths.append(np.array([start[:2], end[:2]]))
         self.assertEqual(segments, paths)
 
+    def test_graph_edge_segment_arrays(self):
+        x0, y0, x1, y1 = connect_edges_arrays(self.graph)
+        xs, ys, _ = self.nodes
+        self.assertEqual(x0, xs[self.source])
+        self.assertEqual(y0, ys[self.source])
+        self.assertEqual(x1, xs[self.target])
+        self.assertEqual(y1, ys[self.target])
+
+    def test_graph_edge_segment_arrays_missing_node(self):
+        graph = Graph(((self.source, self.target), Nodes(self.nodes).iloc[:-1]))
+        with self.assertRaisesRegexp(ValueError, 'Could not find node positions'):
+            connect_edges_arrays(graph)
+        x0, y0, x1, y1 = connect_edges_arrays(graph, drop_missing=True)
+        self.assertEqual(x0, self.nodes[0][:-1])
+
+    def test_lookup_nodes(self):
+        index = np.array(['c', 'a', 'b'])
+        self.assertEqual(lookup_nodes(index, ['a', 'b', 'd', 'c']),
+                         np.array([1, 2, -1, 0]))
+
+    def test_lookup_nodes_mixed_types(self):
+        index = np.array(['a', 1, 'b'], dtype=object)
+        self.assertEqual(lookup_nodes(index, np.array([1, 'b', 'z'], dtype=object)),
+                         np.array([1, 2, -1]))
+
+    def test_graph_edgepaths_packed(self):
+        edgepaths = self.graph.edgepaths
+        self.assertEqual(edgepaths.interface.datatype, 'packed')
+        self.assertEqual(len(edgepaths), len(self.graph))
+        self.assertEqual(edgepaths.split(datatype='array'), connect_edges(self.graph))
+
     def test_constructor_with_nodes_and_paths(self):
         paths = Graph(((self.source, self.target), self.nodes)).edgepaths
         graph = Graph(((self.source, self.target), self.nodes, paths.data))
@@ -15,7 +15,7 @@ try:
     from holoviews.core.util import pd
     from holoviews.operation.datashader import (
         aggregate, regrid, ds_version, stack, directly_connect_edges,
-        shade, rasterize
+        shade, rasterize, AggregatePyramid
     )
 except:
     raise SkipTest('Datashader not available')
@@ -67,6 +67,53 @@ class DatashaderAggregateTests(ComparisonTestCase):
                     xdensity=1, vdims=['Count'])
         self.assertEqual(agg, img)
 
+    def test_aggregate_points_pyramid_count_aligned(self):
+        xs, ys = np.random.RandomState(1).rand(2, 1000)
+        xs[:2], ys[:2] = (0, 1), (0, 1)
+        points = Points((xs, ys))
+        img = aggregate(points, dynamic=False, x_range=(0, 1), y_range=(0, 1),
+                        width=16, height=16, pyramid=True, pyramid_levels=2)
+        expected = aggregate(points, dynamic=False, x_range=(0, 1), y_range=(0, 1),
+                             width=16, height=16)
+        self.assertEqual(img.data.Count.values.sum(), expected.data.Count.values.sum())
+        self.assertEqual(img.data.Count.values, expected.data.Count.values)
+
+    def test_aggregate_points_pyramid_count_unaligned(self):
+        xs, ys = np.random.RandomState(1).rand(2, 1000)
+        points = Points((xs, ys))
+        img = aggregate(points, dynamic=False, x_range=(0, 1), y_range=(0, 1),
+                        width=10, height=10, pyramid=True, pyramid_levels=2)
+        self.assertEqual(img.data.Count.values.shape, (10, 10))
+        self.assertTrue(abs(int(img.data.Count.values.sum()) - 1000) <= 50)
+
+    def test_aggregate_points_pyramid_sum(self):
+        points = Points([(0.2, 0.3, 1), (0.4, 0.7, 2), (0, 0.99, 3)], vdims='z')
+        img = aggregate(points, dynamic=False, x_range=(0, 0.4), y_range=(0.3, 0.99),
+                        width=2, height=2, aggregator=ds.sum('z'), pyramid=True)
+        expected = aggregate(points, dynamic=False, x_range=(0, 0.4), y_range=(0.3, 0.99),
+                             width=2, height=2, aggregator=ds.sum('z'))
+        self.assertEqual(img.data.z.values, expected.data.z.values)
+
+    def test_aggregate_pyramid_aligned_query_exact(self):
+        counts = np.random.RandomState(1).randint(0, 5, (1024, 1024)).astype('float64')
+        pyramid = AggregatePyramid((0, 1), (0, 1), counts)
+        self.assertEqual(pyramid.shapes, [(256, 256), (512, 512), (1024, 1024)])
+        result = pyramid.query((0.25, 0.75), (0, 0.5), 64, 32)
+        expected = counts[:512, 256:768].reshape(32, 16, 64, 8).sum(axis=(1, 3))
+        self.assertEqual(result[0], expected)
+        self.assertEqual(result.sum(), counts[:512, 256:768].sum())
+
+    def test_aggregate_pyramid_unaligned_query_preserves_total(self):
+        counts = np.random.RandomState(1).randint(0, 5, (512, 512)).astype('float64')
+        pyramid = AggregatePyramid((0, 1), (0, 1), counts)
+        result = pyramid.query((0, 1), (0, 1), 100, 30)
+        self.assertEqual(result.shape, (1, 30, 100))
+        self.assertAlmostEqual(result.sum(), counts.sum())
+
+    def test_aggregate_pyramid_query_finer_than_finest(self):
+        pyramid = AggregatePyramid((0, 1), (0, 1), np.ones((512, 512)))
+        self.assertIs(pyramid.query((0, 0.5), (0, 0.5), 512, 512), None)
+
     def test_aggregate_points_target(self):
         points = Points([(0.2, 0.3), (0.4, 0.7), (0, 0.99)])
         expected = Image(([0.25, 0.75], [0.25, 0.75], [[1, 0], [2, 0]]),
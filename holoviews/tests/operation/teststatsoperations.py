@@ -9,6 +9,7 @@ import numpy as np
 
 from holoviews import Distribution, Bivariate, Area, Image, Contours, Polygons
 from holoviews.element.comparison import ComparisonTestCase
+from holoviews.operation import stats
 from holoviews.operation.stats import (univariate_kde, bivariate_kde)
 
 
@@ -76,3 +77,79 @@ class KDEOperationTests(ComparisonTestCase):
                             y_range=(0, 4), contours=False)
         img = Image(np.zeros((2, 2)), bounds=(-2, -2, 6, 6), vdims=['Density'])
         self.assertEqual(kde, img)
+
+    def test_univariate_kde_binned(self):
+        np.random.seed(1)
+        dist = Distribution(np.random.randn(1000))
+        kde = univariate_kde(dist, n_samples=50)
+        binned = univariate_kde(dist, n_samples=50, estimator='binned')
+        self.assertEqual(binned.dimension_values(0), kde.dimension_values(0))
+        ys, binned_ys = kde.dimension_values(1), binned.dimension_values(1)
+        self.assertTrue(np.abs(ys-binned_ys).max() < ys.max()*0.01)
+
+    def test_univariate_kde_binned_outlier(self):
+        np.random.seed(1)
+        dist = Distribution(np.r_[np.random.randn(200000), 1e4])
+        kde = univariate_kde(dist)
+        binned = univariate_kde(dist, estimator='binned')
+        ys, binned_ys = kde.dimension_values(1), binned.dimension_values(1)
+        self.assertTrue(np.abs(ys-binned_ys).max() < ys.max()*0.01)
+
+    def test_univariate_kde_binned_large_sample_not_evaluated_directly(self):
+        np.random.seed(1)
+        dist = Distribution(np.random.randn(10**6))
+        def direct_kde(*args):
+            raise AssertionError('Binned KDE evaluated directly')
+        original = stats._direct_kde
+        stats._direct_kde = direct_kde
+        try:
+            kde = univariate_kde(dist, estimator='binned')
+        finally:
+            stats._direct_kde = original
+        xs, ys = kde.dimension_values(0), kde.dimension_values(1)
+        expected = np.exp(-0.5*xs**2)/np.sqrt(2*np.pi)
+        self.assertTrue(np.abs(ys-expected).max() < 0.01)
+
+    def test_univariate_kde_binned_bandwidth(self):
+        kde = univariate_kde(self.dist, n_samples=5, bin_range=(0, 4), bandwidth=0.5)
+        binned = univariate_kde(self.dist, n_samples=5, bin_range=(0, 4), bandwidth=0.5,
+                                estimator='binned')
+        self.assertEqual(binned.dimension_values(0), np.arange(5))
+        ys, binned_ys = kde.dimension_values(1), binned.dimension_values(1)
+        self.assertTrue(np.abs(ys-binned_ys).max() < ys.max()*0.01)
+
+    def test_univariate_kde_binned_flat_distribution(self):
+        dist = Distribution([1, 1, 1])
+        kde = univariate_kde(dist, n_samples=5, bin_range=(0, 4), estimator='binned')
+        area = Area([], 'Value', ('Value_density', 'Density'))
+        self.assertEqual(kde, area)
+
+    def test_univariate_kde_binned_nans(self):
+        kde = univariate_kde(self.dist_nans, n_samples=5, bin_range=(0, 4), estimator='binned')
+        area = Area((np.arange(5), np.zeros(5)), 'Value', ('Value_density', 'Density'))
+        self.assertEqual(kde, area)
+
+    def test_bivariate_kde_binned(self):
+        np.random.seed(1)
+        xs = np.random.randn(1000)
+        bivariate = Bivariate((xs, xs*0.5+np.random.randn(1000)*0.5))
+        kde = bivariate_kde(bivariate, n_samples=20, contours=False)
+        binned = bivariate_kde(bivariate, n_samples=20, contours=False, estimator='binned')
+        self.assertEqual(binned.bounds.lbrt(), kde.bounds.lbrt())
+        density, binned_density = kde.dimension_values(2), binned.dimension_values(2)
+        self.assertTrue(np.abs(density-binned_density).max() < density.max()*0.02)
+
+    def test_bivariate_kde_binned_outlier(self):
+        np.random.seed(1)
+        xs, ys = np.random.randn(2, 5000)
+        bivariate = Bivariate((np.r_[xs, 1e3], np.r_[ys, 1e3]))
+        kde = bivariate_kde(bivariate, n_samples=20, contours=False)
+        binned = bivariate_kde(bivariate, n_samples=20, contours=False, estimator='binned')
+        density, binned_density = kde.dimension_values(2), binned.dimension_values(2)
+        self.assertTrue(np.abs(density-binned_density).max() < density.max()*0.02)
+
+    def test_bivariate_kde_binned_nans(self):
+        kde = bivariate_kde(self.bivariate_nans, n_samples=2, x_range=(0, 4),
+                            y_range=(0, 4), contours=False, estimator='binned')
+        img = Image(np.zeros((2, 2)), bounds=(-2, -2, 6, 6), vdims=['Density'])
+        self.assertEqual(kde, img)
@@ -456,6 +456,71 @@ class TestServerCallbacks(CallbackTestCase):
         self.assertEqual(resolved, {'id': cds.ref['id'],
                                     'value': points.columns()})
 
+    def test_server_callback_records_update_latency(self):
+        dmap = DynamicMap(lambda x, y: Points([(x, y)]), kdims=[], streams=[PointerXY()])
+        plot = bokeh_server_renderer.get_plot(dmap)
+        callback = plot.callbacks[0]
+        self.assertEqual(callback.latencies, [])
+        self.assertEqual(callback.throttle_timeout, 50)
+        callback.on_msg({"x": 0.3, "y": 0.2})
+        self.assertEqual(len(callback.latencies), 1)
+        self.assertTrue(callback.latencies[0] >= 0)
+
+    def test_server_callback_throttle_timeout_adapts_to_latency(self):
+        points = Points([1, 2, 3])
+        RangeXY(source=points)
+        plot = bokeh_server_renderer.get_plot(points)
+        callback = plot.callbacks[0]
+        callback._latencies.extend([1, 2, 3])
+        self.assertEqual(callback.throttle_timeout, 20)
+        callback._latencies.extend([400, 500, 600, 700])
+        self.assertEqual(callback.throttle_timeout, 400)
+        callback._latencies.extend([5000]*10)
+        self.assertEqual(callback.throttle_timeout, 1000)
+
+    def test_server_callback_first_event_after_idle_uses_default_timeout(self):
+        import holoviews.plotting.bokeh.callbacks as callbacks
+        points = Points([1, 2, 3])
+        RangeXY(source=points)
+        plot = bokeh_server_renderer.get_plot(points)
+        callback = plot.callbacks[0]
+        callback._latencies.extend([400, 500, 600])
+        periods = []
+        class PeriodicCallback(object):
+            def __init__(self, callback, period, count):
+                periods.append(period)
+            def start(self):
+                pass
+        original = callbacks.PeriodicCallback
+        callbacks.PeriodicCallback = PeriodicCallback
+        try:
+            callback.on_change('start', 0, 1)
+            callback.on_change('start', 1, 2)
+            callback.on_msg = lambda msg: None
+            callback.process_on_change()
+        finally:
+            callbacks.PeriodicCallback = original
+        self.assertEqual(periods, [50, 500])
+
+    def test_server_callback_keeps_events_queued_while_computing(self):
+        points = Points([1, 2, 3])
+        RangeXY(source=points)
+        plot = bokeh_server_renderer.get_plot(points)
+        callback = plot.callbacks[0]
+        scheduled, msgs = [], []
+        callback._schedule = scheduled.append
+        callback.on_msg = msgs.append
+        callback._queue = [('start', 0, 1), ('start', 1, 2)]
+        callback._computing = True
+        callback.process_on_change()
+        self.assertEqual(len(callback._queue), 2)
+        self.assertEqual(msgs, [])
+        self.assertEqual(scheduled, [callback.process_on_change])
+        callback._computing = False
+        callback.process_on_change()
+        self.assertEqual(callback._queue, [])
+        self.assertEqual(len(msgs), 1)
+
 
 
 
@@ -9,7 +9,7 @@ from holoviews.streams import PolyDraw
 from .testplot import TestBokehPlot, bokeh_renderer
 
 try:
-    from bokeh.models import LinearColorMapper, CategoricalColorMapper
+    from bokeh.models import LinearColorMapper, CategoricalColorMapper, MultiLine, Segment
 except:
     pass
 
@@ -66,8 +66,10 @@ class TestPathPlot(TestBokehPlot):
         plot = bokeh_renderer.get_plot(path)
         source = plot.handles['source']
 
-        self.assertEqual(source.data['xs'], [np.array([1, 2]), np.array([2, 3]), np.array([3, 4])])
-        self.assertEqual(source.data['ys'], [np.array([4, 3]), np.array([3, 2]), np.array([2, 1])])
+        self.assertEqual(source.data['x0'], np.array([1, 2, 3]))
+        self.assertEqual(source.data['x1'], np.array([2, 3, 4]))
+        self.assertEqual(source.data['y0'], np.array([4, 3, 2]))
+        self.assertEqual(source.data['y1'], np.array([3, 2, 1]))
         self.assertEqual(source.data['other'], np.array(['A', 'B', 'C']))
         self.assertEqual(source.data['color'], np.array([0, 0.25, 0.5]))
 
@@ -85,8 +87,10 @@ class TestPathPlot(TestBokehPlot):
         source = plot.handles['source']
         cmapper = plot.handles['color_mapper']
 
-        self.assertEqual(source.data['xs'], [np.array([1, 2]), np.array([2, 3]), np.array([3, 4])])
-        self.assertEqual(source.data['ys'], [np.array([4, 3]), np.array([3, 2]), np.array([2, 1])])
+        self.assertEqual(source.data['x0'], np.array([1, 2, 3]))
+        self.assertEqual(source.data['x1'], np.array([2, 3, 4]))
+        self.assertEqual(source.data['y0'], np.array([4, 3, 2]))
+        self.assertEqual(source.data['y1'], np.array([3, 2, 1]))
         self.assertEqual(source.data['color'], np.array([998, 999, 998]))
         self.assertEqual(source.data['date_dt_strings'],
                          np.array(['2018-08-01 00:00:00', '2018-08-01 00:00:00', '2018-08-01 00:00:00']))
@@ -108,8 +112,10 @@ class TestPathPlot(TestBokehPlot):
         source = plot.handles['source']
         cmapper = plot.handles['color_color_mapper']
 
-        self.assertEqual(source.data['xs'], [np.array([1, 2]), np.array([2, 3]), np.array([3, 4])])
-        self.assertEqual(source.data['ys'], [np.array([4, 3]), np.array([3, 2]), np.array([2, 1])])
+        self.assertEqual(source.data['x0'], np.array([1, 2, 3]))
+        self.assertEqual(source.data['x1'], np.array([2, 3, 4]))
+        self.assertEqual(source.data['y0'], np.array([4, 3, 2]))
+        self.assertEqual(source.data['y1'], np.array([3, 2, 1]))
         self.assertEqual(source.data['color'], np.array([998, 999, 998]))
         self.assertEqual(source.data['date_dt_strings'],
                          np.array(['2018-08-01 00:00:00', '2018-08-01 00:00:00', '2018-08-01 00:00:00']))
@@ -125,8 +131,10 @@ class TestPathPlot(TestBokehPlot):
         path = Path([data], vdims='alpha').options(alpha='alpha')
         plot = bokeh_renderer.get_plot(path)
         source = plot.handles['source']
-        self.assertEqual(source.data['xs'], [np.array([1, 2]), np.array([2, 3]), np.array([3, 4])])
-        self.assertEqual(source.data['ys'], [np.array([4, 3]), np.array([3, 2]), np.array([2, 1])])
+        self.assertEqual(source.data['x0'], np.array([1, 2, 3]))
+        self.assertEqual(source.data['x1'], np.array([2, 3, 4]))
+        self.assertEqual(source.data['y0'], np.array([4, 3, 2]))
+        self.assertEqual(source.data['y1'], np.array([3, 2, 1]))
         self.assertEqual(source.data['alpha'], np.array([0.1, 0.7, 0.3]))
 
     def test_path_continuously_varying_line_width_op(self):
@@ -137,10 +145,46 @@ class TestPathPlot(TestBokehPlot):
         path = Path([data], vdims='line_width').options(line_width='line_width')
         plot = bokeh_renderer.get_plot(path)
         source = plot.handles['source']
-        self.assertEqual(source.data['xs'], [np.array([1, 2]), np.array([2, 3]), np.array([3, 4])])
-        self.assertEqual(source.data['ys'], [np.array([4, 3]), np.array([3, 2]), np.array([2, 1])])
+        self.assertEqual(source.data['x0'], np.array([1, 2, 3]))
+        self.assertEqual(source.data['x1'], np.array([2, 3, 4]))
+        self.assertEqual(source.data['y0'], np.array([4, 3, 2]))
+        self.assertEqual(source.data['y1'], np.array([3, 2, 1]))
         self.assertEqual(source.data['line_width'], np.array([1, 7, 3]))
 
+    def test_path_colored_segment_glyph(self):
+        path = Path([{'x': [1, 2, 3], 'y': [3, 2, 1], 'c': [0, 1, 2]},
+                     {'x': [4, 5], 'y': [0, 1], 'c': [3, 4]}],
+                    vdims='c').opts(color='c')
+        plot = bokeh_renderer.get_plot(path)
+        source = plot.handles['source']
+        self.assertIsInstance(plot.handles['glyph'], Segment)
+        self.assertEqual(source.data['x0'], np.array([1, 2, 4]))
+        self.assertEqual(source.data['x1'], np.array([2, 3, 5]))
+        self.assertEqual(source.data['color'], np.array([0, 1, 3]))
+
+    def test_path_colored_segment_glyph_invert_axes(self):
+        path = Path([{'x': [1, 2, 3], 'y': [3, 2, 1], 'c': [0, 1, 2]}],
+                    vdims='c').opts(color='c', invert_axes=True)
+        plot = bokeh_renderer.get_plot(path)
+        source = plot.handles['source']
+        self.assertEqual(source.data['x0'], np.array([3, 2]))
+        self.assertEqual(source.data['y1'], np.array([2, 3]))
+
+    def test_path_uncolored_multi_line_glyph(self):
+        path = Path([[(0, 1), (1, 2), (2, 3)]])
+        plot = bokeh_renderer.get_plot(path)
+        self.assertIsInstance(plot.handles['glyph'], MultiLine)
+
+    def test_path_colored_segment_glyph_update(self):
+        hmap = HoloMap({i: Path([{'x': [0, 1, 2], 'y': [0, i, 0], 'c': [0, i, 2]}],
+                                vdims='c').opts(color='c')
+                        for i in range(1, 3)})
+        plot = bokeh_renderer.get_plot(hmap)
+        plot.update((2,))
+        source = plot.handles['source']
+        self.assertEqual(source.data['y1'], np.array([2, 0]))
+        self.assertEqual(source.data['color'], np.array([0, 2]))
+
     def test_path_continuously_varying_color_legend(self):
         data = {
             "x": [1,2,3,4,5,6,7,8,9],
@@ -3,10 +3,11 @@ from unittest import SkipTest
 
 import numpy as np
 
-from holoviews.core import NdOverlay
+from holoviews.core import NdOverlay, DynamicMap
 from holoviews.core.options import Cycle
 from holoviews.core.util import pd
 from holoviews.element import Points
+from holoviews.streams import Stream
 
 from .testplot import TestBokehPlot, bokeh_renderer
 from ..utils import ParamLogStream
@@ -20,6 +21,60 @@ except:
 
 class TestPointPlot(TestBokehPlot):
 
+    def test_points_update_sends_only_changed_columns(self):
+        xs, ys = np.arange(100.), np.arange(100.)
+        stream = Stream.define('Scale', scale=1)()
+        dmap = DynamicMap(lambda scale: Points((xs, ys, xs*scale), vdims='c'),
+                          streams=[stream]).opts(color='c')
+        plot = bokeh_renderer.get_plot(dmap)
+        source = plot.handles['source']
+        x, y = source.data['x'], source.data['y']
+        events = []
+        source.on_change('data', lambda attr, old, new: events.append(attr))
+        stream.event(scale=2)
+        self.assertIs(source.data['x'], x)
+        self.assertIs(source.data['y'], y)
+        self.assertEqual(source.data['color'], xs*2)
+        self.assertEqual(len(events), 1)
+
+    def test_points_update_patches_sparse_changes(self):
+        ys = np.arange(100.)
+        stream = Stream.define('Value', value=0.)()
+        def callback(value):
+            new = ys.copy()
+            new[10] = value
+            return Points((np.arange(100.), new))
+        dmap = DynamicMap(callback, streams=[stream])
+        plot = bokeh_renderer.get_plot(dmap)
+        source = plot.handles['source']
+        initial = source.data['y']
+        patches = []
+        source.on_change('data', lambda attr, old, new: patches.append(new))
+        stream.event(value=-1.)
+        self.assertEqual(source.data['y'][10], -1.)
+        self.assertEqual(initial[10], 0.)
+        self.assertEqual(len(patches), 1)
+        column = source.data['y']
+        stream.event(value=-2.)
+        self.assertIs(source.data['y'], column)
+        self.assertEqual(source.data['y'][10], -2.)
+        self.assertEqual(len(patches), 2)
+
+    def test_points_inplace_update_resent(self):
+        ys = np.arange(100.)
+        stream = Stream.define('Value', value=0.)()
+        def callback(value):
+            ys[10] = value
+            return Points({'x': np.arange(100.), 'y': ys}, datatype=['dictionary'])
+        dmap = DynamicMap(callback, streams=[stream])
+        plot = bokeh_renderer.get_plot(dmap)
+        source = plot.handles['source']
+        events = []
+        source.on_change('data', lambda attr, old, new: events.append(attr))
+        stream.event(value=-1.)
+        self.assertEqual(source.data['y'][10], -1.)
+        self.assertEqual(len(events), 1)
+
     def test_points_colormapping(self):
         points = Points(np.random.rand(10, 4), vdims=['a', 'b']).opts(plot=dict(color_index=3))
         self._test_colormapping(points, 3)
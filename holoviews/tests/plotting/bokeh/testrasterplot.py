@@ -1,6 +1,8 @@
 import numpy as np
 
+from holoviews.core import DynamicMap
 from holoviews.element import Raster, Image, RGB
+from holoviews.streams import Stream
 
 from .testplot import TestBokehPlot, bokeh_renderer
 
@@ -94,3 +96,80 @@ class TestRasterPlot(TestBokehPlot):
         self.assertEqual(cdata['y'], [0.5])
         self.assertEqual(cdata['dh'], [1.0])
         self.assertEqual(cdata['dw'], [1.0])
+
+    def test_rgb_packed_rgba(self):
+        arr = np.random.randint(0, 256, (3, 4, 3)).astype('uint8')
+        plot = bokeh_renderer.get_plot(RGB(arr))
+        img = plot.handles['source'].data['image'][0]
+        self.assertEqual(img.dtype, np.dtype('uint32'))
+        self.assertTrue(img.flags['C_CONTIGUOUS'])
+        rgba = img.view(np.uint8).reshape((3, 4, 4))
+        self.assertEqual(rgba[..., :3], arr[::-1])
+        self.assertEqual(rgba[..., 3], np.full((3, 4), 255, dtype='uint8'))
+
+    def test_image_dtype_float32(self):
+        arr = np.random.rand(10, 10)
+        img = Image(arr).opts(image_dtype='float32', invert_xaxis=True)
+        plot = bokeh_renderer.get_plot(img)
+        data = plot.handles['source'].data['image'][0]
+        self.assertEqual(data.dtype, np.dtype('float32'))
+        self.assertTrue(data.flags['C_CONTIGUOUS'])
+        self.assertEqual(data, arr[::-1, ::-1].astype('float32'))
+
+    def test_image_dtype_uint8_quantized(self):
+        arr = np.array([[0, 0.5, np.nan], [1, 0.25, 0.75]])
+        img = Image(arr).opts(image_dtype='uint8')
+        plot = bokeh_renderer.get_plot(img)
+        data = plot.handles['source'].data['image'][0]
+        cmapper = plot.handles['color_mapper']
+        qmapper = plot.handles['quantized_mapper']
+        self.assertEqual(data.dtype, np.dtype('uint8'))
+        self.assertEqual(data, np.array([[254, 64, 191], [1, 128, 0]], dtype='uint8'))
+        self.assertEqual((cmapper.low, cmapper.high), (0, 1))
+        self.assertEqual((qmapper.low, qmapper.high), (0.5, 254.5))
+        self.assertEqual(qmapper.low_color, cmapper.nan_color)
+        self.assertIs(plot.handles['glyph'].color_mapper, qmapper)
+
+    def test_image_dtype_uint16_clipping_colors(self):
+        arr = np.array([[-1, 0.5], [2, 0]])
+        img = Image(arr).opts(image_dtype='uint16', clim=(0, 1),
+                              clipping_colors={'min': 'red', 'max': 'blue'})
+        plot = bokeh_renderer.get_plot(img)
+        data = plot.handles['source'].data['image'][0]
+        qmapper = plot.handles['quantized_mapper']
+        self.assertEqual(data.dtype, np.dtype('uint16'))
+        self.assertEqual(data, np.array([[65535, 1], [0, 32768]], dtype='uint16'))
+        self.assertEqual(qmapper.low_color, 'red')
+        self.assertEqual(qmapper.high_color, 'blue')
+
+    def test_image_dtype_uint8_hover_falls_back_to_float32(self):
+        arr = np.random.rand(10, 10)
+        img = Image(arr).opts(image_dtype='uint8', tools=['hover'])
+        plot = bokeh_renderer.get_plot(img)
+        data = plot.handles['source'].data['image'][0]
+        self.assertEqual(data.dtype, np.dtype('float32'))
+        self.assertIs(plot.handles['glyph'].color_mapper, plot.handles['color_mapper'])
+
+    def test_image_unchanged_array_not_resent(self):
+        img = Image(np.random.rand(10, 10)).opts(image_dtype='uint8')
+        stream = Stream.define('Trigger', value=0)()
+        dmap = DynamicMap(lambda value: img, streams=[stream])
+        plot = bokeh_renderer.get_plot(dmap)
+        source = plot.handles['source']
+        data = source.data['image'][0]
+        events = []
+        source.on_change('data', lambda attr, old, new: events.append(attr))
+        stream.event(value=1)
+        self.assertIs(source.data['image'][0], data)
+        self.assertEqual(events, [])
+
+    def test_image_inplace_update_resent(self):
+        arr = np.random.rand(10, 10)
+        stream = Stream.define('Trigger', value=0)()
+        dmap = DynamicMap(lambda value: Image(arr).opts(image_dtype='float32'),
+                          streams=[stream])
+        plot = bokeh_renderer.get_plot(dmap)
+        arr[:] = 0.5
+        stream.event(value=1)
+        self.assertEqual(plot.handles['source'].data['image'][0],
+                         np.full((10, 10), 0.5))
@@ -7,7 +7,8 @@ from unittest import SkipTest
 import numpy as np
 import param
 
-from holoviews import DynamicMap, HoloMap, Image, GridSpace, Table, Curve, Store
+from holoviews import (DynamicMap, HoloMap, Image, GridSpace, Table, Curve,
+                       Dataset, Store)
 from holoviews.streams import Stream
 from holoviews.plotting import Renderer
 from holoviews.element.comparison import ComparisonTestCase
@@ -118,6 +119,12 @@ class BokehRendererTest(ComparisonTestCase):
         self.assertIs(obj.renderer, self.renderer)
         self.assertEqual(obj.backend, 'bokeh')
 
+    def test_render_lazy_groupby_subset_builds_selected_groups(self):
+        ds = Dataset((np.arange(20)%5, np.arange(20), np.arange(20)), ['g', 'x'], 'y')
+        grouped = ds.groupby('g', group_type=Curve, lazy=True)
+        self.renderer.get_plot(grouped[[1, 3]])
+        self.assertEqual(grouped.data.built(), [(1,), (3,)])
+
     def test_render_holomap_individual(self):
         hmap = HoloMap({i: Curve([1, 2, i]) for i in range(5)})
         obj, _ = self.renderer._validate(hmap, None)
@@ -6,14 +6,18 @@ from threading import Event
 
 import param
 
+from holoviews.core import Dimension
 from holoviews.core.spaces import DynamicMap
+from holoviews.core.operation import Operation
 from holoviews.core.options import Store
 from holoviews.element import Curve, Polygons, Path, HLine
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.plotting import Renderer
-from holoviews.streams import Stream, RangeXY, PlotReset
+from holoviews.streams import Stream, RangeXY, PlotReset, PlotSize, PointerX
 
 try:
+    from concurrent.futures import Future
+
     from bokeh.application.handlers import FunctionHandler
     from bokeh.application import Application
     from bokeh.client import pull_session
@@ -23,7 +27,8 @@ try:
     from bokeh.server.server import Server
 
     from holoviews.plotting.bokeh.callbacks import (
-        Callback, RangeXYCallback, ResetCallback
+        Callback, PlotSizeCallback, RangeXYCallback, ResetCallback, ServerCallback,
+        threaded_operation
     )
     from holoviews.plotting.bokeh.renderer import BokehRenderer
     from panel.widgets import DiscreteSlider, FloatSlider
@@ -96,6 +101,41 @@ class TestBokehServerSetup(ComparisonTestCase):
         self.assertIn(cb.on_event, plot._event_callbacks['reset'])
 
 
+class _DeferredExecutor(object):
+    """
+    Executor which only runs the submitted jobs when requested.
+    """
+
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, fn, *args):
+        future = Future()
+        self.jobs.append((fn, args, future))
+        return future
+
+    def run(self):
+        fn, args, future = self.jobs.pop(0)
+        future.set_result(fn(*args))
+
+
+class threaded_ranges(Operation):
+
+    threads = []
+
+    threaded = param.Boolean(default=True)
+
+    x_range = param.Tuple(default=None, length=2)
+
+    y_range = param.Tuple(default=None, length=2)
+
+    streams = param.List(default=[RangeXY])
+
+    def _process(self, element, key=None):
+        self.threads.append(threading.current_thread().ident)
+        x0, x1 = self.p.x_range or (0, 1)
+        return element.clone([(x0, 0), (x1, 1)])
+
 
 class TestBokehServerRun(ComparisonTestCase):
 
@@ -253,3 +293,98 @@ class TestBokehServerRun(ComparisonTestCase):
         time.sleep(1)
         cds = self.session.document.roots[0].select_one({'type': ColumnDataSource})
         self.assertEqual(cds.data['y'][0], 3)
+
+    def test_threaded_operation_detection(self):
+        self.assertTrue(threaded_operation(threaded_ranges(Curve([]))))
+        self.assertFalse(threaded_operation(threaded_ranges(Curve([]), threaded=False)))
+        self.assertFalse(threaded_operation(DynamicMap(lambda: Curve([]))))
+
+    def test_threaded_callbacks_serialized_per_plot(self):
+        executor = _DeferredExecutor()
+        inner = DynamicMap(lambda **kwargs: Curve([]), streams=[PlotSize()])
+        plot = bokeh_renderer.get_plot(threaded_ranges(inner))
+        plot.document.add_next_tick_callback = lambda callback: callback()
+        [range_cb] = [cb for cb in plot.callbacks if isinstance(cb, RangeXYCallback)]
+        [size_cb] = [cb for cb in plot.callbacks if isinstance(cb, PlotSizeCallback)]
+        previous, ServerCallback._executor = ServerCallback._executor, executor
+        try:
+            range_cb._pending = {'x0': 2, 'x1': 3, 'y0': 0, 'y1': 1}
+            range_cb._compute_threaded()
+            size_cb._pending = {'width': 400, 'height': 300}
+            size_cb._compute_threaded()
+            self.assertEqual(len(executor.jobs), 1)
+            self.assertTrue(size_cb._computing)
+            executor.run()
+            self.assertFalse(range_cb._computing)
+            self.assertIs(plot._computing_callback, size_cb)
+            self.assertEqual(len(executor.jobs), 1)
+            executor.run()
+            self.assertFalse(size_cb._computing)
+            self.assertIs(plot._computing_callback, None)
+        finally:
+            ServerCallback._executor = previous
+
+    def test_threaded_precompute_serialized_per_dmap(self):
+        calls, active, overlapping = [], [], []
+        def callback(k, **kwargs):
+            calls.append(k)
+            active.append(k)
+            if len(active) > 1:
+                overlapping.append(list(active))
+            time.sleep(0.1)
+            active.remove(k)
+            return Curve([k])
+        dmap = DynamicMap(callback, kdims=[Dimension('k', range=(0, 10))],
+                          streams=[PointerX()])
+        plot1 = bokeh_renderer.get_plot(dmap)
+        plot2 = bokeh_renderer.get_plot(dmap)
+        self.assertIs(plot1.hmap, plot2.hmap)
+        plot1.current_key, plot2.current_key = (1,), (2,)
+        threads = [threading.Thread(target=plot.callbacks[0]._precompute, args=([plot],))
+                   for plot in (plot1, plot2)]
+        for thread in threads:
+            thread.start()
+        dmap[3]
+        for thread in threads:
+            thread.join()
+        self.assertEqual(overlapping, [])
+        self.assertEqual(sorted(calls[-3:]), [1, 2, 3])
+
+    def test_server_threaded_operation(self):
+        threaded_ranges.threads = []
+        dmap = threaded_ranges(Curve([]))
+        obj, _ = bokeh_renderer._validate(dmap, None)
+        session = self._threaded_launcher(obj)
+        [(plot, _)] = obj._plots.values()
+        [(doc, _)] = obj.layout._documents.items()
+        loop_thread = self._thread.ident
+
+        def run():
+            plot.handles['x_range'].start = 2
+            plot.handles['x_range'].end = 3
+        doc.add_next_tick_callback(run)
+        time.sleep(1)
+        cds = self.session.document.roots[0].select_one({'type': ColumnDataSource})
+        self.assertEqual(list(cds.data['x']), [2, 3])
+        self.assertNotEqual(threaded_ranges.threads[-1], loop_thread)
+
+    def test_server_threaded_operation_coalesces_events(self):
+        threaded_ranges.threads = []
+        dmap = threaded_ranges(Curve([]))
+        obj, _ = bokeh_renderer._validate(dmap, None)
+        session = self._threaded_launcher(obj)
+        [(plot, _)] = obj._plots.values()
+        [(doc, _)] = obj.layout._documents.items()
+        [cb] = [cb for cb in plot.callbacks if isinstance(cb, RangeXYCallback)]
+        ncalls = len(threaded_ranges.threads)
+
+        def run():
+            for i in range(10):
+                plot.handles['x_range'].start = i
+                plot.handles['x_range'].end = i+1
+                cb.on_msg({'x0': i, 'x1': i+1, 'y0': 0, 'y1': 1})
+        doc.add_next_tick_callback(run)
+        time.sleep(1)
+        cds = self.session.document.roots[0].select_one({'type': ColumnDataSource})
+        self.assertEqual(list(cds.data['x']), [9, 10])
+        self.assertLess(len(threaded_ranges.threads)-ncalls, 5)
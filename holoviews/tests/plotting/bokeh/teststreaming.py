@@ -38,3 +38,21 @@ class TestBufferStreamPlot(TestBokehPlot):
         self.assertEqual(x_range.end, 2)
         self.assertEqual(y_range.start, -1)
         self.assertEqual(y_range.end, 1)
+
+    def test_buffer_stream_incremental_ranges(self):
+        stream = Buffer(data={'x': np.array([0, 1]), 'y': np.array([0, 5])}, length=3)
+        dmap = DynamicMap(Curve, streams=[stream])
+        plot = bokeh_renderer.get_plot(dmap)
+        stream.send({'x': np.array([2]), 'y': np.array([-2])})
+        self.assertEqual(plot.ranges[('Curve',)]['y']['data'], (-2, 5))
+        self.assertEqual(plot._stream_ranges[(id(stream), 'y')], (1, (-2, 5)))
+
+    def test_buffer_stream_incremental_ranges_rescan_on_eviction(self):
+        stream = Buffer(data={'x': np.array([0, 1, 2]), 'y': np.array([5, 1, 2])}, length=3)
+        dmap = DynamicMap(Curve, streams=[stream])
+        plot = bokeh_renderer.get_plot(dmap)
+        stream.send({'x': np.array([3]), 'y': np.array([3])})
+        self.assertEqual(plot.ranges[('Curve',)]['y']['data'], (1, 3))
+        y_range = plot.handles['y_range']
+        self.assertEqual(y_range.start, 1)
+        self.assertEqual(y_range.end, 3)
@@ -1,9 +1,14 @@
 from unittest import SkipTest
+
+import numpy as np
+
 from holoviews.core import Store
 from holoviews.element.comparison import ComparisonTestCase
 
 try:
-    from holoviews.plotting.bokeh.util import filter_batched_data, glyph_order
+    from holoviews.plotting.bokeh.util import (
+        filter_batched_data, glyph_order, cds_column_diff, cds_column_fingerprint
+    )
     from holoviews.plotting.bokeh.styles import expand_batched_style
     bokeh_renderer = Store.renderers['bokeh']
 except:
@@ -81,3 +86,106 @@ class TestBokehUtilsInstantiation(ComparisonTestCase):
         order = glyph_order(['scatter_1', 'patch_1', 'rect_1'],
                             ['scatter', 'patch'])
         self.assertEqual(order, ['scatter_1', 'patch_1', 'rect_1'])
+
+    def test_cds_column_diff_unchanged(self):
+        current = {'x': np.arange(5), 'y': np.array([1., np.NaN, 3, 4, 5])}
+        data = {'x': np.arange(5), 'y': np.array([1., np.NaN, 3, 4, 5])}
+        self.assertEqual(cds_column_diff(current, data), ('update', {}))
+
+    def test_cds_column_diff_changed_column(self):
+        current = {'x': np.arange(5), 'color': np.arange(5.)}
+        data = {'x': current['x'], 'color': np.arange(5.)[::-1]}
+        update, changes = cds_column_diff(current, data)
+        self.assertEqual(update, 'update')
+        self.assertEqual(list(changes), ['color'])
+        self.assertIs(changes['color'], data['color'])
+
+    def test_cds_column_diff_patch(self):
+        current = {'x': np.arange(20), 'y': np.arange(20.)}
+        y = np.arange(20.)
+        y[3] = -1
+        data = {'x': np.arange(20), 'y': y}
+        self.assertEqual(cds_column_diff(current, data), ('patch', {'y': [(3, -1.0)]}))
+
+    def test_cds_column_diff_patch_nan_not_patched(self):
+        current = {'y': np.arange(20.)}
+        y = np.arange(20.)
+        y[3] = np.NaN
+        update, changes = cds_column_diff(current, {'y': y})
+        self.assertEqual(update, 'update')
+        self.assertEqual(list(changes), ['y'])
+
+    def test_cds_column_diff_stream(self):
+        current = {'x': np.arange(3), 'y': np.arange(3.)}
+        data = {'x': np.arange(5), 'y': np.arange(5.)}
+        update, changes = cds_column_diff(current, data)
+        self.assertEqual(update, 'stream')
+        self.assertEqual(changes['x'], np.array([3, 4]))
+        self.assertEqual(changes['y'], np.array([3., 4.]))
+
+    def test_cds_column_diff_modified_prefix_not_streamed(self):
+        current = {'x': np.arange(3)}
+        data = {'x': np.array([1, 1, 2, 3, 4])}
+        update, changes = cds_column_diff(current, data)
+        self.assertEqual(update, 'update')
+        self.assertIs(changes['x'], data['x'])
+
+    def test_cds_column_diff_inplace_modified_column(self):
+        y = np.arange(20.)
+        current = {'y': y}
+        fingerprints = {'y': cds_column_fingerprint(y)}
+        y[3] = -1
+        self.assertEqual(cds_column_diff(current, {'y': y}, fingerprints),
+                         ('update', {'y': y}))
+        self.assertEqual(fingerprints, {'y': cds_column_fingerprint(y)})
+
+    def test_cds_column_diff_sent_column_modified_copy_not_patched(self):
+        y = np.arange(20.)
+        current = {'y': y}
+        fingerprints = {'y': cds_column_fingerprint(y)}
+        y[3] = -1
+        update, changes = cds_column_diff(current, {'y': y.copy()}, fingerprints)
+        self.assertEqual(update, 'update')
+        self.assertEqual(changes['y'], y)
+
+    def test_cds_column_diff_fingerprints_each_column_once(self):
+        from holoviews.plotting.bokeh import util
+        current = {'x': np.arange(3), 'y': np.arange(3.)}
+        fingerprints = {k: cds_column_fingerprint(v) for k, v in current.items()}
+        data = {'x': np.array([1, 1, 2, 3, 4]), 'y': np.arange(5.)}
+        calls = []
+        def counted(column):
+            calls.append(column)
+            return cds_column_fingerprint(column)
+        util.cds_column_fingerprint = counted
+        try:
+            update, _ = cds_column_diff(current, data, fingerprints)
+        finally:
+            util.cds_column_fingerprint = cds_column_fingerprint
+        self.assertEqual(update, 'update')
+        self.assertEqual(len(calls), 4)
+
+    def test_cds_column_diff_owned_columns_not_fingerprinted(self):
+        from holoviews.plotting.bokeh import util
+        current = {'x': np.arange(20), 'y': np.arange(20.)}
+        fingerprints = {k: cds_column_fingerprint(v) for k, v in current.items()}
+        y = np.arange(20.)
+        y[3] = -1
+        data = {'x': current['x'], 'y': y}
+        calls = []
+        def counted(column):
+            calls.append(column)
+            return cds_column_fingerprint(column)
+        util.cds_column_fingerprint = counted
+        try:
+            result = cds_column_diff(current, data, fingerprints, owned=['y'])
+        finally:
+            util.cds_column_fingerprint = cds_column_fingerprint
+        self.assertEqual(result, ('patch', {'y': [(3, -1.0)]}))
+        self.assertEqual(len(calls), 2)
+
+    def test_cds_column_diff_list_of_same_arrays(self):
+        img = np.random.rand(5, 5)
+        current = {'image': [img], 'x': [0]}
+        data = {'image': [img], 'x': [1]}
+        self.assertEqual(cds_column_diff(current, data), ('update', {'x': [1]}))
@@ -94,6 +94,32 @@ class TestBokehViolinPlot(TestBokehPlot):
         plot = bokeh_renderer.get_plot(violin)
         self.assertEqual(plot.handles['x_range'].factors, ['0', '1'])
 
+    def test_violin_binned_estimator(self):
+        np.random.seed(1)
+        violin = Violin((np.repeat(np.arange(3), 100), np.random.randn(300)), 'x', 'y')
+        plot = bokeh_renderer.get_plot(violin.opts(estimator='binned'))
+        groups = violin.groupby('x').data.values()
+        kdes = plot._binned_kdes(violin, groups, None, bandwidth=None, cut=5)
+        for group, (kde, _) in zip(groups, kdes):
+            expected = univariate_kde(group, cut=5)
+            self.assertEqual(kde.dimension_values(0), expected.dimension_values(0))
+            ys, binned_ys = expected.dimension_values(1), kde.dimension_values(1)
+            self.assertTrue(np.abs(ys-binned_ys).max() < ys.max()*0.01)
+        self.assertEqual(len(plot.handles['patches_1_source'].data['xs']), 3)
+
+    def test_violin_binned_estimator_split(self):
+        a = np.repeat(np.arange(2), 5)
+        violin = Violin((a, np.arange(10)), ['a'], 'd').options(split='a', estimator='binned')
+        plot = bokeh_renderer.get_plot(violin)
+        source = plot.handles['patches_1_source']
+        self.assertEqual(source.data["dim('a')"], ['0', '1'])
+
+    def test_violin_binned_estimator_empty(self):
+        violin = Violin([]).opts(estimator='binned')
+        plot = bokeh_renderer.get_plot(violin)
+        patch_source = plot.handles['patches_1_source']
+        self.assertEqual(patch_source.data['xs'], [[]])
+
     def test_violin_empty(self):
         violin = Violin([])
         plot = bokeh_renderer.get_plot(violin)
@@ -9,6 +9,7 @@ import sys
 import subprocess
 
 from collections import OrderedDict
+from io import BytesIO
 from unittest import SkipTest
 
 import numpy as np
@@ -103,6 +104,38 @@ class MPLRendererTest(ComparisonTestCase):
         data, metadata = self.renderer.components(self.map1, 'mp4')
         self.assertIn("<source src='data:video/mp4", data['text/html'])
 
+    def test_render_gif_parallel(self):
+        from PIL import Image as PILImage, ImageSequence
+        renderer = self.renderer.instance(workers=2)
+        data, _ = renderer(self.map1, 'gif')
+        serial, _ = self.renderer(self.map1, 'gif')
+        decode = lambda gif: [np.asarray(frame.convert('RGB')) for frame in
+                              ImageSequence.Iterator(PILImage.open(BytesIO(gif)))]
+        frames, serial_frames = decode(data), decode(serial)
+        self.assertEqual(len(frames), len(serial_frames))
+        for frame, serial_frame in zip(frames, serial_frames):
+            self.assertEqual(frame, serial_frame)
+
+    def test_render_mp4_parallel(self):
+        if sys.version_info.major > 2:
+            devnull = subprocess.DEVNULL
+        else:
+            devnull = open(os.devnull, 'w')
+        try:
+            subprocess.call(['ffmpeg', '-h'], stdout=devnull, stderr=devnull)
+        except:
+            raise SkipTest('ffmpeg not available, skipping mp4 export test')
+        renderer = self.renderer.instance(workers=2)
+        data, metadata = renderer.components(self.map1, 'mp4')
+        self.assertIn("<source src='data:video/mp4", data['text/html'])
+
+    def test_render_frames_parallel_key_order(self):
+        hmap = HoloMap({i: Image(np.eye(3)*i) for i in range(5)})
+        serial = self.renderer.render_frames(hmap)
+        parallel = self.renderer.render_frames(hmap, workers=2, chunksize=1)
+        self.assertEqual(len(parallel), 5)
+        self.assertEqual(parallel, serial)
+
     def test_render_static(self):
         curve = Curve([])
         obj, _ = self.renderer._validate(curve, None)
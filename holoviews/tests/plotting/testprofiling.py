@@ -0,0 +1,147 @@
+import json
+import os
+import tempfile
+
+from unittest import SkipTest
+
+import numpy as np
+
+from holoviews.core.options import Store
+from holoviews.core.spaces import DynamicMap
+from holoviews.element import Curve, Points
+from holoviews.element.comparison import ComparisonTestCase
+from holoviews.plotting.profiling import PlotProfiler, data_size, patch_size
+from holoviews.streams import Stream
+
+try:
+    from bokeh.document import Document
+    from holoviews.plotting.bokeh.chart import PointPlot
+    import holoviews.plotting.bokeh # noqa
+    bokeh_renderer = Store.renderers['bokeh']
+except:
+    bokeh_renderer = None
+
+try:
+    import holoviews.plotting.mpl # noqa
+    mpl_renderer = Store.renderers['matplotlib']
+except:
+    mpl_renderer = None
+
+
+class TestPlotProfiler(ComparisonTestCase):
+
+    def setUp(self):
+        if not bokeh_renderer:
+            raise SkipTest("Bokeh required to test plot profiling")
+
+    def _profile_update(self):
+        stream = Stream.define('Scale', scale=1)()
+        dmap = DynamicMap(lambda scale: Points(np.arange(100)*scale), streams=[stream])
+        with PlotProfiler() as profiler:
+            bokeh_renderer.get_plot(dmap)
+            stream.event(scale=2)
+        return profiler
+
+    def test_profiler_records_stages(self):
+        profiler = self._profile_update()
+        stages = {r['stage'] for r in profiler.records}
+        for stage in ['initialize_plot', 'update_frame', 'get_frame', 'compute_ranges',
+                      'lookup_options', 'get_data', 'datasource']:
+            self.assertIn(stage, stages)
+
+    def test_profiler_records_method(self):
+        profiler = self._profile_update()
+        methods = {r['method'] for r in profiler.records if r['stage'] == 'get_data'}
+        self.assertEqual(methods, {'initialize_plot', 'update_frame'})
+
+    def test_profiler_records_data_size(self):
+        profiler = self._profile_update()
+        records = [r for r in profiler.records if r['stage'] == 'get_data']
+        self.assertEqual([r['rows'] for r in records], [100, 100])
+        sent = [r for r in profiler.records if r['stage'] == 'datasource'
+                and r['method'] == 'update_frame']
+        self.assertEqual(sent[0]['rows'], 100)
+        self.assertEqual(sent[0]['bytes'], 800)
+
+    def test_profiler_records_plot_class_defined_after_start(self):
+        with PlotProfiler() as profiler:
+            class CustomPointPlot(PointPlot):
+                def get_data(self, element, ranges, style):
+                    return super(CustomPointPlot, self).get_data(element, ranges, style)
+            plot = CustomPointPlot(Points(np.arange(10)), renderer=bokeh_renderer)
+            plot.initialize_plot()
+        records = [r for r in profiler.records if r['stage'] == 'get_data']
+        self.assertEqual(len(records), 1)
+        self.assertTrue(records[0]['plot'].startswith('CustomPointPlot'))
+        self.assertEqual(records[0]['rows'], 10)
+
+    def test_profiler_document_only_records_document_plots(self):
+        plot = bokeh_renderer.get_plot(Curve([1, 2, 3]))
+        other = bokeh_renderer.get_plot(Curve([1, 2, 3]))
+        doc = plot.document = Document()
+        other.document = Document()
+        with PlotProfiler(document=doc) as profiler:
+            plot.update(0)
+            other.update(0)
+        plots = {r['plot'] for r in profiler.records}
+        self.assertEqual(plots, {'CurvePlot-%d' % id(plot)})
+
+    def test_profiler_inactive_not_recorded(self):
+        profiler = PlotProfiler()
+        bokeh_renderer.get_plot(Curve([1, 2, 3]))
+        self.assertEqual(profiler.records, [])
+
+    def test_profiler_summary(self):
+        profiler = self._profile_update()
+        summary = profiler.summary()
+        self.assertEqual(summary['update_frame']['calls'], 1)
+        durations = [s['duration'] for s in summary.values()]
+        self.assertEqual(durations, sorted(durations, reverse=True))
+
+    def test_profiler_export_trace(self):
+        profiler = self._profile_update()
+        fd, filename = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        try:
+            profiler.export(filename)
+            with open(filename) as f:
+                trace = json.load(f)
+        finally:
+            os.remove(filename)
+        events = trace['traceEvents']
+        self.assertEqual(len(events), len(profiler.records))
+        self.assertEqual({e['ph'] for e in events}, {'X'})
+        self.assertIn('bokeh', {e['cat'] for e in events})
+
+    def test_profiler_matplotlib(self):
+        if not mpl_renderer:
+            raise SkipTest("Matplotlib required to test plot profiling")
+        with PlotProfiler() as profiler:
+            mpl_renderer.get_plot(Curve([1, 2, 3]))
+        records = [r for r in profiler.records if r['stage'] == 'get_data']
+        self.assertEqual(records[0]['backend'], 'matplotlib')
+        self.assertEqual(records[0]['rows'], 3)
+
+
+class TestDataSize(ComparisonTestCase):
+
+    def test_data_size_columns(self):
+        data = {'x': np.arange(10), 'y': np.arange(10.)}
+        self.assertEqual(data_size(data), (10, 160))
+
+    def test_data_size_ragged_column(self):
+        data = {'xs': [np.arange(3), np.arange(5)], 'color': ['red', 'blue']}
+        self.assertEqual(data_size(data)[0], 2)
+        self.assertEqual(data_size(data)[1], 64+np.asarray(['red', 'blue']).nbytes)
+
+    def test_data_size_list_of_dicts(self):
+        data = [{'x': np.arange(3)}, {'x': np.arange(7)}]
+        self.assertEqual(data_size(data), (7, 80))
+
+    def test_data_size_multi_level_factors(self):
+        data = {'x': [('A', '1'), ('A', '2'), ('B', '1')]}
+        self.assertEqual(data_size(data)[0], 3)
+
+    def test_patch_size(self):
+        patches = {'x': [(1, 2.0), (5, 3.0)], 'y': [(0, np.arange(4.))]}
+        self.assertEqual(patch_size(patches), (2, 48))
@@ -1,14 +1,16 @@
 from unittest import SkipTest, skip, skipIf
 
 import holoviews as hv
+import numpy as np
 import pandas as pd
 
 from holoviews.core.util import unicode, basestring
 from holoviews.core.options import Store
 from holoviews.element import ErrorBars, Points, Rectangles, Table
 from holoviews.plotting.util import linear_gradient
-from holoviews.selection import link_selections
+from holoviews.selection import link_selections, _SelectionMaskCache
 from holoviews.streams import SelectionXY
+from holoviews.util.transform import dim
 from holoviews.element.comparison import ComparisonTestCase
 
 try:
@@ -23,6 +25,65 @@ unselected_color = "#ff0000"
 box_region_color = linear_gradient(unselected_color, "#000000", 9)[3]
 hist_region_color = linear_gradient(unselected_color, "#000000", 9)[1]
 
+class TestSelectionMaskCache(ComparisonTestCase):
+
+    def setUp(self):
+        self.data = pd.DataFrame({'x': [1, 2, 3, 4], 'y': [0, 3, 2, 1]})
+        self.dataset = hv.Dataset(self.data, ['x', 'y'])
+        self.cache = _SelectionMaskCache()
+        self.calls = []
+        def record(values):
+            self.calls.append(values)
+            return values
+        self.expr = dim('x', record) > 1
+
+    def test_mask_computed_once_across_views(self):
+        points = Points(self.dataset)
+        for ds in [self.dataset, self.dataset.clone(), points.dataset]:
+            mask = self.cache.mask(ds, self.expr)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(mask, self.data.x.values > 1)
+
+    def test_mask_recomputed_for_new_data(self):
+        self.cache.mask(self.dataset, self.expr)
+        self.cache.mask(self.dataset.clone(self.data.copy()), self.expr)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_mask_keyed_by_apply_kwargs(self):
+        self.cache.mask(self.dataset, self.expr)
+        mask = self.cache.mask(self.dataset, self.expr, keep_index=True)
+        self.assertIsInstance(mask, pd.Series)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_mask_combined_incrementally(self):
+        self.cache.mask(self.dataset, self.expr)
+        xs, ys = self.data.x.values, self.data.y.values
+        mask = self.cache.mask(self.dataset, self.expr & (dim('y') > 1))
+        self.assertEqual(mask, (xs > 1) & (ys > 1))
+        mask = self.cache.mask(self.dataset, self.expr | (dim('y') > 2))
+        self.assertEqual(mask, (xs > 1) | (ys > 2))
+        self.assertEqual(len(self.calls), 1)
+
+    def test_mask_keyed_by_array_contents(self):
+        ds = hv.Dataset(pd.DataFrame({'x': [0.100000001, 0.100000002]}), 'x')
+        mask1 = self.cache.mask(ds, dim('x').isin(np.array([0.100000001])))
+        mask2 = self.cache.mask(ds, dim('x').isin(np.array([0.100000002])))
+        self.assertEqual(mask1, np.array([True, False]))
+        self.assertEqual(mask2, np.array([False, True]))
+
+    def test_data_not_kept_alive(self):
+        import gc, weakref
+        for datatype in ['dataframe', 'dictionary']:
+            dataset = hv.Dataset(self.data.copy(), ['x', 'y'], datatype=[datatype])
+            self.cache.mask(dataset, self.expr)
+            ref = weakref.ref(dataset)
+            del dataset
+            gc.collect()
+            self.assertIs(ref(), None)
+            self.cache.mask(self.dataset, self.expr)
+            self.assertEqual(len(self.cache._datasets), 1)
+
+
 class TestLinkSelections(ComparisonTestCase):
 
     def setUp(self):
@@ -581,6 +581,63 @@ class TestSubscribers(ComparisonTestCase):
         # and the callback
         self.assertEqual(subscriber.call_count, 3)
 
+    def test_batch_subscriber_precedence(self):
+        calls = []
+        positionX = PointerX()
+        positionY = PointerY()
+        positionX.add_subscriber(lambda **kwargs: calls.append('late'), precedence=1)
+        positionY.add_subscriber(lambda **kwargs: calls.append('early'), precedence=0.5)
+        Stream.trigger([positionX, positionY])
+        self.assertEqual(calls, ['early', 'late'])
+
+    def test_batch_subscriber_added_after_trigger(self):
+        subscriber1 = TestSubscriber()
+        subscriber2 = TestSubscriber()
+        positionX = PointerX(subscribers=[subscriber1])
+        positionY = PointerY()
+        Stream.trigger([positionX, positionY])
+        positionY.add_subscriber(subscriber2)
+        Stream.trigger([positionX, positionY])
+        self.assertEqual(subscriber1.call_count, 2)
+        self.assertEqual(subscriber2.call_count, 1)
+
+    def test_batch_subscriber_cleared_after_trigger(self):
+        subscriber = TestSubscriber()
+        positionX = PointerX(subscribers=[subscriber])
+        positionY = PointerY()
+        Stream.trigger([positionX, positionY])
+        positionX.clear()
+        Stream.trigger([positionX, positionY])
+        self.assertEqual(subscriber.call_count, 1)
+
+    def test_batch_equal_list_values_not_clashing(self):
+        subscriber = TestSubscriber()
+        sel1 = Selection1D(index=[1, 2], subscribers=[subscriber])
+        sel2 = Selection1D(index=[1, 2])
+        self.assertTrue(Stream._same_value(sel1.index, sel2.index))
+        self.assertFalse(Stream._same_value(sel1.index, [1, 3]))
+        Stream.trigger([sel1, sel2])
+        self.assertEqual(subscriber.kwargs, {'index': [1, 2]})
+
+    def test_batch_subscribers_cached_on_stream(self):
+        subscriber = TestSubscriber()
+        positionX = PointerX(subscribers=[subscriber])
+        positionY = PointerY()
+        Stream.trigger([positionX, positionY])
+        self.assertEqual(positionX._subscriber_cache[2], [subscriber])
+        self.assertIs(positionY._subscriber_cache, None)
+
+    def test_batch_subscriber_dataframe_values_not_compared(self):
+        if pd is None:
+            raise SkipTest('Pandas not available')
+        subscriber = TestSubscriber()
+        df = pd.DataFrame({'x': [1, 2, 3]})
+        pipe1 = Pipe(data=df, subscribers=[subscriber])
+        pipe2 = Pipe(data=df.copy())
+        Stream.trigger([pipe1, pipe2])
+        self.assertEqual(subscriber.call_count, 1)
+        self.assertIsInstance(subscriber.kwargs['data'], pd.DataFrame)
+
 
 
 class TestStreamSource(ComparisonTestCase):
@@ -775,6 +832,101 @@ class TestBufferArrayStream(ComparisonTestCase):
             buff.send([1])
 
 
+class TestBufferRingStream(ComparisonTestCase):
+
+    def test_buffer_ring_dataframe_exception(self):
+        if pd is None:
+            raise SkipTest('Pandas not available')
+        error = "Buffer only supports ring=True for NumPy array and dictionary data."
+        with self.assertRaisesRegexp(ValueError, error):
+            Buffer(pd.DataFrame({'x': [0]}), ring=True)
+
+    def test_buffer_ring_array_send(self):
+        buff = Buffer(np.array([[0, 1]]), ring=True)
+        buff.send(np.array([[1, 2]]))
+        self.assertEqual(buff.data, np.array([[0, 1], [1, 2]]))
+        self.assertEqual(buff._chunk_length, 1)
+
+    def test_buffer_ring_array_view(self):
+        buff = Buffer(np.array([[0, 1]]), length=3, ring=True)
+        buff.send(np.array([[1, 2]]))
+        self.assertIs(buff.data.base, buff._ring_storage[None])
+
+    def test_buffer_ring_array_wraps(self):
+        buff = Buffer(np.zeros((0, 2)), length=3, ring=True)
+        for i in range(10):
+            buff.send(np.array([[i, i]]))
+        self.assertEqual(buff.data, np.array([[7, 7], [8, 8], [9, 9]]))
+
+    def test_buffer_ring_array_previous_view_unchanged(self):
+        buff = Buffer(np.zeros((0, 2)), length=2, ring=True)
+        buff.send(np.array([[0, 0], [1, 1]]))
+        previous = buff.data
+        buff.send(np.array([[2, 2], [3, 3]]))
+        buff.send(np.array([[4, 4]]))
+        self.assertEqual(previous, np.array([[0, 0], [1, 1]]))
+        self.assertEqual(buff.data, np.array([[3, 3], [4, 4]]))
+
+    def test_buffer_ring_array_patch_larger_than_length(self):
+        buff = Buffer(np.array([[0, 1]]), length=1, ring=True)
+        buff.send(np.array([[1, 2], [2, 3]]))
+        self.assertEqual(buff.data, np.array([[2, 3]]))
+        self.assertEqual(buff._chunk_length, 2)
+
+    def test_buffer_ring_dict_send(self):
+        data = {'x': np.array([0]), 'y': np.array([1])}
+        buff = Buffer(data, length=2, ring=True)
+        buff.send({'x': np.array([1]), 'y': np.array([2])})
+        buff.send({'x': np.array([2]), 'y': np.array([3])})
+        self.assertEqual(buff.data, {'x': np.array([1, 2]), 'y': np.array([2, 3])})
+
+    def test_buffer_ring_dict_promotes_dtype(self):
+        data = {'x': np.array([0]), 'y': np.array([1])}
+        buff = Buffer(data, ring=True)
+        buff.send({'x': np.array([0.5]), 'y': np.array([2])})
+        self.assertEqual(buff.data, {'x': np.array([0, 0.5]), 'y': np.array([1, 2])})
+
+    def test_buffer_ring_clear(self):
+        buff = Buffer({'x': np.array([0, 1])}, ring=True)
+        buff.clear()
+        self.assertEqual(buff.data, {'x': np.array([])})
+
+
+class TestBufferChunkRanges(ComparisonTestCase):
+
+    def test_buffer_chunk_ranges_appended(self):
+        buff = Buffer({'x': np.array([0, 1]), 'y': np.array([3., 4.])}, length=5)
+        buff.send({'x': np.array([2, 3]), 'y': np.array([np.NaN, -1.])})
+        self.assertEqual(buff._chunk_ranges, {'x': ((2, 3), None), 'y': ((-1, -1), None)})
+
+    def test_buffer_chunk_ranges_evicted(self):
+        buff = Buffer({'x': np.array([0, 1, 2])}, length=3)
+        buff.send({'x': np.array([3, 4])})
+        self.assertEqual(buff._chunk_ranges, {'x': ((3, 4), (0, 1))})
+
+    def test_buffer_chunk_ranges_replaced_window(self):
+        buff = Buffer({'x': np.array([0, 1])}, length=2)
+        buff.send({'x': np.array([3, 4])})
+        self.assertIs(buff._chunk_ranges, None)
+
+    def test_buffer_chunk_ranges_skips_non_numeric(self):
+        buff = Buffer({'x': np.array([0]), 'y': np.array(['A'])}, length=3)
+        buff.send({'x': np.array([1]), 'y': np.array(['B'])})
+        self.assertEqual(buff._chunk_ranges, {'x': ((1, 1), None)})
+
+    def test_buffer_chunk_ranges_dataframe(self):
+        if pd is None:
+            raise SkipTest('Pandas not available')
+        buff = Buffer(pd.DataFrame({'y': [1., 2.]}), length=3)
+        buff.send(pd.DataFrame({'y': [0.5]}, index=[2]))
+        self.assertEqual(buff._chunk_ranges, {'index': ((2, 2), None), 'y': ((0.5, 0.5), None)})
+
+    def test_buffer_chunk_ranges_array(self):
+        buff = Buffer(np.array([[0, 1]]))
+        buff.send(np.array([[1, 2]]))
+        self.assertIs(buff._chunk_ranges, None)
+
+
 class TestBufferDictionaryStream(ComparisonTestCase):
 
     def test_init_buffer_dict(self):
@@ -4,6 +4,8 @@ Unit tests for dim transforms
 """
 from __future__ import division
 
+from unittest import SkipTest
+
 import numpy as np
 import pandas as pd
 
@@ -15,7 +17,8 @@ except:
 
 from holoviews.core.data import Dataset
 from holoviews.element.comparison import ComparisonTestCase
-from holoviews.util.transform import dim
+from holoviews.util import transform
+from holoviews.util.transform import DimPlan, dim
 
 
 class TestDimTransforms(ComparisonTestCase):
@@ -345,3 +348,122 @@ class TestDimTransforms(ComparisonTestCase):
     def test_multi_dim_expression_partial_applies(self):
         self.assertEqual((dim('int')-dim('bar')).applies(self.dataset),
                          False)
+
+
+
+class TestDimTransformsDaskCompute(ComparisonTestCase):
+    """
+    Tests that dim expressions on dask data are evaluated as a single
+    lazy graph.
+    """
+
+    def setUp(self):
+        if dd is None:
+            raise SkipTest('dask required to test lazy dim evaluation')
+        from dask.callbacks import Callback
+        df = pd.DataFrame({'x': np.arange(10.), 'y': np.arange(10.)[::-1],
+                           'c': list('ABCDEABCDE')})
+        self.df = df
+        self.dataset = Dataset(dd.from_pandas(df, npartitions=2), ['x', 'y', 'c'])
+        self.computes = 0
+        test = self
+        class ComputeCounter(Callback):
+            def _start(self, dsk):
+                test.computes += 1
+        self.counter = ComputeCounter()
+
+    def test_binary_expression_single_compute(self):
+        expr = (dim('x')*dim('y')+dim('x')).norm()
+        with self.counter:
+            values = expr.apply(self.dataset)
+        self.assertEqual(self.computes, 1)
+        xs, ys = self.df.x.values, self.df.y.values
+        expected = xs*ys+xs
+        expected = (expected-expected.min())/(expected.max()-expected.min())
+        self.assertEqual(values, expected)
+
+    def test_isin_expression_single_compute(self):
+        expr = dim('c').isin(['A', 'B']) & (dim('x') > 2)
+        with self.counter:
+            values = expr.apply(self.dataset, keep_index=True)
+        self.assertEqual(self.computes, 1)
+        self.assertIsInstance(values, pd.Series)
+        self.assertEqual(values.values, (self.df.c.isin(['A', 'B']) & (self.df.x > 2)).values)
+
+    def test_select_expression_lazy(self):
+        expr = dim('c').isin(['A', 'B']) & (dim('x') > 2)
+        with self.counter:
+            selected = self.dataset.select(selection_expr=expr)
+        self.assertEqual(self.computes, 0)
+        self.assertIsInstance(selected.data, dd.DataFrame)
+        self.assertEqual(selected.dimension_values('x'), np.array([5., 6.]))
+
+
+
+class TestDimPlan(ComparisonTestCase):
+
+    def setUp(self):
+        self.xs = np.linspace(-1, 1, 1000)
+        self.ys = np.cos(self.xs)
+        self.ints = np.arange(1000, dtype='int64')
+        self.dataset = Dataset((self.xs, self.ys, self.ints), ['x', 'y', 'i'])
+        self.chunksize = DimPlan.chunksize
+        DimPlan.chunksize = 128
+
+    def tearDown(self):
+        DimPlan.chunksize = self.chunksize
+
+    def interpret(self, expr):
+        expr = expr.clone()
+        expr.__dict__['_plan'] = None
+        return expr.apply(self.dataset)
+
+    def test_compile_arithmetic(self):
+        self.assertIsInstance((dim('x')*2+1).compile(), DimPlan)
+
+    def test_compile_unsupported_op(self):
+        self.assertIs(dim('x').bin([-1, 0, 1]).compile(), None)
+
+    def test_compile_non_numeric_argument(self):
+        self.assertIs(dim('x').isin([0, 1]).compile(), None)
+
+    def test_compile_reads_each_column_once(self):
+        plan = (dim('x')*dim('y')+dim('x')).compile()
+        self.assertEqual(len(plan._columns), 2)
+
+    def test_compile_eliminates_common_subexpressions(self):
+        expr = (dim('x')*dim('y')) + (dim('x')*dim('y'))
+        plan = expr.compile()
+        ufuncs = [n for n in plan._nodes.values() if n['kind'] == 'ufunc']
+        self.assertEqual(len(ufuncs), 2)
+
+    def test_compiled_matches_interpreter(self):
+        exprs = [(dim('x')*dim('y')+dim('x')).norm(), -dim('x')+1,
+                 abs(dim('x')-0.5)*dim('y'), np.sin(dim('x'))**2,
+                 2**dim('x'), (dim('x') > 0) & (dim('y') < 0.9),
+                 dim('i')/3, dim('i')//3 % 5, (dim('i')*1.5).lognorm()]
+        for expr in exprs:
+            compiled = expr.apply(self.dataset)
+            expected = self.interpret(expr)
+            self.assertEqual(compiled.dtype, expected.dtype)
+            np.testing.assert_allclose(compiled, expected)
+
+    def test_compiled_does_not_modify_columns(self):
+        ((-dim('x')+1)*2).apply(self.dataset)
+        self.assertEqual(self.dataset.dimension_values('x'), self.xs)
+
+    def test_compiled_norm_ranges(self):
+        expr = (dim('x')*2).norm()
+        ranges = {'x': {'combined': (-4, 4)}}
+        self.assertEqual(expr.apply(self.dataset, ranges=ranges),
+                         (self.xs*2+4)/8.)
+
+    def test_compiled_without_numexpr(self):
+        expr = (dim('x')*dim('y')+dim('x')).norm()
+        numexpr = transform.numexpr
+        transform.numexpr = None
+        try:
+            compiled = expr.apply(self.dataset)
+        finally:
+            transform.numexpr = numexpr
+        np.testing.assert_allclose(compiled, self.interpret(expr))
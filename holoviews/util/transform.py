@@ -3,6 +3,7 @@ from __future__ import division
 import operator
 import sys
 
+from collections import OrderedDict, defaultdict
 from functools import partial
 from types import BuiltinFunctionType, BuiltinMethodType, FunctionType, MethodType
 
@@ -12,6 +13,11 @@ import param
 from ..core.dimension import Dimension
 from ..core.util import basestring, resolve_dependent_value, unique_iterator
 
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
 def _maybe_map(numpy_fn):
     def fn(values, *args, **kwargs):
         series_like = hasattr(values, 'index') and not isinstance(values, list)
@@ -166,6 +172,258 @@ function_types = (
     MethodType, np.ufunc, iloc)
 
 
+
+class _NotCompilable(Exception):
+    """
+    Raised when a dim expression cannot be turned into a DimPlan.
+    """
+
+
+class DimPlan(object):
+    """
+    A DimPlan is a compiled representation of a dim expression which
+    evaluates the expression as a fused DAG rather than op by op.
+
+    Compilation flattens the (possibly nested) dim expression into a
+    graph of nodes keyed by their structure, so that common
+    subexpressions are evaluated only once and each referenced column
+    is read from the Dataset a single time. Element-wise chains are
+    evaluated using numexpr (if installed and all inputs are float64)
+    or in chunks using NumPy ufuncs, reusing temporary arrays as
+    output buffers wherever the result type permits. Normalization
+    ops act as barriers, which are evaluated on the full array before
+    the surrounding element-wise chain.
+
+    Only expressions consisting of arithmetic, comparison and bitwise
+    operators, NumPy ufuncs, norm and lognorm with numeric arguments
+    can be compiled; all other expressions are evaluated by the
+    dim.apply interpreter.
+    """
+
+    # Number of array elements evaluated at a time
+    chunksize = 2**16
+
+    _ufunc_ops = {
+        operator.add: np.add, operator.sub: np.subtract,
+        operator.mul: np.multiply, operator.truediv: np.true_divide,
+        operator.floordiv: np.floor_divide, operator.mod: np.remainder,
+        operator.pow: np.power, operator.eq: np.equal,
+        operator.ne: np.not_equal, operator.lt: np.less,
+        operator.le: np.less_equal, operator.gt: np.greater,
+        operator.ge: np.greater_equal, operator.and_: np.bitwise_and,
+        operator.or_: np.bitwise_or, operator.lshift: np.left_shift,
+        operator.rshift: np.right_shift, operator.neg: np.negative,
+        operator.inv: np.invert, abs: np.absolute}
+
+    _numexpr_operators = {
+        np.add: '+', np.subtract: '-', np.multiply: '*',
+        np.true_divide: '/', np.power: '**', np.equal: '==',
+        np.not_equal: '!=', np.less: '<', np.less_equal: '<=',
+        np.greater: '>', np.greater_equal: '>='}
+
+    _numexpr_functions = {
+        np.absolute: 'abs', np.arccos: 'arccos', np.arcsin: 'arcsin',
+        np.arctan: 'arctan', np.arctan2: 'arctan2', np.cos: 'cos',
+        np.cosh: 'cosh', np.exp: 'exp', np.expm1: 'expm1', np.log: 'log',
+        np.log10: 'log10', np.log1p: 'log1p', np.sin: 'sin',
+        np.sinh: 'sinh', np.sqrt: 'sqrt', np.tan: 'tan', np.tanh: 'tanh'}
+
+    def __init__(self, expr):
+        self._nodes = OrderedDict()
+        self._refcount = defaultdict(int)
+        self._root = self._build(expr)
+        self._columns = [(key, node['dimension']) for key, node in self._nodes.items()
+                         if node['kind'] == 'column']
+
+    def _add(self, key, node):
+        if key not in self._nodes:
+            self._nodes[key] = node
+        return key
+
+    def _operand(self, arg):
+        if isinstance(arg, dim):
+            key = self._build(arg)
+        elif isinstance(arg, (bool, int, float, np.number)):
+            key = ('const', type(arg).__name__, arg)
+            self._add(key, {'kind': 'const', 'value': arg})
+        else:
+            raise _NotCompilable
+        self._refcount[key] += 1
+        return key
+
+    def _build(self, expr):
+        dimension = expr.dimension
+        key = ('column', dimension.spec)
+        self._add(key, {'kind': 'column', 'dimension': dimension})
+        for op in expr.ops:
+            fn, args, kwargs = op['fn'], op['args'], op['kwargs']
+            self._refcount[key] += 1
+            if fn in (norm, lognorm):
+                if args or not all(isinstance(v, (int, float, np.number))
+                                   for v in kwargs.values()):
+                    raise _NotCompilable
+                kwargs = tuple(sorted(kwargs.items()))
+                key = self._add(('norm', fn, dimension.name, key, kwargs),
+                                {'kind': 'norm', 'fn': fn, 'operands': [key],
+                                 'dimension': dimension, 'kwargs': dict(kwargs)})
+                continue
+            ufunc = self._ufunc_ops.get(fn, fn if isinstance(fn, np.ufunc) else None)
+            if (ufunc is None or kwargs or ufunc.nout != 1 or
+                len(args) != ufunc.nin-1):
+                raise _NotCompilable
+            operands = [key] + [self._operand(arg) for arg in args]
+            if op['reverse']:
+                operands = operands[::-1]
+            key = self._add(('ufunc', ufunc, tuple(operands)),
+                            {'kind': 'ufunc', 'fn': ufunc, 'operands': operands})
+        return key
+
+    def __call__(self, dataset, flat=False, expanded=True, ranges={},
+                 keep_index=False, compute=True, strict=False):
+        """
+        Evaluates the plan on the supplied dataset, returning None if
+        the columns are not NumPy arrays and the expression therefore
+        has to be evaluated by the interpreter.
+        """
+        inputs = {}
+        for key, dimension in self._columns:
+            lookup = dimension if strict else dimension.name
+            values = dataset.interface.values(
+                dataset, lookup, expanded=expanded, flat=flat,
+                compute=compute, keep_index=keep_index)
+            if type(values) is not np.ndarray:
+                return None
+            inputs[key] = values
+        return self._evaluate(self._root, inputs, ranges)
+
+    def _dependencies(self, key, inputs, found=None):
+        """
+        Returns the input and barrier nodes the element-wise subtree
+        starting at the supplied key depends on.
+        """
+        found = OrderedDict() if found is None else found
+        node = self._nodes[key]
+        if key in inputs or node['kind'] == 'norm':
+            found[key] = node
+        elif node['kind'] == 'ufunc':
+            for operand in node['operands']:
+                self._dependencies(operand, inputs, found)
+        return found
+
+    def _evaluate(self, key, inputs, ranges):
+        if key in inputs:
+            return inputs[key]
+        node = self._nodes[key]
+        if node['kind'] == 'norm':
+            values = self._evaluate(node['operands'][0], inputs, ranges)
+            inputs[key] = self._normalize(node, values, ranges)
+            return inputs[key]
+
+        arrays = {}
+        for dep in self._dependencies(key, inputs):
+            arrays[dep] = self._evaluate(dep, inputs, ranges)
+
+        shapes = {v.shape for v in arrays.values()}
+        if len(shapes) != 1:
+            return self._evaluate_chunk(key, arrays, {})[0]
+        (shape,) = shapes
+        size = int(np.prod(shape))
+        if size <= self.chunksize or not all(v.flags.c_contiguous for v in arrays.values()):
+            return self._evaluate_chunk(key, arrays, {})[0]
+
+        result = self._evaluate_numexpr(key, arrays)
+        if result is not None:
+            return result
+
+        flat_arrays = {k: v.reshape(-1) for k, v in arrays.items()}
+        out = None
+        for start in range(0, size, self.chunksize):
+            chunk = {k: v[start:start+self.chunksize] for k, v in flat_arrays.items()}
+            values = self._evaluate_chunk(key, chunk, {})[0]
+            if out is None:
+                out = np.empty(size, dtype=values.dtype)
+            out[start:start+len(values)] = values
+        return out.reshape(shape)
+
+    def _normalize(self, node, values, ranges):
+        fn, kwargs = node['fn'], node['kwargs']
+        drange = ranges.get(node['dimension'].name, {})
+        drange = drange.get('combined', drange)
+        if drange != {} and not ('min' in kwargs and 'max' in kwargs):
+            return fn(values, *drange)
+        return fn(values, **kwargs)
+
+    def _evaluate_chunk(self, key, arrays, memo):
+        """
+        Evaluates an element-wise subtree returning the result and
+        whether it is a temporary which may be overwritten.
+        """
+        if key in arrays:
+            return arrays[key], False
+        elif key in memo:
+            return memo[key], False
+        node = self._nodes[key]
+        if node['kind'] == 'const':
+            return node['value'], False
+        ufunc = node['fn']
+        operands = [self._evaluate_chunk(k, arrays, memo) for k in node['operands']]
+        values = [v for v, _ in operands]
+        out = None
+        for v, temporary in operands:
+            if temporary and self._inplace(ufunc, v, values):
+                out = v
+                break
+        result = ufunc(*values) if out is None else ufunc(*values, out=out)
+        if self._refcount[key] > 1:
+            memo[key] = result
+            return result, False
+        return result, True
+
+    @classmethod
+    def _inplace(cls, ufunc, array, values):
+        """
+        Whether the ufunc result may be written into the array without
+        changing the dtype or shape of the result.
+        """
+        if not isinstance(array, np.ndarray) or array.dtype.kind not in 'biufc':
+            return False
+        char = array.dtype.char
+        if '%s->%s' % (char*ufunc.nin, char) not in ufunc.types:
+            return False
+        return (np.result_type(*values) == array.dtype and
+                np.broadcast(*values).shape == array.shape)
+
+    def _evaluate_numexpr(self, key, arrays):
+        if numexpr is None or any(v.dtype != np.float64 for v in arrays.values()):
+            return None
+        local_dict = {}
+        try:
+            expression = self._numexpr_expression(key, arrays, local_dict)
+        except _NotCompilable:
+            return None
+        try:
+            return numexpr.evaluate(expression, local_dict=local_dict)
+        except Exception:
+            return None
+
+    def _numexpr_expression(self, key, arrays, local_dict):
+        node = self._nodes[key]
+        if key in arrays or node['kind'] == 'const':
+            name = 'v%d' % list(self._nodes).index(key)
+            local_dict[name] = arrays[key] if key in arrays else node['value']
+            return name
+        ufunc = node['fn']
+        operands = [self._numexpr_expression(k, arrays, local_dict)
+                    for k in node['operands']]
+        if ufunc is np.negative:
+            return '(-%s)' % operands[0]
+        elif ufunc in self._numexpr_operators and len(operands) == 2:
+            return '(%s %s %s)' % (operands[0], self._numexpr_operators[ufunc], operands[1])
+        elif ufunc in self._numexpr_functions:
+            return '%s(%s)' % (self._numexpr_functions[ufunc], ', '.join(operands))
+        raise _NotCompilable
+
+
 class dim(object):
     """
     dim transform objects are a way to express deferred transforms on
@@ -206,6 +464,9 @@ class dim(object):
 
     _unary_funcs = {operator.pos: '+', operator.neg: '-', operator.not_: '~'}
 
+    # Functions lowered onto methods of native (e.g. dask or cuDF) columns
+    _native_methods = {isin: 'isin', astype: 'astype', round_: 'round'}
+
     _all_funcs = [_binary_funcs, _builtin_funcs, _custom_funcs,
                   _numpy_funcs, _unary_funcs]
 
@@ -434,6 +695,33 @@ class dim(object):
 
     # Other methods
 
+    def compile(self):
+        """
+        Compiles the expression into a DimPlan, which evaluates it as a
+        fused expression graph. Returns None if the expression cannot
+        be compiled.
+        """
+        if '_plan' not in self.__dict__:
+            try:
+                self.__dict__['_plan'] = DimPlan(self)
+            except _NotCompilable:
+                self.__dict__['_plan'] = None
+        return self.__dict__['_plan']
+
+    @property
+    def _lazy(self):
+        """
+        Whether the expression can be evaluated lazily on native
+        columns, i.e. does not use positional indexing.
+        """
+        for op in self.ops:
+            if isinstance(op['fn'], iloc):
+                return False
+            args = list(op['args'])+list(op['kwargs'].values())
+            if any(isinstance(arg, dim) and not arg._lazy for arg in args):
+                return False
+        return True
+
     def applies(self, dataset):
         """
         Determines whether the dim transform can be applied to the
@@ -487,11 +775,24 @@ class dim(object):
             expanded = not ((dataset.interface.gridded and dimension in dataset.kdims) or
                             (dataset.interface.multi and dataset.interface.isunique(dataset, dimension, True)))
 
+        if dataset.interface.native_dim_ops and compute and self._lazy:
+            # Evaluate the whole expression lazily and compute it once
+            data = self.apply(dataset, flat, expanded, ranges, all_values,
+                              keep_index, compute=False, strict=strict)
+            return dataset.interface.materialize(data, keep_index)
+
         if isinstance(dataset, Graph):
             if dimension in dataset.kdims and all_values:
                 dimension = dataset.nodes.kdims[2]
             dataset = dataset if dimension in dataset else dataset.nodes
 
+        native = dataset.interface.native_dim_ops
+        plan = self.compile() if self.ops and not (native or isinstance(dataset, Graph)) else None
+        if plan is not None:
+            data = plan(dataset, flat, expanded, ranges, keep_index, compute, strict)
+            if data is not None:
+                return data
+
         lookup = dimension if strict else dimension.name
         data = dataset.interface.values(
             dataset,
@@ -506,10 +807,13 @@ class dim(object):
             fn = o['fn']
             kwargs = dict(o['kwargs'])
             fn_name = self._numpy_funcs.get(fn)
+            native_method = self._native_methods.get(fn) if native else None
             if fn_name and hasattr(data, fn_name):
                 if 'axis' not in kwargs and not isinstance(fn, np.ufunc):
                     kwargs['axis'] = None
                 fn = fn_name
+            elif native_method and hasattr(data, native_method):
+                fn = native_method
             fn_args = [] if isinstance(fn, basestring) else [data]
             for arg in args:
                 if isinstance(arg, dim):